@@ -0,0 +1,74 @@
+"""
+convert_arrow() compared to slicing each row of an Arrow-style column, converting it with convert_bytes() and building the output buffers.
+"""
+
+import random
+from array import array
+from typing import List, Tuple
+
+from common import NUMBER_PHRASES, PROSE_WORDS, best_of, format_bytes, print_table
+
+from text2digits import Text2Digits
+from text2digits.vocabulary import candidate_pattern_bytes
+
+ROW_COUNTS = [100_000, 1_000_000]
+
+
+def make_column(n_rows: int, number_fraction: float, seed: int = 0) -> Tuple[bytes, "array[int]"]:
+    """
+    Generates a column of short rows where the given fraction of rows contains a number phrase.
+    """
+    # Prose words like "gone" contain number words, which would make every row a candidate
+    words = [word for word in PROSE_WORDS if not candidate_pattern_bytes().search(word.encode("ascii"))]
+    rng = random.Random(seed)
+    rows: List[bytes] = []
+    for _ in range(n_rows):
+        row = rng.choices(words, k=rng.randint(2, 6))
+        if rng.random() < number_fraction:
+            row.insert(rng.randrange(len(row) + 1), rng.choice(NUMBER_PHRASES))
+        rows.append(" ".join(row).encode("ascii"))
+
+    offsets = array("i", [0])
+    for row in rows:
+        offsets.append(offsets[-1] + len(row))
+
+    return b"".join(rows), offsets
+
+
+def convert_rows(t2d: Text2Digits, data: bytes, offsets: "array[int]") -> Tuple[bytearray, "array[int]"]:
+    out = bytearray()
+    out_offsets = array(offsets.typecode, [0])
+    for i in range(len(offsets) - 1):
+        out += t2d.convert_bytes(data[offsets[i] : offsets[i + 1]])
+        out_offsets.append(len(out))
+
+    return out, out_offsets
+
+
+def main(quick: bool = False) -> None:
+    t2d = Text2Digits()
+    rows = []
+
+    for n_rows in ROW_COUNTS[:1] if quick else ROW_COUNTS:
+        for fraction in (0.01, 0.1, 0.5):
+            data, offsets = make_column(n_rows, fraction)
+            assert t2d.convert_arrow(data, offsets) == convert_rows(t2d, data, offsets)
+
+            seconds_rows = best_of(lambda data=data, offsets=offsets: convert_rows(t2d, data, offsets), repeat=2)
+            seconds_arrow = best_of(lambda data=data, offsets=offsets: t2d.convert_arrow(data, offsets), repeat=2)
+            rows.append(
+                [
+                    f"{n_rows:,}",
+                    format_bytes(len(data)),
+                    f"{fraction:.2f}",
+                    f"{seconds_rows:.3f} s",
+                    f"{seconds_arrow:.3f} s",
+                    f"{seconds_rows / seconds_arrow:.2f}x",
+                ]
+            )
+
+    print_table(["rows", "data", "number rows", "per row", "convert_arrow", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
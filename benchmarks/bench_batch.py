@@ -0,0 +1,116 @@
+"""
+Batches of texts: convert() per text compared to convert_batch().
+
+- With spelling correction, convert_batch() corrects the unique words of the batch at once (with and without NumPy).
+- Without spelling correction, convert_batch() searches the joined short texts for number words once and only converts the texts with a match.
+"""
+
+import random
+from typing import List
+
+from common import NUMBER_PHRASES, PROSE_WORDS, best_of, print_table
+
+import text2digits.text_processing_helpers as helpers
+from text2digits import Text2Digits
+from text2digits.vocabulary import similar_number_word
+
+BATCH_SIZES = [1_000, 10_000]
+THRESHOLD = 0.8
+
+SHORT_BATCH_SIZES = [10_000, 100_000]
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word) + 1)
+    return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i:]
+
+
+def make_batch(n_texts: int, seed: int = 0) -> List[str]:
+    """
+    Generates short texts where every third word is misspelled, so that the batch contains many unique words.
+    """
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n_texts):
+        words = rng.choices(PROSE_WORDS, k=8) + rng.choice(NUMBER_PHRASES).split()
+        texts.append(" ".join(misspell(word, rng) if rng.random() < 1 / 3 else word for word in words))
+
+    return texts
+
+
+def make_short_batch(n_texts: int, seed: int = 0) -> List[str]:
+    """
+    Generates texts of 10-50 characters, half of which contain a number.
+    """
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(n_texts):
+        words = rng.choices(PROSE_WORDS, k=rng.randint(2, 5))
+        if rng.random() < 0.5:
+            words.insert(rng.randrange(len(words) + 1), rng.choice(NUMBER_PHRASES))
+        texts.append(" ".join(words)[:50])
+
+    return texts
+
+
+def convert_each(t2d: Text2Digits, texts: List[str]) -> List[str]:
+    similar_number_word.cache_clear()
+    return [t2d.convert(text) for text in texts]
+
+
+def convert_batch_without_numpy(t2d: Text2Digits, texts: List[str]) -> List[str]:
+    numpy = helpers.numpy
+    helpers.numpy = None
+    try:
+        return t2d.convert_batch(texts)
+    finally:
+        helpers.numpy = numpy
+
+
+def main(quick: bool = False) -> None:
+    t2d = Text2Digits(similarity_threshold=THRESHOLD)
+    rows = []
+
+    for n_texts in BATCH_SIZES[:1] if quick else BATCH_SIZES:
+        texts = make_batch(n_texts)
+        assert t2d.convert_batch(texts) == convert_each(t2d, texts)
+
+        seconds_each = best_of(lambda texts=texts: convert_each(t2d, texts), repeat=2)
+        seconds_python = best_of(lambda texts=texts: convert_batch_without_numpy(t2d, texts), repeat=2)
+        row = [f"{n_texts:,}", f"{seconds_each:.3f} s", f"{seconds_python:.3f} s"]
+        if helpers.numpy is not None:
+            seconds_numpy = best_of(lambda texts=texts: t2d.convert_batch(texts), repeat=2)
+            row.append(f"{seconds_numpy:.3f} s")
+        else:
+            row.append("n/a")
+        rows.append(row)
+
+    print_table(["texts", "convert() each", "convert_batch (Python)", "convert_batch (NumPy)"], rows)
+
+    print()
+    t2d = Text2Digits()
+    rows = []
+    for n_texts in SHORT_BATCH_SIZES[:1] if quick else SHORT_BATCH_SIZES:
+        texts = make_short_batch(n_texts)
+        assert t2d.convert_batch(texts) == [t2d.convert(text) for text in texts]
+
+        seconds_each = best_of(lambda texts=texts: [t2d.convert(text) for text in texts], repeat=3)
+        seconds_batch = best_of(lambda texts=texts: t2d.convert_batch(texts), repeat=3)
+        rows.append(
+            [
+                f"{n_texts:,}",
+                f"{sum(map(len, texts)) / n_texts:.1f}",
+                f"{seconds_each:.3f} s",
+                f"{seconds_batch:.3f} s",
+                f"{n_texts / seconds_each:,.0f}",
+                f"{n_texts / seconds_batch:,.0f}",
+            ]
+        )
+
+    print_table(
+        ["short texts", "mean length", "convert() each", "convert_batch", "texts/s each", "texts/s batch"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+convert_bytes() compared to decoding the data, calling convert() and encoding the result again.
+"""
+
+from common import best_of, format_bytes, make_document, print_table
+
+from text2digits import Text2Digits
+
+SIZES = [100_000, 1_000_000]
+
+
+def main(quick: bool = False) -> None:
+    t2d = Text2Digits()
+    rows = []
+
+    for size in SIZES[:1] if quick else SIZES:
+        for density in (0.01, 0.1):
+            data = make_document(size, number_density=density).encode("utf-8")
+            assert t2d.convert_bytes(data) == t2d.convert(data.decode("utf-8")).encode("utf-8")
+
+            seconds_str = best_of(lambda data=data: t2d.convert(data.decode("utf-8")).encode("utf-8"), repeat=2)
+            seconds_bytes = best_of(lambda data=data: t2d.convert_bytes(data), repeat=2)
+            rows.append(
+                [
+                    format_bytes(len(data)),
+                    f"{density:.2f}",
+                    f"{seconds_str:.3f} s",
+                    f"{seconds_bytes:.3f} s",
+                    f"{seconds_str / seconds_bytes:.2f}x",
+                ]
+            )
+
+    print_table(["input", "density", "decode+convert", "convert_bytes", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Batch conversion of short texts without the disk cache, with an empty (cold) cache and with a filled (warm) cache, e.g. when a corpus is processed again.
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+from common import format_bytes, make_document, print_table
+
+from text2digits import DiskCache, Text2Digits
+
+SIZE = 2_000_000
+TEXT_LENGTHS = [50, 200, 1000]
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(quick: bool = False) -> None:
+    document = make_document(SIZE // 10 if quick else SIZE)
+    uncached = Text2Digits()
+    rows = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for length in TEXT_LENGTHS:
+            texts = [document[start : start + length] for start in range(0, len(document), length)]
+            cache = DiskCache(Path(directory) / f"cache-{length}.sqlite")
+            cached = Text2Digits(disk_cache=cache)
+
+            seconds_uncached = timed(lambda: uncached.convert_batch(texts))  # noqa: B023
+            seconds_cold = timed(lambda: cached.convert_batch(texts))  # noqa: B023
+            seconds_warm = timed(lambda: cached.convert_batch(texts))  # noqa: B023
+            assert cached.convert_batch(texts) == uncached.convert_batch(texts)
+
+            rows.append(
+                [
+                    f"{len(texts):,}",
+                    str(length),
+                    f"{seconds_uncached:.3f} s",
+                    f"{seconds_cold:.3f} s",
+                    f"{seconds_warm:.3f} s",
+                    f"{seconds_uncached / seconds_warm:.1f}x",
+                    format_bytes(cache.size()),
+                ]
+            )
+            cache.close()
+
+    print_table(["texts", "length", "uncached", "cold cache", "warm cache", "speedup", "cache size"], rows)
+
+
+if __name__ == "__main__":
+    main()
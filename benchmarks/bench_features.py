@@ -0,0 +1,37 @@
+"""
+Cost of each optional feature, measured by converting a number-dense document with all features enabled and with one (or all) of them disabled.
+"""
+
+from common import best_of, format_bytes, make_document, print_table
+
+from text2digits import Text2Digits
+
+SIZE = 2_000_000
+
+FEATURES = {
+    "ordinals": {"convert_ordinals": False},
+    "negation": {"negation": False},
+    "decimal words": {"decimal_words": False},
+    "concatenation": {"concatenate": False},
+    "conjunctions": {"conjunctions": False},
+}
+
+
+def main(quick: bool = False) -> None:
+    text = make_document(SIZE // 10 if quick else SIZE, number_density=0.3)
+    # Without the phrase cache, every number run is processed by the rules
+    seconds_all = best_of(lambda: Text2Digits(phrase_cache_size=0).convert(text), repeat=3)
+    rows = [["all enabled", format_bytes(len(text)), f"{seconds_all:.3f} s", "1.00x"]]
+
+    all_disabled = {key: value for kwargs in FEATURES.values() for key, value in kwargs.items()}
+    for name, kwargs in [*FEATURES.items(), ("all disabled", all_disabled)]:
+        t2d = Text2Digits(phrase_cache_size=0, **kwargs)
+        seconds = best_of(lambda t2d=t2d: t2d.convert(text), repeat=3)
+        label = name if name == "all disabled" else f"without {name}"
+        rows.append([label, format_bytes(len(text)), f"{seconds:.3f} s", f"{seconds / seconds_all:.2f}x"])
+
+    print_table(["pipeline", "input", "time", "relative"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Spelling correction (similarity_threshold < 1) compared to exact matching, with a cold and a warm correction cache.
+"""
+
+from common import best_of, format_bytes, make_document, print_table
+
+from text2digits import Text2Digits
+from text2digits.vocabulary import similar_number_word
+
+SIZES = [100_000, 1_000_000]
+THRESHOLD = 0.8
+
+
+def convert_cold(t2d: Text2Digits, text: str) -> str:
+    similar_number_word.cache_clear()
+    return t2d.convert(text)
+
+
+def main(quick: bool = False) -> None:
+    exact = Text2Digits()
+    fuzzy = Text2Digits(similarity_threshold=THRESHOLD)
+    rows = []
+
+    for size in SIZES[:1] if quick else SIZES:
+        text = make_document(size, number_density=0.1)
+
+        seconds_exact = best_of(lambda text=text: exact.convert(text), repeat=2)
+        seconds_cold = best_of(lambda text=text: convert_cold(fuzzy, text), repeat=2)
+        seconds_warm = best_of(lambda text=text: fuzzy.convert(text), repeat=2)
+        rows.append(
+            [
+                format_bytes(len(text)),
+                f"{seconds_exact:.3f} s",
+                f"{seconds_cold:.3f} s",
+                f"{seconds_warm:.3f} s",
+                f"{seconds_warm / seconds_exact:.2f}x",
+            ]
+        )
+
+    print_table(["input", "exact", "fuzzy (cold cache)", "fuzzy (warm cache)", "fuzzy / exact"], rows)
+
+
+if __name__ == "__main__":
+    main()
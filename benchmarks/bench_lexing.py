@@ -0,0 +1,53 @@
+"""
+Time and memory of the tokenization of a document with one million words, and the time of splitting it into words with split_glues() compared to scan(), which also sorts the words into kinds in the same regex pass.
+"""
+
+import tracemalloc
+
+from common import best_of, format_bytes, make_document, print_table
+
+from text2digits import Text2Digits
+from text2digits.text_processing_helpers import split_glues
+from text2digits.vocabulary import scan
+
+N_WORDS = 1_000_000
+
+
+def main(quick: bool = False) -> None:
+    n_words = N_WORDS // 10 if quick else N_WORDS
+    # The average word of the generated documents (including its glue) has about 5.6 characters
+    text = make_document(int(n_words * 5.6), number_density=0.1)
+    t2d = Text2Digits()
+    t2d._lex(text)  # Warm up the caches
+
+    seconds = best_of(lambda: t2d._lex(text), repeat=3)
+    seconds_split = best_of(lambda: list(split_glues(text)), repeat=3)
+    seconds_scan = best_of(lambda: list(scan(text)), repeat=3)
+
+    tracemalloc.start()
+    try:
+        tokens = t2d._lex(text)
+        retained, peak = tracemalloc.get_traced_memory()
+        n_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        tracemalloc.stop()
+
+    print_table(
+        ["tokens", "time", "retained", "per token", "blocks per token", "peak", "split_glues", "scan"],
+        [
+            [
+                str(len(tokens)),
+                f"{seconds:.3f} s",
+                format_bytes(retained),
+                f"{retained / len(tokens):.1f} B",
+                f"{n_blocks / len(tokens):.2f}",
+                format_bytes(peak),
+                f"{seconds_split:.3f} s",
+                f"{seconds_scan:.3f} s",
+            ]
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
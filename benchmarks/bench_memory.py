@@ -0,0 +1,148 @@
+"""
+Peak and retained memory (traced with tracemalloc) of the pipeline stages: tokenization, each rule pass over the number runs and the rendering of the runs, across document sizes and number densities. A leak check converts many distinct documents with an instance whose caches are turned on and reports the memory which is still allocated after each round.
+"""
+
+import gc
+import random
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from common import format_bytes, make_document, print_table
+
+from text2digits import Text2Digits
+from text2digits.tokens_basic import WordType, word_class
+
+SIZES = [100_000, 1_000_000]
+DENSITIES = [0.1, 0.5, 1.0]
+
+LEAK_ROUNDS = 12
+LEAK_DOCUMENTS = 200
+
+UNITS = "one two three four five six seven eight nine".split()
+TENS = "twenty thirty forty fifty sixty seventy eighty ninety".split()
+
+
+def traced(func: Callable[[], Any]) -> Tuple[Any, int, int]:
+    """
+    Executes *func* while tracing allocations.
+
+    :return: The result of *func*, the peak number of bytes allocated during the call and the number of bytes which are still allocated afterwards (i.e. the result and everything it references).
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, peak, retained
+
+
+def number_runs(tokens) -> List[list]:
+    runs = []
+    run: list = []
+    for token in tokens:
+        if token.type == WordType.OTHER:
+            if run:
+                runs.append(run)
+                run = []
+        else:
+            run.append(token)
+    if run:
+        runs.append(run)
+
+    return runs
+
+
+def stage_rows(t2d: Text2Digits, text: str) -> List[List[str]]:
+    tokens, peak, retained = traced(lambda: t2d._lex(text))
+    stages = [("lex", peak, retained)]
+
+    runs = number_runs(tokens)
+    for rule in t2d._rules:
+        runs, peak, retained = traced(lambda: [t2d._apply_rule(rule, run) for run in runs])  # noqa: B023
+        stages.append((type(rule).__name__, peak, retained))
+
+    _, peak, retained = traced(lambda: [t2d._tokens_to_string(run) for run in runs])
+    stages.append(("render", peak, retained))
+
+    _, peak, retained = traced(lambda: Text2Digits(phrase_cache_size=0).convert(text))
+    stages.append(("convert", peak, retained))
+
+    return [
+        [
+            format_bytes(len(text)),
+            f"{len(tokens):,}",
+            stage,
+            format_bytes(peak),
+            format_bytes(retained),
+            f"{peak / len(tokens):.1f}",
+        ]
+        for stage, peak, retained in stages
+    ]
+
+
+def random_document(rng: random.Random, n_words: int) -> str:
+    """
+    A document with random (mostly distinct) number runs and random other words, so that all caches fill up.
+    """
+    words = []
+    for _ in range(n_words):
+        if rng.random() < 0.3:
+            words.append(f"{rng.choice(TENS)} {rng.choice(UNITS)} hundred {rng.choice(TENS)}-{rng.choice(UNITS)}")
+        else:
+            words.append("".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(2, 8))))
+
+    return " ".join(words)
+
+
+def leak_rows(rounds: int) -> List[List[str]]:
+    rng = random.Random(0)
+    t2d = Text2Digits()
+
+    rows = []
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        for index in range(rounds):
+            tracemalloc.reset_peak()
+            for _ in range(LEAK_DOCUMENTS):
+                t2d.convert(random_document(rng, 100))
+            gc.collect()
+            retained, peak = tracemalloc.get_traced_memory()
+            rows.append(
+                [
+                    str(index + 1),
+                    f"{(index + 1) * LEAK_DOCUMENTS:,}",
+                    f"{len(t2d._phrase_cache or ()):,}",
+                    f"{word_class.cache_info().currsize:,}",
+                    format_bytes(retained - baseline),
+                    format_bytes(peak - baseline),
+                ]
+            )
+    finally:
+        tracemalloc.stop()
+
+    return rows
+
+
+def main(quick: bool = False) -> None:
+    t2d = Text2Digits()
+    rows = []
+    for size in SIZES:
+        for density in DENSITIES:
+            rows.extend(stage_rows(t2d, make_document(size // 10 if quick else size, number_density=density)))
+    print_table(["input", "tokens", "stage", "peak", "retained", "peak bytes/token"], rows)
+
+    print()
+    print("Leak check (the retained memory must level off once the caches are full)")
+    print_table(
+        ["round", "documents", "phrase cache entries", "word classes", "retained", "peak"],
+        leak_rows(3 if quick else LEAK_ROUNDS),
+    )
+
+
+if __name__ == "__main__":
+    main()
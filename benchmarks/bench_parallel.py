@@ -0,0 +1,36 @@
+"""
+convert() of a single large document with one and multiple worker processes.
+"""
+
+import os
+
+from common import best_of, format_bytes, make_document, print_table
+
+from text2digits import Text2Digits
+
+SIZES = [4_000_000, 16_000_000]
+
+
+def main(quick: bool = False) -> None:
+    t2d = Text2Digits()
+    worker_counts = [n for n in (2, 4, 8) if n <= (os.cpu_count() or 1)] or [2]
+    rows = []
+
+    for size in SIZES[:1] if quick else SIZES:
+        text = make_document(size, number_density=0.1)
+        expected = t2d.convert(text)
+        seconds_sequential = best_of(lambda text=text: t2d.convert(text), repeat=1)
+        rows.append([format_bytes(len(text)), "1", f"{seconds_sequential:.3f} s", "1.00x"])
+
+        for workers in worker_counts:
+            assert t2d.convert(text, workers=workers) == expected
+            seconds = best_of(lambda text=text, workers=workers: t2d.convert(text, workers=workers), repeat=1)
+            rows.append(
+                [format_bytes(len(text)), str(workers), f"{seconds:.3f} s", f"{seconds_sequential / seconds:.2f}x"]
+            )
+
+    print_table(["input", "workers", "time", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
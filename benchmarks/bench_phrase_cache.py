@@ -0,0 +1,41 @@
+"""
+Conversion with and without the phrase cache (replacements of repeated number runs) on documents with different number densities.
+"""
+
+from common import best_of, format_bytes, make_document, print_table
+
+from text2digits import MetricsRegistry, Text2Digits
+
+SIZES = [1_000_000, 4_000_000]
+DENSITIES = [0.01, 0.1, 0.3]
+
+
+def main(quick: bool = False) -> None:
+    uncached = Text2Digits(phrase_cache_size=0)
+    rows = []
+
+    for size in SIZES[:1] if quick else SIZES:
+        for density in DENSITIES:
+            text = make_document(size, number_density=density)
+            metrics = MetricsRegistry()
+            cached = Text2Digits(metrics=metrics)
+            assert cached.convert(text) == uncached.convert(text)
+
+            seconds_uncached = best_of(lambda text=text: uncached.convert(text), repeat=2)
+            seconds_cached = best_of(lambda text=text, cached=cached: cached.convert(text), repeat=2)
+            rows.append(
+                [
+                    format_bytes(len(text)),
+                    f"{density:.2f}",
+                    f"{seconds_uncached:.3f} s",
+                    f"{seconds_cached:.3f} s",
+                    f"{seconds_uncached / seconds_cached:.2f}x",
+                    f"{metrics.snapshot()['caches']['phrase']['hit_rate']:.1%}",
+                ]
+            )
+
+    print_table(["input", "density", "uncached", "cached", "speedup", "hit rate"], rows)
+
+
+if __name__ == "__main__":
+    main()
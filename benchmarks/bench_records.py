@@ -0,0 +1,91 @@
+"""
+Records per second of RecordConverter on CSV and JSON Lines exports: one convert() call per field value compared to batches of records (where repeated values are converted once), in the current process and with worker processes. A quarter of the values repeat (e.g. canned replies).
+"""
+
+import csv
+import io
+import json
+import random
+import time
+from typing import List
+
+from common import NUMBER_PHRASES, PROSE_WORDS, print_table
+
+from text2digits import Text2Digits
+from text2digits.records import RecordConverter
+
+N_RECORDS = [20_000, 200_000]
+WORKERS = [0, 2]
+
+
+def make_values(n_records: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    canned = [" ".join(rng.choices(PROSE_WORDS, k=6) + [rng.choice(NUMBER_PHRASES)]) for _ in range(20)]
+    values = []
+    for _ in range(n_records):
+        if rng.random() < 0.25:
+            values.append(rng.choice(canned))
+        else:
+            words = rng.choices(PROSE_WORDS, k=rng.randint(4, 16))
+            if rng.random() < 0.5:
+                words.insert(rng.randrange(len(words) + 1), rng.choice(NUMBER_PHRASES))
+            values.append(" ".join(words))
+
+    return values
+
+
+def make_csv(values: List[str]) -> str:
+    output = io.StringIO(newline="")
+    writer = csv.writer(output)
+    writer.writerow(["id", "subject", "body"])
+    writer.writerows([i, f"ticket {i}", value] for i, value in enumerate(values))
+    return output.getvalue()
+
+
+def make_jsonl(values: List[str]) -> str:
+    return "".join(
+        json.dumps({"id": i, "message": {"body": value, "tags": ["one"]}}) + "\n" for i, value in enumerate(values)
+    )
+
+
+def per_value(t2d: Text2Digits, source: str) -> str:
+    output = io.StringIO(newline="")
+    writer = csv.writer(output)
+    for row in csv.reader(io.StringIO(source, newline="")):
+        row[2] = t2d.convert(row[2])
+        writer.writerow(row)
+    return output.getvalue()
+
+
+def main(quick: bool = False) -> None:
+    t2d = Text2Digits()
+    rows = []
+    for n_records in N_RECORDS[:1] if quick else N_RECORDS:
+        values = make_values(n_records)
+        for name, source, fields in [
+            ("CSV", make_csv(values), ["body"]),
+            ("JSON Lines", make_jsonl(values), ["message.body"]),
+        ]:
+            row = [name, str(n_records)]
+            if name == "CSV":
+                start = time.perf_counter()
+                expected = per_value(t2d, source)
+                row.append(f"{n_records / (time.perf_counter() - start):,.0f}")
+            else:
+                row.append("")
+
+            for workers in WORKERS:
+                with RecordConverter(t2d, workers=workers) as converter:
+                    output = io.StringIO(newline="")
+                    convert = converter.convert_csv if name == "CSV" else converter.convert_jsonl
+                    stats = convert(io.StringIO(source, newline=""), output, fields)
+                if name == "CSV":
+                    assert output.getvalue() == expected
+                row.append(f"{stats.records_per_second:,.0f}")
+            rows.append(row)
+
+    print_table(["format", "records", "convert() per value", "batches", *(f"{n} workers" for n in WORKERS[1:])], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Time and peak memory of convert() for documents up to 10 MB.
+
+The output is assembled from slices of the input and the replacement strings. Hence, the peak memory should stay at a
+small multiple of the input size (the token list dominates) and the time should grow linearly with the input size.
+"""
+
+from common import best_of, format_bytes, make_document, peak_memory, print_table
+
+from text2digits import Text2Digits
+
+SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def main(quick: bool = False) -> None:
+    t2d = Text2Digits()
+    rows = []
+
+    for size in SIZES[:-1] if quick else SIZES:
+        for density in (0.01, 0.1):
+            text = make_document(size, number_density=density)
+            seconds = best_of(lambda text=text: t2d.convert(text), repeat=1 if size >= 1_000_000 else 3)
+            _, peak = peak_memory(lambda text=text: t2d.convert(text))
+            rows.append(
+                [
+                    format_bytes(len(text)),
+                    f"{density:.2f}",
+                    f"{seconds:.3f} s",
+                    f"{len(text) / seconds / 1e6:.2f} MB/s",
+                    format_bytes(peak),
+                    f"{peak / len(text):.1f}x",
+                ]
+            )
+
+    print_table(["input", "density", "time", "throughput", "peak memory", "peak/input"], rows)
+
+
+if __name__ == "__main__":
+    main()
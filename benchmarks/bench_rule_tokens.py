@@ -0,0 +1,72 @@
+"""
+Time and memory of applying the rules to the number runs of a number-dense document (the rule tokens which replace the runs are kept alive to measure their size).
+"""
+
+import tracemalloc
+
+from common import best_of, make_document, print_table
+
+from text2digits import Text2Digits
+from text2digits.tokens_basic import WordType
+
+SIZE = 1_000_000
+
+
+def number_runs(t2d: Text2Digits, text: str):
+    runs = []
+    run = []
+    for token in t2d._lex(text):
+        if token.type == WordType.OTHER:
+            if run:
+                runs.append(run)
+                run = []
+        else:
+            run.append(token)
+    if run:
+        runs.append(run)
+
+    return runs
+
+
+def apply_rules(t2d: Text2Digits, runs):
+    results = []
+    for run in runs:
+        for rule in t2d._rules:
+            run = t2d._apply_rule(rule, run)
+        results.append(run)
+
+    return results
+
+
+def main(quick: bool = False) -> None:
+    t2d = Text2Digits()
+    text = make_document(SIZE // 10 if quick else SIZE, number_density=0.5)
+    runs = number_runs(t2d, text)
+
+    seconds = best_of(lambda: apply_rules(t2d, runs), repeat=3)
+
+    tracemalloc.start()
+    try:
+        results = apply_rules(t2d, runs)
+        retained, peak = tracemalloc.get_traced_memory()
+        n_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        tracemalloc.stop()
+
+    print_table(
+        ["number runs", "rule tokens", "time", "time per run", "bytes per run", "blocks per run"],
+        [
+            [
+                f"{len(runs):,}",
+                f"{sum(len(result) for result in results):,}",
+                f"{seconds:.3f} s",
+                f"{seconds / len(runs) * 1e6:.2f} us",
+                f"{retained / len(runs):.1f}",
+                f"{n_blocks / len(runs):.2f}",
+            ]
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
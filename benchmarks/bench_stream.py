@@ -0,0 +1,64 @@
+"""
+Converting a file into another file: reading the whole file, convert() and writing the result compared to convert_to() from the open input file into the open output file. The peak memory is traced with tracemalloc. The number list has no words which end a number, so convert_to() has to keep it in memory.
+"""
+
+import os
+import random
+import tempfile
+
+from common import NUMBER_PHRASES, best_of, format_bytes, make_document, peak_memory, print_table
+
+from text2digits import Text2Digits
+
+SIZES = [1_000_000, 10_000_000]
+
+
+def number_list(n_bytes: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    phrases = []
+    length = 0
+    while length < n_bytes:
+        phrases.append(rng.choice(NUMBER_PHRASES))
+        length += len(phrases[-1]) + 1
+
+    return " ".join(phrases)
+
+
+def convert_whole(t2d: Text2Digits, source: str, target: str) -> None:
+    with open(source, encoding="utf-8") as reader, open(target, "w", encoding="utf-8") as writer:
+        writer.write(t2d.convert(reader.read()))
+
+
+def convert_stream(t2d: Text2Digits, source: str, target: str) -> None:
+    with open(source, encoding="utf-8") as reader, open(target, "w", encoding="utf-8") as writer:
+        t2d.convert_to(reader, writer)
+
+
+def main(quick: bool = False) -> None:
+    t2d = Text2Digits()
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "input.txt")
+        target = os.path.join(directory, "output.txt")
+
+        for size in SIZES[:1] if quick else SIZES:
+            for name, text in [("document", make_document(size)), ("number list", number_list(size // 10))]:
+                with open(source, "w", encoding="utf-8") as file:
+                    file.write(text)
+
+                row = [name, format_bytes(len(text))]
+                outputs = []
+                for convert in (convert_whole, convert_stream):
+                    seconds = best_of(lambda convert=convert: convert(t2d, source, target), repeat=1)
+                    _, peak = peak_memory(lambda convert=convert: convert(t2d, source, target))
+                    with open(target, encoding="utf-8") as file:
+                        outputs.append(file.read())
+                    row.extend([f"{seconds:.3f} s", format_bytes(peak)])
+                assert outputs[0] == outputs[1]
+                rows.append(row)
+
+    print_table(["input", "size", "convert()", "peak", "convert_to()", "peak"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Cost of the numeric token attributes (value, scale and large-scale flag) which the rules query repeatedly, measured on the tokens of a number-dense document and by converting it.
+"""
+
+from common import best_of, format_bytes, make_document, print_table
+
+from text2digits import Text2Digits
+from text2digits.tokens_basic import WordType
+
+SIZE = 1_000_000
+QUERIES = 5
+
+
+def query_attributes(tokens) -> None:
+    for token in tokens:
+        for _ in range(QUERIES):
+            token.has_large_scale()
+            token.scale()
+            token.value()
+
+
+def main(quick: bool = False) -> None:
+    t2d = Text2Digits()
+    text = make_document(SIZE // 10 if quick else SIZE, number_density=1.0)
+    tokens = [
+        token
+        for token in t2d._lex(text)
+        if token.type not in (WordType.OTHER, WordType.NEGATION, WordType.DECIMAL_SEPARATOR)
+    ]
+
+    seconds_lex = best_of(lambda: t2d._lex(text), repeat=3)
+    seconds_queries = best_of(lambda: query_attributes(tokens), repeat=3)
+    seconds_convert = best_of(lambda: t2d.convert(text), repeat=3)
+
+    print_table(
+        ["input", "numeric tokens", "lex", f"{QUERIES}x value/scale/large-scale", "convert"],
+        [
+            [
+                format_bytes(len(text)),
+                f"{len(tokens):,}",
+                f"{seconds_lex:.3f} s",
+                f"{seconds_queries:.3f} s",
+                f"{seconds_convert:.3f} s",
+            ]
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
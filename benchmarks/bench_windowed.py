@@ -0,0 +1,39 @@
+"""
+Windowed processing (only the regions around number words are tokenized) compared to the full pipeline on documents with few numbers.
+"""
+
+from common import best_of, format_bytes, make_document, print_table
+
+from text2digits import Text2Digits
+
+SIZES = [1_000_000, 10_000_000]
+DENSITIES = [0.001, 0.01, 0.1]
+
+
+def main(quick: bool = False) -> None:
+    full = Text2Digits()
+    windowed = Text2Digits(windowed=True)
+    rows = []
+
+    for size in SIZES[:1] if quick else SIZES:
+        for density in DENSITIES:
+            text = make_document(size, number_density=density)
+            assert windowed.convert(text) == full.convert(text)
+
+            seconds_full = best_of(lambda text=text: full.convert(text), repeat=2)
+            seconds_windowed = best_of(lambda text=text: windowed.convert(text), repeat=2)
+            rows.append(
+                [
+                    format_bytes(len(text)),
+                    f"{density:.3f}",
+                    f"{seconds_full:.3f} s",
+                    f"{seconds_windowed:.3f} s",
+                    f"{seconds_full / seconds_windowed:.2f}x",
+                ]
+            )
+
+    print_table(["input", "density", "full", "windowed", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Shared helpers for the benchmark scripts in this directory.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+# Make the package importable when running the benchmarks from a source checkout
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+PROSE_WORDS = (
+    "the quick brown fox jumps over lazy dog and then we went home to see what was going on in "
+    "town because nobody knew where everyone had gone after meeting yesterday evening at station"
+).split()
+
+NUMBER_PHRASES = [
+    "one",
+    "twenty one",
+    "one hundred and fifty",
+    "two thousand twenty four",
+    "nineteen ninety nine",
+    "forty-two",
+    "third",
+    "negative five",
+    "three point one four",
+    "1,000",
+    "2.5 million",
+    "seven",
+]
+
+
+def make_document(n_bytes: int, number_density: float = 0.1, seed: int = 0) -> str:
+    """
+    Generates a pseudo-random English document of roughly *n_bytes* characters.
+
+    :param n_bytes: The approximate size of the document.
+    :param number_density: The fraction of words which start a number phrase.
+    :param seed: Seed for the random generator so that runs are comparable.
+    :return: The generated document.
+    """
+    rng = random.Random(seed)
+    parts: List[str] = []
+    size = 0
+    while size < n_bytes:
+        if rng.random() < number_density:
+            word = rng.choice(NUMBER_PHRASES)
+        else:
+            word = rng.choice(PROSE_WORDS)
+        glue = ". " if rng.random() < 0.05 else " "
+        parts.append(word + glue)
+        size += len(word) + len(glue)
+
+    return "".join(parts)
+
+
+def best_of(func: Callable[[], Any], repeat: int = 3) -> float:
+    """
+    Returns the fastest wall-clock time in seconds of *repeat* executions of *func*.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def peak_memory(func: Callable[[], Any]) -> Tuple[Any, int]:
+    """
+    Executes *func* while tracing allocations.
+
+    :return: The result of *func* and the peak number of bytes allocated during the call.
+    """
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, peak
+
+
+def format_bytes(n_bytes: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n_bytes) < 1024 or unit == "GB":
+            return f"{n_bytes:.1f} {unit}"
+        n_bytes /= 1024
+
+    raise AssertionError("unreachable")
+
+
+def print_table(header: List[str], rows: List[List[str]]) -> None:
+    widths = [max(len(str(cell)) for cell in column) for column in zip(header, *rows)]
+    for row in [header, *rows]:
+        print("  ".join(str(cell).rjust(width) for cell, width in zip(row, widths)))
@@ -0,0 +1,131 @@
+"""
+Load test of the HTTP conversion service (text2digits.serve) on localhost.
+
+Usage::
+
+    python benchmarks/load_test.py                              # starts a server with 1 worker process
+    python benchmarks/load_test.py --workers 0 --max-wait-ms 5  # in-process conversion, longer batching window
+    python benchmarks/load_test.py --url http://127.0.0.1:8000  # runs against an already running server
+
+Each client thread sends single-text requests over a keep-alive connection. The report contains the throughput, the latency percentiles and the batch statistics of the server.
+"""
+
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from common import NUMBER_PHRASES, PROSE_WORDS, print_table
+
+from text2digits.serve import Batcher, ConversionServer
+
+
+def make_sentences(n: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(n):
+        words = [rng.choice(NUMBER_PHRASES) if rng.random() < 0.2 else rng.choice(PROSE_WORDS) for _ in range(12)]
+        sentences.append(" ".join(words))
+
+    return sentences
+
+
+def run_client(
+    address: Tuple[str, int], sentences: List[str], n_requests: int, latencies: List[float], errors: List[int]
+) -> None:
+    connection = http.client.HTTPConnection(*address, timeout=30)
+    try:
+        for i in range(n_requests):
+            body = sentences[i % len(sentences)].encode("utf-8")
+            start = time.perf_counter()
+            connection.request("POST", "/convert", body, {"Content-Type": "text/plain"})
+            response = connection.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - start)
+            if response.status != 200:
+                errors.append(response.status)
+    finally:
+        connection.close()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def fetch_stats(address: Tuple[str, int]) -> dict:
+    connection = http.client.HTTPConnection(*address, timeout=30)
+    try:
+        connection.request("GET", "/stats")
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="URL of a running server (default: start one on a free local port)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Number of client threads (default: %(default)s)")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per client (default: %(default)s)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes of the started server")
+    parser.add_argument("--max-batch-size", type=int, default=64, help="Batch size of the started server")
+    parser.add_argument("--max-wait-ms", type=float, default=2.0, help="Batching window of the started server")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.url:
+        url = urlsplit(args.url)
+        address = (url.hostname or "127.0.0.1", url.port or 80)
+    else:
+        batcher = Batcher(workers=args.workers, max_batch_size=args.max_batch_size, max_wait=args.max_wait_ms / 1000)
+        server = ConversionServer(("127.0.0.1", 0), batcher)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        address = server.server_address[:2]
+
+    try:
+        stats_before = fetch_stats(address)
+        sentences = make_sentences(1000)
+        latencies: List[float] = []
+        errors: List[int] = []
+        clients = [
+            threading.Thread(target=run_client, args=(address, sentences, args.requests, latencies, errors))
+            for _ in range(args.concurrency)
+        ]
+
+        start = time.perf_counter()
+        for client in clients:
+            client.start()
+        for client in clients:
+            client.join()
+        seconds = time.perf_counter() - start
+
+        stats = fetch_stats(address)
+    finally:
+        if server is not None:
+            server.close()
+
+    batches = stats["batches"] - stats_before["batches"]
+    texts = stats["texts"] - stats_before["texts"]
+    print_table(
+        ["requests", "errors", "requests/s", "p50", "p95", "p99", "batches", "mean batch"],
+        [
+            [
+                str(len(latencies)),
+                str(len(errors)),
+                f"{len(latencies) / seconds:.0f}",
+                f"{percentile(latencies, 0.5) * 1000:.2f} ms",
+                f"{percentile(latencies, 0.95) * 1000:.2f} ms",
+                f"{percentile(latencies, 0.99) * 1000:.2f} ms",
+                str(batches),
+                f"{texts / batches if batches else 0:.1f}",
+            ]
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Runs the benchmarks in this directory.
+
+Usage::
+
+    python benchmarks/run.py                 # run all benchmarks
+    python benchmarks/run.py rendering       # run benchmarks/bench_rendering.py only
+    python benchmarks/run.py --quick         # smaller inputs, useful as a smoke test
+    python benchmarks/run.py --replay slow.jsonl slow.jsonl.1   # time the inputs recorded by a SlowLog
+"""
+
+import argparse
+import importlib
+import sys
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCHMARK_DIR))
+
+from common import best_of, print_table  # noqa: E402
+
+from text2digits import Text2Digits  # noqa: E402
+from text2digits.slowlog import read_records  # noqa: E402
+
+
+def available_benchmarks() -> List[str]:
+    return sorted(path.stem[len("bench_") :] for path in BENCHMARK_DIR.glob("bench_*.py"))
+
+
+def replay(paths: List[str], repeat: int = 3) -> None:
+    """
+    Converts the inputs of slow log records again (with the recorded configuration) and compares the durations.
+    """
+    converters: Dict[Tuple[Tuple[str, Any], ...], Text2Digits] = {}
+    rows = []
+    for record in read_records(paths):
+        row = [record["sha256"][:12], record["method"], f"{record['length']:,}", f"{record['seconds'] * 1000:.1f} ms"]
+        row.append(", ".join(f"{stage} {seconds * 1000:.1f} ms" for stage, seconds in record["stages"].items()))
+        if "text" not in record:
+            rows.append(row + ["-", "input not captured"])
+            continue
+
+        config = tuple(sorted(record["config"].items()))
+        if config not in converters:
+            converters[config] = Text2Digits(**dict(config))
+        t2d = converters[config]
+
+        if record["method"] == "convert_bytes":
+            func: Callable[[], Any] = partial(
+                t2d.convert_bytes, record["text"].encode("utf-8", errors="surrogateescape")
+            )
+        else:
+            func = partial(t2d.convert, record["text"])
+
+        seconds = best_of(func, repeat)
+        rows.append(row + [f"{seconds * 1000:.1f} ms", "input truncated" if record.get("truncated") else ""])
+
+    print_table(["input", "method", "length", "recorded", "recorded stages", "replayed", "note"], rows)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("names", nargs="*", help=f"Benchmarks to run (available: {', '.join(available_benchmarks())})")
+    parser.add_argument(
+        "--quick", action="store_true", help="Use smaller inputs (or a single repetition with --replay)"
+    )
+    parser.add_argument("--replay", nargs="+", metavar="FILE", help="Replay the records of slow log files instead")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        replay(args.replay, repeat=1 if args.quick else 3)
+        return
+
+    for name in args.names or available_benchmarks():
+        module = importlib.import_module(f"bench_{name}")
+        print(f"== {name}")
+        module.main(quick=args.quick)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import ctypes
+import sys
+from array import array
+
+import pytest
+
+from text2digits import Text2Digits
+from text2digits.text_processing_helpers import offsets_view
+from text2digits.tokens_basic import Token
+from text2digits.vocabulary import candidate_pattern_bytes, number_words
+
+ROWS = [
+    "I have twenty one apples",
+    "",
+    "nothing here",
+    "o",  # together with the next row, the data buffer contains "one"
+    "ne",
+    "fifth",
+    "It costs 1,000 dollars or two point five thousand Euro",
+    "",
+    "t,wo",
+    "FORTY-TWO",
+    "fünf naïve twenty one — ok",
+    "laKh",  # Kelvin sign
+    "٣ hundred",
+    "one\xa0two",
+    "John",
+]
+
+
+def to_column(rows, typecode="i", first_offset=0):
+    data = b"x" * first_offset + b"".join(row.encode("utf-8") for row in rows)
+    offsets = array(typecode, [first_offset])
+    for row in rows:
+        offsets.append(offsets[-1] + len(row.encode("utf-8")))
+    return data, offsets
+
+
+def from_column(data, offsets):
+    return [bytes(data[offsets[i] : offsets[i + 1]]).decode("utf-8") for i in range(len(offsets) - 1)]
+
+
+@pytest.mark.parametrize("typecode", ["i", "q"])
+@pytest.mark.parametrize("kwargs", [{}, {"convert_ordinals": False}, {"similarity_threshold": 0.8}])
+def test_same_result_as_convert(typecode, kwargs):
+    t2d = Text2Digits(**kwargs)
+    data, offsets = to_column(ROWS, typecode)
+
+    out, out_offsets = t2d.convert_arrow(data, offsets)
+
+    assert out_offsets.typecode == typecode
+    assert out_offsets[0] == 0 and out_offsets[-1] == len(out)
+    assert from_column(out, out_offsets) == [t2d.convert(row) for row in ROWS]
+
+
+def test_offsets_not_starting_at_zero():
+    t2d = Text2Digits()
+    data, offsets = to_column(ROWS, first_offset=5)
+    data += b"two"  # data after the last row is ignored
+
+    out, out_offsets = t2d.convert_arrow(memoryview(data), offsets)
+
+    assert out_offsets[0] == 0
+    assert from_column(out, out_offsets) == [t2d.convert(row) for row in ROWS]
+
+
+def test_rows_without_numbers_are_copied():
+    data, offsets = to_column(["abc", "", "the quick brown fox"] * 10)
+    out, out_offsets = Text2Digits().convert_arrow(data, offsets)
+    assert (bytes(out), out_offsets) == (data, offsets)
+
+
+def test_many_rows():
+    rows = [f"row {i} has twenty {i % 10} apples" if i % 7 == 0 else "no numbers here" for i in range(10_000)]
+    t2d = Text2Digits()
+    out, out_offsets = t2d.convert_arrow(*to_column(rows))
+    assert from_column(out, out_offsets) == [t2d.convert(row) for row in rows]
+
+
+def test_empty():
+    assert Text2Digits().convert_arrow(b"", array("i", [0])) == (bytearray(), array("i", [0]))
+    assert Text2Digits().convert_arrow(b"", array("q")) == (bytearray(), array("q"))
+
+
+@pytest.mark.parametrize(
+    "offsets",
+    [array("h", [0, 1]), array("d", [0, 1]), memoryview(array("i", [0, 1]).tobytes()), array("i", [0, 100])],
+)
+def test_invalid_offsets(offsets):
+    with pytest.raises(ValueError):
+        Text2Digits().convert_arrow(b"one", offsets)
+
+
+def test_offsets_view_byte_order():
+    native = array("i", [0, 3])
+    assert offsets_view(memoryview(native)).tolist() == [0, 3]
+
+    foreign_int32 = ctypes.c_int32.__ctype_be__ if sys.byteorder == "little" else ctypes.c_int32.__ctype_le__
+    with pytest.raises(ValueError):
+        offsets_view((foreign_int32 * 2)(0, 3))
+
+
+def test_candidate_pattern_matches_all_number_words():
+    pattern = candidate_pattern_bytes()
+    # Conjunctions only matter next to another number word
+    for word in number_words() - Token.CONJUNCTION:
+        assert pattern.search(word.encode("ascii")), word
+        assert pattern.search(",".join(word).encode("ascii")), word
+    assert not pattern.search(b"the quick brown fox and")
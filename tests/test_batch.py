@@ -0,0 +1,88 @@
+import pytest
+
+import text2digits.text_processing_helpers as helpers
+from text2digits import MetricsRegistry, Text2Digits
+from text2digits.text_processing_helpers import BigramIndex, find_similar_word
+from text2digits.tokens_basic import Token
+
+TEXTS = [
+    "I was born in nineteen sixty four",
+    "twentyy one sixx and fourty-two",
+    "",
+    "Ant foo, thre hundrd apples; the fifht one",
+    "nothing to see here",
+    "x .twentyy one",  # split_glues() keeps the dot in the word
+    "twentyy one sixx and fourty-two",
+]
+
+WORDS = ["", "a", "o", "oh", "Twenty", "twentyy", "fourty", "thre", "nnine", "hundredth", "xyz", "tenn", "İki", "and"]
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"similarity_threshold": 0.8}, {"similarity_threshold": 0.5}])
+def test_same_result_as_convert(kwargs):
+    t2d = Text2Digits(**kwargs)
+    assert t2d.convert_batch(TEXTS) == [t2d.convert(text) for text in TEXTS]
+
+
+SHORT_TEXTS = [
+    "twenty one",
+    "apples",
+    " two ",
+    "",
+    "x\x00three",
+    "Forty-Two!",
+    "one,",
+    "and",
+    "and five",
+    "hundred",
+    "İki twenty",
+    "2.5 million",
+    "the third",
+    "minus four",
+    "seven",
+]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"windowed": True}, {"add_ordinal_ending": True}, {"negation": False}, {"decimal_words": False}]
+)
+@pytest.mark.parametrize("texts", [SHORT_TEXTS, SHORT_TEXTS[:10], ["apples", "seven"], ["seven"], []])
+def test_short_texts(kwargs, texts):
+    t2d = Text2Digits(**kwargs)
+    assert t2d.convert_batch(texts) == [t2d.convert(text) for text in texts]
+
+
+def test_without_numpy(monkeypatch):
+    monkeypatch.setattr(helpers, "numpy", None)
+    t2d = Text2Digits(similarity_threshold=0.8)
+    assert t2d.convert_batch(TEXTS) == [t2d.convert(text) for text in TEXTS]
+
+
+def test_accepts_iterables():
+    assert Text2Digits().convert_batch(text for text in ["twenty one", "two"]) == ["21", "2"]
+
+
+def test_metrics():
+    batch_metrics = MetricsRegistry()
+    Text2Digits(similarity_threshold=0.8, metrics=batch_metrics).convert_batch(TEXTS)
+    single_metrics = MetricsRegistry()
+    t2d = Text2Digits(similarity_threshold=0.8, metrics=single_metrics)
+    for text in TEXTS:
+        t2d.convert(text)
+
+    for name in ["calls", "bytes", "tokens", "numbers", "corrections"]:
+        assert batch_metrics.snapshot()[name] == single_metrics.snapshot()[name]
+    assert batch_metrics.snapshot()["corrections"] > 0
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.25, 1 / 3, 0.5, 2 / 3, 0.8, 1.0])
+def test_find_similar_words_numpy(threshold):
+    pytest.importorskip("numpy")
+    matches = BigramIndex(Token.numwords.keys()).find_similar_words(WORDS, threshold)
+    assert matches == {word: find_similar_word(word, Token.numwords.keys(), threshold) for word in WORDS}
+
+
+def test_find_similar_words_ties():
+    pytest.importorskip("numpy")
+    collection = ["abx", "aby", "ab", "abz"]
+    assert BigramIndex(collection).find_similar_words(["abc", "aab"], 0.0) == {"abc": "abx", "aab": "abx"}
@@ -0,0 +1,107 @@
+import time
+
+import pytest
+
+from text2digits import ConversionResult, ConversionTimeout, MetricsRegistry, Text2Digits
+from text2digits import budget as budget_module
+
+
+class TestTokenBudget:
+    def test_budget_not_exhausted(self):
+        result = Text2Digits().convert("one two", max_tokens=2)
+        assert result == "12"
+        assert type(result) is str
+
+    def test_raises_when_exhausted(self):
+        with pytest.raises(ConversionTimeout) as exc_info:
+            Text2Digits().convert("one two three four five six", max_tokens=3)
+
+        # The number run may continue after the budget ran out, so it is copied unchanged
+        assert exc_info.value.result == "one two three four five six"
+        assert exc_info.value.result.truncated
+        assert exc_info.value.result.position == 0
+
+    def test_timeout_error_subclass(self):
+        with pytest.raises(TimeoutError):
+            Text2Digits().convert("one two", max_tokens=1)
+
+    def test_partial_result(self):
+        result = Text2Digits().convert("I have twenty one apples and four pears", max_tokens=5, partial=True)
+        assert isinstance(result, ConversionResult)
+        assert result == "I have 21 apples and four pears"
+        assert result.truncated
+        assert result.position == len("I have twenty one apples ")
+
+    def test_partial_result_not_truncated(self):
+        result = Text2Digits().convert("twenty one", max_tokens=10, partial=True)
+        assert result == "21"
+        assert not result.truncated
+        assert result.position is None
+
+    def test_zero_tokens(self):
+        result = Text2Digits().convert("twenty one", max_tokens=0, partial=True)
+        assert result == "twenty one"
+        assert result.truncated
+
+    def test_negative_budget_is_rejected(self):
+        with pytest.raises(ValueError):
+            Text2Digits().convert("one", max_tokens=-1)
+
+    def test_partial_with_spelling_correction(self):
+        result = Text2Digits(similarity_threshold=0.8).convert("twentyy one apples sixx", max_tokens=3, partial=True)
+        assert result == "21 apples sixx"
+        assert result.truncated
+
+    def test_with_metrics(self):
+        metrics = MetricsRegistry()
+        result = Text2Digits(metrics=metrics).convert("one apple two", max_tokens=2, partial=True)
+        assert result == "1 apple two"
+        assert metrics.snapshot()["tokens"] == 2
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "twenty one",
+            "one hundred and five",
+            "one two three four five six",
+            "I have twenty one apples and four hundred and two pears",
+            "minus three point five, the twenty first of May nineteen ninety nine",
+        ],
+    )
+    @pytest.mark.parametrize("kwargs", [{}, {"similarity_threshold": 0.8}, {"phrase_cache_size": 0}])
+    def test_cut_inside_number_run(self, text, kwargs):
+        t2d = Text2Digits(**kwargs)
+        for max_tokens in range(len(text.split()) + 1):
+            result = t2d.convert(text, max_tokens=max_tokens, partial=True)
+            position = len(text) if result.position is None else result.position
+            assert result == t2d.convert(text[:position]) + text[position:], max_tokens
+        # The cut-off runs did not leave entries in the phrase cache
+        assert t2d.convert(text) == Text2Digits(**kwargs).convert(text)
+
+
+class TestDeadline:
+    def test_expired_deadline(self):
+        with pytest.raises(ConversionTimeout) as exc_info:
+            Text2Digits().convert("twenty one", deadline=time.monotonic() - 1)
+
+        assert exc_info.value.result == "twenty one"
+        assert exc_info.value.result.position == 0
+
+    def test_future_deadline(self):
+        assert Text2Digits().convert("twenty one", deadline=time.monotonic() + 60) == "21"
+
+    def test_deadline_between_number_runs(self, monkeypatch):
+        """The deadline is checked before each number run; the remainder is copied unchanged."""
+        text = "one apple and two pears and three plums"
+        clock = iter([0.0, 0.0, 0.0, 10.0])
+        monkeypatch.setattr(budget_module.time, "monotonic", lambda: next(clock))
+
+        result = Text2Digits().convert(text, deadline=5.0, partial=True)
+        assert result == "1 apple and 2 pears and three plums"
+        assert result.truncated
+        assert result.position == text.index("and three")
+
+    def test_no_partial_without_budget(self):
+        result = Text2Digits().convert("twenty one", partial=True)
+        assert isinstance(result, ConversionResult)
+        assert not result.truncated
@@ -0,0 +1,83 @@
+import pytest
+
+from text2digits import MetricsRegistry, Text2Digits
+from text2digits.text_processing_helpers import has_only_inert_non_ascii, split_glues, split_glues_bytes
+from text2digits.tokens_basic import Token, WordType
+from text2digits.vocabulary import number_words
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "I was born in nineteen sixty four",
+        "It costs 1,000 dollars or two point five thousand Euro. The first one is negative twenty.",
+        "forty--two and and five",
+        "Forty-Two_SEVENTH; Hundredth,\tnine\x1cthousand",
+        "trailing glue  \n",
+        "fünf naïve twenty one — ok",
+    ],
+)
+@pytest.mark.parametrize("kwargs", [{}, {"convert_ordinals": False}, {"add_ordinal_ending": True}])
+def test_same_result_as_convert(text, kwargs):
+    t2d = Text2Digits(**kwargs)
+    expected = t2d.convert(text).encode("utf-8")
+    data = text.encode("utf-8")
+
+    assert t2d.convert_bytes(data) == expected
+    assert t2d.convert_bytes(bytearray(data)) == expected
+    assert t2d.convert_bytes(memoryview(data)) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "one\xa0two",  # non-ASCII whitespace
+        "٣ hundred",  # non-ASCII digit
+        "laKh",  # Kelvin sign (lowercase form is k)
+    ],
+)
+def test_significant_non_ascii_falls_back_to_decoding(text):
+    data = text.encode("utf-8")
+    assert not has_only_inert_non_ascii(data)
+    assert Text2Digits().convert_bytes(data) == Text2Digits().convert(text).encode("utf-8")
+
+
+def test_spelling_correction():
+    t2d = Text2Digits(similarity_threshold=0.8)
+    assert t2d.convert_bytes(b"twentyy one") == b"21"
+
+
+def test_invalid_utf8_raises():
+    with pytest.raises(UnicodeDecodeError):
+        Text2Digits().convert_bytes(b"one \xff two")
+
+
+def test_returns_bytes():
+    assert isinstance(Text2Digits().convert_bytes(bytearray(b"twenty one")), bytes)
+
+
+def test_metrics():
+    metrics = MetricsRegistry()
+    Text2Digits(metrics=metrics).convert_bytes(b"I have twenty one apples")
+    snapshot = metrics.snapshot()
+    assert snapshot["calls"] == 1
+    assert snapshot["bytes"] == 24
+    assert snapshot["tokens"] == 5
+    assert snapshot["numbers"] == 1
+
+
+class TestSplitGluesBytes:
+    @pytest.mark.parametrize("text", ["hello world", "forty--two", "a. .b", "x\x1cy\x0bz", "1.5. 2,000,", ""])
+    def test_same_as_str(self, text):
+        pairs = [(bytes(word).decode(), bytes(glue).decode()) for word, glue in split_glues_bytes(text.encode())]
+        assert pairs == list(split_glues(text))
+
+
+class TestVocabulary:
+    def test_all_words_are_numeric(self):
+        for word in number_words():
+            assert Token(word, "").type != WordType.OTHER, word
+
+    def test_contains_ordinal_forms(self):
+        assert {"first", "twentieth", "hundredth", "sixth", "point", "minus", "oh"} <= number_words()
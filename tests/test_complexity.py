@@ -0,0 +1,96 @@
+"""
+Checks that the processing stages scale linearly with the input size.
+
+Each stage runs on generated worst-case inputs of doubling size and the growth exponent is fitted to the (log size, log time) points. A linear stage has an exponent of about 1 and a quadratic one of about 2 (at these sizes, where the quadratic term dominates). Comparing the growth instead of wall-clock thresholds keeps the tests independent of the speed of the machine.
+"""
+
+import gc
+import math
+import time
+from typing import Callable, List
+
+import pytest
+
+from text2digits import Text2Digits
+from text2digits.text_processing_helpers import split_glues
+
+# Input sizes (in repetitions of the shape) and the largest exponent which is still considered linear
+SIZES = [4000, 8000, 16000, 32000]
+MAX_EXPONENT = 1.35
+REPEAT = 3
+
+SHAPES = {
+    # One long run of units, which the ConcatenationRule combines into a single token
+    "number_run": lambda n: "one two three " * (n // 3),
+    # The CombinationRule matches the whole run as one (growing) number
+    "scales": lambda n: "one hundred thousand million " * (n // 4),
+    "alternating_scales": lambda n: "two hundred " * (n // 2),
+    "literal_scales": lambda n: "1,000 " * n,
+    "and_chain": lambda n: "one and " * (n // 2),
+    "decimals": lambda n: "negative one point two " * (n // 4),
+    "hyphenated": lambda n: "-".join(["twenty", "one"] * (n // 2)),
+    "long_word": lambda n: "x" * (8 * n),
+    "punctuation_glue": lambda n: "one" + ",.;-" * n + "two",
+    "punctuated_words": lambda n: "a,.;-" * n,
+}
+
+
+def growth_exponent(stage: Callable[[str], object], shape: Callable[[int], str], sizes: List[int] = SIZES) -> float:
+    """
+    Returns the slope of the least-squares line through the (log size, log time) points of the stage.
+    """
+    points = []
+    for size in sizes:
+        text = shape(size)
+        timings = []
+        gc.disable()
+        try:
+            for _ in range(REPEAT):
+                start = time.perf_counter()
+                stage(text)
+                timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+        points.append((math.log(size), math.log(max(min(timings), 1e-9))))
+
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / sum((x - mean_x) ** 2 for x, _ in points)
+
+
+def assert_linear(stage: Callable[[str], object], shape: Callable[[int], str]) -> None:
+    exponent = growth_exponent(stage, shape)
+    if exponent > MAX_EXPONENT:
+        # Measure once more to rule out a disturbance of the machine (e.g. another process) during the first run
+        exponent = min(exponent, growth_exponent(stage, shape))
+    assert exponent <= MAX_EXPONENT, f"The running time grows with exponent {exponent:.2f}"
+
+
+@pytest.fixture(scope="module")
+def t2d():
+    return Text2Digits()
+
+
+@pytest.mark.parametrize("shape", ["number_run", "long_word", "punctuation_glue", "punctuated_words"])
+def test_split_glues(shape):
+    assert_linear(lambda text: list(split_glues(text)), SHAPES[shape])
+
+
+@pytest.mark.parametrize("shape", list(SHAPES))
+def test_lex(t2d, shape):
+    assert_linear(t2d._lex, SHAPES[shape])
+
+
+@pytest.mark.parametrize("shape", list(SHAPES))
+def test_convert(t2d, shape):
+    assert_linear(t2d.convert, SHAPES[shape])
+
+
+@pytest.mark.parametrize("shape", ["number_run", "scales", "and_chain", "punctuated_words"])
+def test_convert_bytes(t2d, shape):
+    assert_linear(lambda text: t2d.convert_bytes(text.encode()), SHAPES[shape])
+
+
+@pytest.mark.parametrize("shape", ["number_run", "alternating_scales", "long_word", "punctuated_words"])
+def test_windowed(shape):
+    assert_linear(Text2Digits(windowed=True).convert, SHAPES[shape])
@@ -0,0 +1,119 @@
+import io
+import tracemalloc
+
+import pytest
+
+from text2digits import MetricsRegistry, Text2Digits
+
+PROSE = "Someone had gone often to the station and nobody knew. "
+
+TEXTS = [
+    "",
+    "   ",
+    "twenty one",
+    " I have twenty one apples and three pears.\n",
+    PROSE * 5 + "It costs 1,000 dollars or two point five thousand Euro. " + PROSE * 5,
+    "one two three four five six seven eight nine ten " * 5,
+    "apples\xa0\xa0twenty-one   and\t\tfour hundred,  five\n\nthousand ",
+    "x" * 100 + " twenty " + "y" * 100,
+]
+
+
+class Sink:
+    """
+    A writer which only has a write() method.
+    """
+
+    def __init__(self) -> None:
+        self.parts = []
+
+    def write(self, text: str) -> None:
+        self.parts.append(text)
+
+
+class NullWriter:
+    def write(self, text: str) -> None:
+        pass
+
+
+class Trickle(io.StringIO):
+    """
+    A stream which returns fewer characters than requested (e.g. like a pipe).
+    """
+
+    def read(self, size: int = -1) -> str:
+        return super().read(max(1, size // 3) if size > 0 else size)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 100_000])
+@pytest.mark.parametrize("source_type", [str, io.StringIO, Trickle])
+def test_same_result_as_convert(text, chunk_size, source_type):
+    t2d = Text2Digits()
+    writer = io.StringIO()
+    n_written = t2d.convert_to(source_type(text), writer, chunk_size=chunk_size)
+    assert writer.getvalue() == t2d.convert(text)
+    assert n_written == len(writer.getvalue())
+
+
+@pytest.mark.parametrize("kwargs", [{"similarity_threshold": 0.8}, {"windowed": True}, {"concatenate": False}])
+def test_options(kwargs):
+    t2d = Text2Digits(**kwargs)
+    text = PROSE + "twentyy one and sixx hundred " + PROSE
+    writer = io.StringIO()
+    t2d.convert_to(io.StringIO(text), writer, chunk_size=16)
+    assert writer.getvalue() == t2d.convert(text)
+
+
+def test_writes_chunks():
+    sink = Sink()
+    Text2Digits().convert_to(PROSE * 20 + "twenty one", sink, chunk_size=100)
+    assert len(sink.parts) > 5
+    assert "".join(sink.parts) == PROSE * 20 + "21"
+
+
+def test_metrics_observe_chunks():
+    metrics = MetricsRegistry()
+    Text2Digits(metrics=metrics).convert_to(PROSE * 10, io.StringIO(), chunk_size=100)
+    assert metrics.snapshot()["calls"] > 1
+
+
+def test_peak_memory():
+    text = (PROSE * 3 + "I have twenty one apples. ") * 5000
+    source = io.StringIO(text)
+    t2d = Text2Digits(phrase_cache_size=0)
+    # Compile the patterns before tracing
+    t2d.convert_to(text[:1000], NullWriter())
+
+    tracemalloc.start()
+    try:
+        t2d.convert_to(source, NullWriter(), chunk_size=4096)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    # Far less than the input (about 1 MB) which would be converted at once by convert()
+    assert peak < len(text) / 4
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["one two " * 25_000, "x" * 200_000 + " twenty one", " " * 200_000 + "twenty one", "x " * 100_000],
+    ids=["numbers", "long word", "whitespace", "short words"],
+)
+def test_search_is_linear(text, monkeypatch):
+    # Without a safe cut (or with whitespace or a word longer than many blocks), each block must not search all pending text again
+    t2d = Text2Digits()
+    searched = []
+    safe_cut = t2d._safe_cut
+    monkeypatch.setattr(t2d, "_safe_cut", lambda text, position: searched.append(len(text)) or safe_cut(text, position))
+
+    writer = io.StringIO()
+    t2d.convert_to(io.StringIO(text), writer, chunk_size=64)
+    assert writer.getvalue() == t2d.convert(text)
+    assert sum(searched) < 4 * len(text)
+
+
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError):
+        Text2Digits().convert_to("twenty", io.StringIO(), chunk_size=0)
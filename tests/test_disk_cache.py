@@ -0,0 +1,163 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from text2digits import DiskCache, MetricsRegistry, Text2Digits
+from text2digits import disk_cache as disk_cache_module
+
+TEXTS = ["twenty one apples", "two hundred", "no numbers", "the third day", "twenty one apples"]
+
+
+def convert_in_process(path, texts):
+    return Text2Digits(disk_cache=DiskCache(path)).convert_batch(texts)
+
+
+class FakeClock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DiskCache(tmp_path / "cache.sqlite")
+    yield cache
+    cache.close()
+
+
+class TestConverterCache:
+    def test_convert_batch(self, cache):
+        metrics = MetricsRegistry()
+        t2d = Text2Digits(disk_cache=cache, metrics=metrics)
+        expected = Text2Digits().convert_batch(TEXTS)
+
+        assert t2d.convert_batch(TEXTS) == expected
+        assert len(cache) == 4
+        # Identical texts are converted once
+        assert metrics.snapshot()["caches"]["disk"] == {"hits": 1, "misses": 4, "hit_rate": 0.2}
+        assert metrics.snapshot()["calls"] == 4
+
+        assert t2d.convert_batch(TEXTS) == expected
+        assert metrics.snapshot()["caches"]["disk"]["hits"] == 1 + 5
+        assert metrics.snapshot()["calls"] == 4
+
+    def test_convert(self, cache):
+        t2d = Text2Digits(disk_cache=cache)
+        assert t2d.convert("twenty one") == "21"
+        assert t2d.convert("twenty one", partial=True) == "21"
+        assert len(cache) == 1
+
+        # Conversions with a budget bypass the cache
+        assert t2d.convert("thirty one", max_tokens=100) == "31"
+        assert len(cache) == 1
+
+    def test_spelling_correction(self, cache):
+        t2d = Text2Digits(similarity_threshold=0.8, disk_cache=cache)
+        uncached = Text2Digits(similarity_threshold=0.8)
+        for texts in [["twentyy one", "thirtyy"], ["twentyy one", "fourr"]]:
+            assert t2d.convert_batch(texts) == uncached.convert_batch(texts)
+        assert len(cache) == 3
+
+    def test_cached_results_are_used(self, cache):
+        t2d = Text2Digits(disk_cache=cache)
+        (key,) = cache.keys(["twenty one"], t2d._config())
+        cache.set_many([(key, "cached")])
+        assert t2d.convert("twenty one") == "cached"
+
+    def test_keys_depend_on_config_and_version(self, tmp_path, cache):
+        Text2Digits(disk_cache=cache).convert("the fifth")
+        assert Text2Digits(disk_cache=cache, add_ordinal_ending=True).convert("the fifth") == "the 5th"
+        assert len(cache) == 2
+
+        other_version = DiskCache(tmp_path / "cache.sqlite", version="0.0.0")
+        assert other_version.get_many(other_version.keys(["the fifth"], Text2Digits()._config())) == {}
+        other_version.close()
+
+    def test_persistent(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        first = DiskCache(path)
+        Text2Digits(disk_cache=first).convert_batch(TEXTS)
+        first.close()
+
+        second = DiskCache(path)
+        assert len(second) == 4
+        second.close()
+
+
+class TestDiskCache:
+    def test_many_keys(self, cache):
+        keys = cache.keys([str(i) for i in range(2000)], {})
+        cache.set_many([(key, str(i)) for i, key in enumerate(keys)])
+        assert cache.get_many(keys) == {key: str(i) for i, key in enumerate(keys)}
+        assert cache.get_many(cache.keys(["missing"], {})) == {}
+
+    def test_size_and_clear(self, cache):
+        (key,) = cache.keys(["one"], {})
+        cache.set_many([(key, "1")])
+        assert cache.size() == 32 + 1
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size() == 0
+
+    def test_prune_removes_least_recently_used(self, cache, monkeypatch):
+        clock = FakeClock(1000.0)
+        monkeypatch.setattr(disk_cache_module, "time", clock)
+        first, second, third = cache.keys(["first", "second", "third"], {})
+
+        cache.set_many([(first, "x" * 100)])
+        clock.now += 2 * disk_cache_module._TOUCH_INTERVAL
+        cache.set_many([(second, "x" * 100), (third, "x" * 100)])
+        clock.now += 2 * disk_cache_module._TOUCH_INTERVAL
+        # Reading an entry makes it recently used
+        cache.get_many([first, third])
+
+        assert cache.prune(max_bytes=cache.size()) == 0
+        assert cache.prune(max_bytes=300) == 1
+        assert set(cache.get_many([first, second, third])) == {first, third}
+
+    def test_automatic_pruning(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite", max_bytes=5000)
+        keys = cache.keys([str(i) for i in range(200)], {})
+        for key in keys:
+            cache.set_many([(key, "x" * 68)])
+            assert cache.size() <= 5000 + 100
+
+        assert cache.get_many(keys[-10:]).keys() == set(keys[-10:])
+        cache.close()
+
+    def test_threads(self, cache):
+        t2d = Text2Digits(disk_cache=cache)
+        texts = [f"{tens} one" for tens in ["twenty", "thirty", "forty", "fifty"]] * 10
+        results = []
+
+        def convert():
+            results.append(t2d.convert_batch(texts))
+
+        threads = [threading.Thread(target=convert) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [["21", "31", "41", "51"] * 10] * 4
+        assert len(cache) == 4
+
+    def test_processes(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        DiskCache(path).close()
+        batches = [[f"{tens} {units}" for units in ["one", "two", "three"]] for tens in ["twenty", "thirty"]] * 4
+
+        with ProcessPoolExecutor(2) as executor:
+            results = list(executor.map(convert_in_process, [path] * len(batches), batches))
+
+        assert results == [Text2Digits().convert_batch(batch) for batch in batches]
+        cache = DiskCache(path)
+        assert len(cache) == 6
+        cache.close()
+
+    def test_invalid_max_bytes(self, tmp_path):
+        with pytest.raises(ValueError):
+            DiskCache(tmp_path / "cache.sqlite", max_bytes=0)
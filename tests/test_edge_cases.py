@@ -50,6 +50,32 @@ class TestSplitGlues:
         pairs = list(split_glues("one two"))
         assert pairs[0][1] == " "
 
+    def test_punctuation_directly_after_glue_is_not_a_separator(self):
+        """A separator at the start of the remaining text has no preceding character and is kept in the word."""
+        assert list(split_glues("forty--two")) == [("forty", "-"), ("-two", "")]
+        assert list(split_glues("a. .b")) == [("a", "."), ("", " "), (".b", "")]
+
+    def test_custom_separator(self):
+        assert list(split_glues("one|two", separator=r"\|")) == [("one", "|"), ("two", "")]
+
+    def test_pairs_reconstruct_the_input(self):
+        text = "He said: forty-two, then... twenty_one;  done.\n"
+        assert "".join(word + glue for word, glue in split_glues(text)) == text
+
+
+class TestOutputRendering:
+    def test_untouched_text_is_preserved(self):
+        text = "  Spaces,   tabs\tand newlines\n are kept. twenty one.\n"
+        assert text2digits.Text2Digits().convert(text) == "  Spaces,   tabs\tand newlines\n are kept. 21.\n"
+
+    def test_token_offsets(self):
+        tokens = text2digits.Text2Digits()._lex("one  two-three")
+        assert [token.start for token in tokens] == [0, 5, 9]
+
+    def test_corrected_word_is_rendered(self):
+        """Spelling corrections are part of the output, even when the corrected word ends up as an OTHER token."""
+        assert text2digits.Text2Digits(similarity_threshold=0.5).convert("ant foo") == "and foo"
+
 
 class TestSimilarityThresholdBoundary:
     def test_exact_threshold_match_is_accepted(self):
@@ -179,3 +179,41 @@ class TestNegativeDecimalCombined:
 
     def test_negative_decimal_in_sentence(self):
         assert convert("the delta is negative zero point one") == "the delta is -0.1"
+
+
+# ---------------------------------------------------------------------------
+# Disabled features
+# ---------------------------------------------------------------------------
+
+
+class TestDisabledFeatures:
+    @pytest.mark.parametrize(
+        "text, kwargs, expected",
+        [
+            ("negative five", {"negation": False}, "negative 5"),
+            ("minus twenty one", {"negation": False}, "minus 21"),
+            ("three point one four", {"decimal_words": False}, "3 point 14"),
+            ("three point one four", {"decimal_words": False, "concatenate": False}, "3 point 1 4"),
+            ("twenty ten", {"concatenate": False}, "20 10"),
+            ("one hundred and five", {"conjunctions": False}, "100 and 5"),
+            ("one hundred and five", {"concatenate": False}, "105"),
+            ("negative three point five", {"negation": False, "decimal_words": False}, "negative 3 point 5"),
+        ],
+    )
+    def test_conversion(self, text, kwargs, expected):
+        t2d = Text2Digits(**kwargs)
+        assert t2d.convert(text) == expected
+        assert t2d.convert_bytes(text.encode()) == expected.encode()
+        assert Text2Digits(windowed=True, **kwargs).convert(text) == expected
+
+    def test_enabled_by_default(self):
+        assert convert("negative three point five and one hundred and five. twenty ten") == "-3.5 and 105. 2010"
+
+    def test_disabled_words_are_other_tokens(self):
+        tokens = Text2Digits(negation=False, conjunctions=False)._lex("minus one and two")
+        assert [token.type for token in tokens] == [WordType.OTHER, WordType.UNITS, WordType.OTHER, WordType.UNITS]
+
+    def test_parallel(self):
+        text = "the first one hundred and five of negative three point five apples. " * 4000
+        t2d = Text2Digits(negation=False, decimal_words=False, concatenate=False, conjunctions=False)
+        assert t2d.convert(text, workers=2) == t2d.convert(text)
@@ -0,0 +1,127 @@
+"""
+Checks that the caches are bounded, that converting does not leak memory and that the peak memory of the pipeline stages stays within a budget per token (see benchmarks/bench_memory.py for the measurements).
+"""
+
+import gc
+import random
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+import pytest
+
+from text2digits import Text2Digits
+from text2digits.tokens_basic import WORD_CLASS_CACHE_SIZE, WordType, word_class
+
+UNITS = "one two three four five six seven eight nine".split()
+TENS = "twenty thirty forty fifty sixty seventy eighty ninety".split()
+
+# Peak bytes per token of each stage (about twice the measured values)
+BUDGETS = {"lex": 220, "rules": 120, "convert": 260}
+
+
+def traced(func: Callable[[], Any]) -> Tuple[Any, int, int]:
+    """
+    Returns the result of func, the peak number of bytes allocated during the call and the number of bytes which are still allocated afterwards.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return result, peak, retained
+
+
+def number_document(n_words: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words = []
+    for _ in range(n_words):
+        if rng.random() < 0.5:
+            words.append(f"{rng.choice(TENS)} {rng.choice(UNITS)} hundred and {rng.choice(UNITS)}")
+        else:
+            words.append(rng.choice(["apples", "pears", "the", "of", "in", "2.5", "1,000"]))
+
+    return " ".join(words)
+
+
+class TestCaches:
+    def test_phrase_cache_is_bounded(self):
+        t2d = Text2Digits(phrase_cache_size=8)
+        for tens in TENS:
+            for units in UNITS:
+                t2d.convert(f"{tens} {units} apples")
+
+        assert t2d._phrase_cache is not None
+        assert len(t2d._phrase_cache) == 8
+
+    def test_word_class_cache_is_bounded(self):
+        assert word_class.cache_info().maxsize == WORD_CLASS_CACHE_SIZE
+
+    def test_no_leak(self):
+        t2d = Text2Digits(phrase_cache_size=64)
+        documents = [number_document(100, seed) for seed in range(10)]
+
+        def convert_all():
+            for document in documents:
+                t2d.convert(document)
+                t2d.convert_bytes(document.encode())
+
+        # Fill the caches first
+        convert_all()
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            convert_all()
+            gc.collect()
+            before = tracemalloc.get_traced_memory()[0]
+            for _ in range(3):
+                convert_all()
+            gc.collect()
+            after = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        assert after - before < 16 * 1024
+
+
+@pytest.fixture(scope="module")
+def text():
+    return number_document(4000)
+
+
+class TestPeakMemory:
+    def test_lex(self, text):
+        tokens, peak, _ = traced(lambda: Text2Digits()._lex(text))
+        assert peak / len(tokens) < BUDGETS["lex"]
+
+    def test_rules(self, text):
+        t2d = Text2Digits()
+        tokens = t2d._lex(text)
+        runs = [[]]
+        for token in tokens:
+            if token.type == WordType.OTHER:
+                runs.append([])
+            else:
+                runs[-1].append(token)
+
+        def apply_rules():
+            results = []
+            for run in runs:
+                for rule in t2d._rules:
+                    run = t2d._apply_rule(rule, run)
+                results.append(run)
+            return results
+
+        _, peak, _ = traced(apply_rules)
+        assert peak / len(tokens) < BUDGETS["rules"]
+
+    def test_convert(self, text):
+        t2d = Text2Digits(phrase_cache_size=0)
+        n_tokens = len(t2d._lex(text))
+        _, peak, retained = traced(lambda: t2d.convert(text))
+        assert peak / n_tokens < BUDGETS["convert"]
+        # Only the result is retained
+        assert retained < 2 * len(text) + 4096
@@ -0,0 +1,118 @@
+import threading
+
+import pytest
+
+from text2digits import MetricsRegistry, Text2Digits
+
+
+class TestConverterMetrics:
+    def test_no_metrics_by_default(self):
+        assert Text2Digits().metrics is None
+
+    def test_counters(self):
+        metrics = MetricsRegistry()
+        t2d = Text2Digits(metrics=metrics)
+        assert t2d.convert("I am twenty one and my sister is three point five") == "I am 21 and my sister is 3.5"
+        assert t2d.convert("no numbers here") == "no numbers here"
+
+        snapshot = metrics.snapshot()
+        assert snapshot["calls"] == 2
+        assert snapshot["bytes"] == len("I am twenty one and my sister is three point five") + len("no numbers here")
+        assert snapshot["tokens"] == 11 + 3
+        assert snapshot["numbers"] == 2
+
+    def test_bytes_are_counted_in_utf8(self):
+        metrics = MetricsRegistry()
+        Text2Digits(metrics=metrics).convert("fünf")
+        assert metrics.snapshot()["bytes"] == 5
+
+    def test_corrections(self):
+        metrics = MetricsRegistry()
+        assert Text2Digits(similarity_threshold=0.8, metrics=metrics).convert("twentyy one") == "21"
+        assert metrics.snapshot()["corrections"] == 1
+
+    def test_shared_registry(self):
+        metrics = MetricsRegistry()
+        Text2Digits(metrics=metrics).convert("one")
+        Text2Digits(metrics=metrics, convert_ordinals=False).convert("two")
+        assert metrics.snapshot()["calls"] == 2
+
+    def test_latency_histogram_by_input_size(self):
+        metrics = MetricsRegistry(size_buckets=(10, 100))
+        t2d = Text2Digits(metrics=metrics)
+        t2d.convert("one")
+        t2d.convert("one " * 10)
+        t2d.convert("one " * 100)
+
+        latency = metrics.snapshot()["latency"]
+        assert list(latency) == ["10", "100", "+Inf"]
+        assert [histogram["count"] for histogram in latency.values()] == [1, 1, 1]
+        assert latency["10"]["buckets"]["+Inf"] == 1
+        assert latency["10"]["sum"] > 0
+
+    def test_thread_safety(self):
+        metrics = MetricsRegistry()
+        t2d = Text2Digits(metrics=metrics)
+
+        def work():
+            for _ in range(200):
+                t2d.convert("twenty one")
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert metrics.snapshot()["calls"] == 800
+        assert metrics.snapshot()["numbers"] == 800
+
+
+class TestRegistry:
+    def test_cache_hit_rate(self):
+        metrics = MetricsRegistry()
+        metrics.observe_cache("phrase", hits=3, misses=1)
+        metrics.observe_cache("phrase", misses=4)
+        assert metrics.snapshot()["caches"] == {"phrase": {"hits": 3, "misses": 5, "hit_rate": 3 / 8}}
+
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = MetricsRegistry(latency_buckets=(0.1, 1.0), size_buckets=())
+        for seconds in (0.05, 0.5, 0.5, 5.0):
+            metrics.observe_call(1, 1, 0, 0, seconds)
+
+        histogram = metrics.snapshot()["latency"]["+Inf"]
+        assert histogram["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+        assert histogram["count"] == 4
+        assert histogram["sum"] == pytest.approx(6.05)
+
+    def test_reset(self):
+        metrics = MetricsRegistry()
+        metrics.observe_call(10, 2, 1, 0, 0.001)
+        metrics.observe_cache("phrase", hits=1)
+        metrics.reset()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["calls"] == 0
+        assert snapshot["caches"] == {}
+
+    def test_unsorted_buckets_are_rejected(self):
+        with pytest.raises(ValueError):
+            MetricsRegistry(latency_buckets=(1.0, 0.1))
+
+    def test_prometheus_format(self):
+        metrics = MetricsRegistry(latency_buckets=(0.1,), size_buckets=(100,))
+        metrics.observe_call(10, 2, 1, 0, 0.05)
+        metrics.observe_cache("phrase", hits=2, misses=1)
+
+        lines = metrics.to_prometheus().splitlines()
+        assert "# TYPE text2digits_calls_total counter" in lines
+        assert "text2digits_calls_total 1" in lines
+        assert "text2digits_numbers_total 1" in lines
+        assert 'text2digits_cache_lookups_total{cache="phrase",result="hit"} 2' in lines
+        assert "# TYPE text2digits_convert_duration_seconds histogram" in lines
+        assert 'text2digits_convert_duration_seconds_bucket{input_bytes="100",le="0.1"} 1' in lines
+        assert 'text2digits_convert_duration_seconds_bucket{input_bytes="+Inf",le="+Inf"} 0' in lines
+        assert 'text2digits_convert_duration_seconds_count{input_bytes="100"} 1' in lines
+
+    def test_prometheus_prefix(self):
+        assert "myapp_calls_total 0" in MetricsRegistry().to_prometheus(prefix="myapp").splitlines()
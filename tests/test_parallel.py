@@ -0,0 +1,98 @@
+import pytest
+
+from text2digits import MetricsRegistry, Text2Digits
+
+PARAGRAPH = (
+    "The meeting started at nine thirty and twenty one people joined. "
+    "We sold one hundred and fifty apples, the third batch of two thousand twenty four; "
+    "negative five degrees and three point one four were mentioned twice.\n"
+)
+
+
+@pytest.fixture(scope="module")
+def long_text():
+    return PARAGRAPH * 700  # about 150,000 characters, i.e. more than two chunks
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"add_ordinal_ending": True}, {"similarity_threshold": 0.8}])
+def test_same_result_as_sequential(long_text, kwargs):
+    t2d = Text2Digits(**kwargs)
+    assert t2d.convert(long_text, workers=2) == t2d.convert(long_text)
+
+
+def test_short_text_is_converted_in_process():
+    assert Text2Digits().convert("twenty one", workers=4) == "21"
+
+
+def test_text_without_safe_cut_is_converted_in_process():
+    # Only number words, so there is no position where the text could be split
+    text = "one two three " * 20_000
+    t2d = Text2Digits()
+    assert t2d.convert(text, workers=2) == t2d.convert(text)
+    assert t2d._executor is None
+
+
+def test_worker_pool_is_reused(long_text):
+    t2d = Text2Digits()
+    try:
+        expected = t2d.convert(long_text)
+        assert t2d.convert(long_text, workers=2) == expected
+        executor = t2d._executor
+        assert t2d.convert(long_text, workers=2) == expected
+        assert t2d._executor is executor
+
+        assert t2d.convert(long_text, workers=3) == expected
+        assert t2d._executor is not executor
+    finally:
+        t2d.close()
+
+    assert t2d._executor is None
+    # The workers are started again after close()
+    assert t2d.convert(long_text, workers=2) == expected
+    t2d.close()
+
+
+def test_metrics(long_text):
+    parallel_metrics = MetricsRegistry()
+    Text2Digits(metrics=parallel_metrics).convert(long_text, workers=2)
+    sequential_metrics = MetricsRegistry()
+    Text2Digits(metrics=sequential_metrics).convert(long_text)
+
+    for name in ["calls", "bytes", "tokens", "numbers"]:
+        assert parallel_metrics.snapshot()[name] == sequential_metrics.snapshot()[name]
+
+
+def test_invalid_workers():
+    with pytest.raises(ValueError):
+        Text2Digits().convert("one", workers=0)
+
+
+def test_budget_with_workers():
+    with pytest.raises(ValueError):
+        Text2Digits().convert("one", max_tokens=10, workers=2)
+
+
+class TestSplitSafely:
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "two apples and three pears " * 20,
+            "one two three four five six seven " * 20,
+            "I saw forty-two and, twenty one. and sixty-six " * 20,
+            "first and second and third " * 20,
+        ],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 7, 30])
+    def test_chunks_convert_independently(self, text, chunk_size):
+        t2d = Text2Digits()
+        chunks = t2d._split_safely(text, chunk_size)
+        assert "".join(chunks) == text
+        assert "".join(t2d.convert(chunk) for chunk in chunks) == t2d.convert(text)
+
+    def test_cuts_after_other_words(self):
+        chunks = Text2Digits()._split_safely("two apples and three pears and four", 1)
+        assert chunks == ["two apples ", "and three pears ", "and four"]
+
+    def test_no_safe_cut(self):
+        text = "one two three four five six seven eight nine ten"
+        assert Text2Digits()._split_safely(text, 5) == [text]
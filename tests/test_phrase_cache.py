@@ -0,0 +1,55 @@
+import pytest
+
+from text2digits import MetricsRegistry, Text2Digits
+
+TEXTS = [
+    "twenty one apples and twenty one pears",
+    "Twenty one. twenty one, twenty-one",
+    "one hundred and fifty, one hundred and fifty one",
+    "the third and the fifth",
+    "negative five and five and minus five",
+    "three point one four is not three",
+]
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"convert_ordinals": False}, {"add_ordinal_ending": True}, {"windowed": True}])
+def test_same_result_as_uncached(kwargs):
+    cached = Text2Digits(**kwargs)
+    uncached = Text2Digits(**kwargs, phrase_cache_size=0)
+    for _ in range(2):
+        for text in TEXTS:
+            assert cached.convert(text) == uncached.convert(text)
+            assert cached.convert_bytes(text.encode()) == uncached.convert_bytes(text.encode())
+
+
+def test_glue_of_the_last_word_is_not_part_of_the_key():
+    metrics = MetricsRegistry()
+    t2d = Text2Digits(metrics=metrics)
+    assert t2d.convert("twenty one. twenty one, twenty one") == "21. 21, 21"
+    assert metrics.snapshot()["caches"]["phrase"] == {"hits": 2, "misses": 1, "hit_rate": 2 / 3}
+    assert metrics.snapshot()["numbers"] == 3
+
+
+def test_size_is_bounded():
+    t2d = Text2Digits(phrase_cache_size=3)
+    for text in ["one", "two", "three", "four", "five", "one"]:
+        t2d.convert(text)
+    assert list(t2d._phrase_cache) == ["four", "five", "one"]
+
+
+def test_long_runs_are_not_cached():
+    t2d = Text2Digits()
+    t2d.convert("one " * 100)
+    assert not t2d._phrase_cache
+
+
+def test_disabled():
+    metrics = MetricsRegistry()
+    t2d = Text2Digits(metrics=metrics, phrase_cache_size=0)
+    assert t2d.convert("twenty one. twenty one") == "21. 21"
+    assert metrics.snapshot()["caches"] == {}
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        Text2Digits(phrase_cache_size=-1)
@@ -0,0 +1,179 @@
+import csv
+import io
+import json
+
+import pytest
+
+from text2digits import DiskCache, Text2Digits
+from text2digits.records import RecordConverter, RecordStats, main
+
+CSV = 'id,comment,notes\r\n1,twenty one apples,one\r\n2,"no numbers, really",\r\n3,twenty one apples,the fifth\r\n4\r\n'
+
+JSONL = (
+    '{"id": 1, "text": "twenty one", "messages": [{"body": "two hundred", "id": "three"}]}\n'
+    "\n"
+    '{"id": 2, "text": "no numbers",   "extra": "one"}\n'
+    '{"id": 3, "text": 5, "messages": [{"body": "the fifth"}, {"body": "naïve six"}, "seven"]}\r\n'
+    '{"id": 4, "messages": {"a": {"body": "eight"}}}'
+)
+
+
+def convert_csv(text, fields, converter=None, **kwargs):
+    target = io.StringIO(newline="")
+    with converter or RecordConverter() as converter:
+        stats = converter.convert_csv(io.StringIO(text, newline=""), target, fields, **kwargs)
+    return target.getvalue(), stats
+
+
+def convert_jsonl(text, fields, converter=None):
+    target = io.StringIO(newline="")
+    with converter or RecordConverter() as converter:
+        stats = converter.convert_jsonl(io.StringIO(text, newline=""), target, fields)
+    return target.getvalue(), stats
+
+
+class TestCsv:
+    def test_columns(self):
+        output, stats = convert_csv(CSV, ["comment"])
+        rows = list(csv.reader(io.StringIO(output, newline="")))
+        assert rows == [
+            ["id", "comment", "notes"],
+            ["1", "21 apples", "one"],
+            ["2", "no numbers, really", ""],
+            ["3", "21 apples", "the fifth"],
+            ["4"],
+        ]
+        assert stats[:4] == (4, 3, 2, 2)
+
+    def test_quoted_values(self):
+        output, _ = convert_csv(CSV, ["comment", "notes"])
+        assert output.splitlines()[2] == CSV.splitlines()[2]
+
+    def test_without_header(self):
+        output, stats = convert_csv("twenty,two\r\nthree,four\r\n", ["1"], header=False)
+        assert output == "twenty,2\r\nthree,4\r\n"
+        assert stats.records == 2
+
+    def test_duplicate_columns(self):
+        output, stats = convert_csv("a,b\r\ntwenty one,x\r\n", ["a", "a"])
+        assert output == "a,b\r\n21,x\r\n"
+        assert stats.fields == 1
+
+    @pytest.mark.parametrize("fields", [["0", "0"], ["0", "-2"], ["-2", "0", "-2"]])
+    def test_aliased_indices(self, fields):
+        output, stats = convert_csv("twenty one,two\r\nthree\r\n", fields, header=False)
+        assert output == "21,two\r\n3\r\n"
+        assert stats.fields == 2
+
+    def test_negative_index(self):
+        output, _ = convert_csv("x,one\r\ny,z,two\r\n", ["-1"], header=False)
+        assert output == "x,1\r\ny,z,2\r\n"
+
+    def test_delimiter(self):
+        output, _ = convert_csv("a;b\r\none;two, three\r\n", ["b"], delimiter=";")
+        assert output == "a;b\r\none;2, 3\r\n"
+
+    def test_unknown_column(self):
+        with pytest.raises(ValueError, match="missing"):
+            convert_csv(CSV, ["comment", "missing"])
+
+    def test_empty_input(self):
+        assert convert_csv("", ["comment"]) == ("", RecordStats(0, 0, 0, 0, 0.0))
+
+
+class TestJsonl:
+    def test_paths(self):
+        output, stats = convert_jsonl(JSONL, ["text", "messages.*.body"])
+        lines = output.splitlines(keepends=True)
+        assert lines[0] == '{"id": 1, "text": "21", "messages": [{"body": "200", "id": "three"}]}\n'
+        # Blank lines and records without changes are written as they are
+        assert lines[1:3] == JSONL.splitlines(keepends=True)[1:3]
+        assert lines[3] == '{"id": 3, "text": 5, "messages": [{"body": "the 5"}, {"body": "naïve 6"}, "seven"]}\r\n'
+        assert json.loads(lines[4]) == {"id": 4, "messages": {"a": {"body": "8"}}}
+        assert not lines[4].endswith("\n")
+        assert stats[:4] == (5, 6, 6, 5)
+
+    def test_list_index(self):
+        output, _ = convert_jsonl(JSONL, ["messages.2", "messages.1.body", "messages.5"])
+        assert json.loads(output.splitlines()[3])["messages"] == [{"body": "the fifth"}, {"body": "naïve 6"}, "7"]
+
+    def test_overlapping_paths(self):
+        # "*" also matches "text", which is converted once
+        output, stats = convert_jsonl('{"text": "one hundred", "n": "two"}\n', ["text", "*"])
+        assert output == '{"text": "100", "n": "2"}\n'
+        assert stats.fields == 2
+
+    def test_invalid_json(self):
+        with pytest.raises(ValueError, match="Line 2"):
+            convert_jsonl('{"text": "one"}\n{"text": \n', ["text"])
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_batch_size(batch_size):
+    expected, _ = convert_jsonl(JSONL, ["text", "messages.*.body"])
+    assert convert_jsonl(JSONL, ["text", "messages.*.body"], RecordConverter(batch_size=batch_size))[0] == expected
+
+
+def test_duplicates_are_converted_once():
+    text = "comment\r\n" + "twenty one\r\n" * 100
+    output, stats = convert_csv(text, ["comment"], RecordConverter(batch_size=50))
+    assert output == "comment\r\n" + "21\r\n" * 100
+    assert (stats.fields, stats.unique, stats.changed) == (100, 2, 100)
+
+
+def test_options():
+    t2d = Text2Digits(add_ordinal_ending=True, similarity_threshold=0.8)
+    output, _ = convert_jsonl('{"text": "the fifth of twentyy"}\n', ["text"], RecordConverter(t2d))
+    assert output == '{"text": "the 5th of 20"}\n'
+
+
+def test_workers(tmp_path):
+    t2d = Text2Digits(add_ordinal_ending=True, disk_cache=DiskCache(tmp_path / "cache.sqlite"))
+    words = ["one", "two", "three", "four", "five"]
+    text = "".join(f'{{"id": {i}, "text": "the fifth or twenty {words[i % 5]}"}}\n' for i in range(50))
+    expected, _ = convert_jsonl(text, ["text"], RecordConverter(Text2Digits(add_ordinal_ending=True)))
+
+    output, stats = convert_jsonl(text, ["text"], RecordConverter(t2d, batch_size=4, workers=2))
+    assert output == expected
+    assert stats.records == 50
+    # The workers wrote their results to the disk cache of the configuration
+    keys = t2d.disk_cache.keys(["the fifth or twenty three"], t2d._config())
+    assert list(t2d.disk_cache.get_many(keys).values()) == ["the 5th or 23"]
+
+
+def test_progress():
+    reports = []
+    convert_csv(CSV, ["comment"], RecordConverter(batch_size=2, progress=reports.append))
+    assert [stats.records for stats in reports] == [2, 4]
+    assert reports[-1].records_per_second > 0
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        RecordConverter(batch_size=0)
+    with pytest.raises(ValueError):
+        RecordConverter(workers=-1)
+
+
+def test_main(tmp_path, capsys):
+    with open(tmp_path / "input.csv", "w", encoding="utf-8", newline="") as file:
+        file.write(CSV)
+    main(["csv", "--fields", "comment,notes", str(tmp_path / "input.csv"), str(tmp_path / "output.csv")])
+
+    with open(tmp_path / "output.csv", encoding="utf-8", newline="") as file:
+        assert file.read().split("\r\n")[1] == "1,21 apples,1"
+    assert "4 records" in capsys.readouterr().err
+
+    with pytest.raises(SystemExit):
+        main(["csv", "--fields", "missing", str(tmp_path / "input.csv"), str(tmp_path / "output.csv")])
+
+
+def test_main_feature_flags(tmp_path, capsys):
+    with open(tmp_path / "input.jsonl", "w", encoding="utf-8") as file:
+        file.write(json.dumps({"text": "minus three point five, one hundred and five, twenty ten"}) + "\n")
+
+    flags = ["--no-negation", "--no-decimal-words", "--no-concatenate", "--no-conjunctions"]
+    main(["jsonl", "--fields", "text", *flags, str(tmp_path / "input.jsonl"), str(tmp_path / "output.jsonl")])
+
+    with open(tmp_path / "output.jsonl", encoding="utf-8") as file:
+        assert json.loads(file.read()) == {"text": "minus 3 point 5, 100 and 5, 20 10"}
@@ -37,6 +37,37 @@ def test_parser_concatenation_rule():
         assert rule.action(tokens[:expected_count]).text() == expected_text
 
 
+@pytest.mark.parametrize("rule", [CombinationRule(), ConcatenationRule()])
+def test_match_with_start_index(rule):
+    """Matching from a start index is the same as matching the suffix of the tokens."""
+    tokens = text2digits.Text2Digits()._lex("one two hundred and five thousand twenty one and ninety")
+    for start in range(len(tokens) + 1):
+        assert rule.match(tokens, start) == rule.match(tokens[start:])
+
+
+class TestRuleTokens:
+    def test_word_raw_keeps_the_inner_glue(self):
+        tokens = text2digits.Text2Digits()._lex("Two-Hundred-Thousandth, later")
+        token = CombinationRule().action(tokens[:3])
+        assert token.word_raw == "Two-Hundred-Thousandth"
+        assert token.glue == ","
+        assert token.ordinal_ending == "th"
+
+    def test_is_ordinal(self):
+        t2d = text2digits.Text2Digits()
+        assert CombinationRule().action(t2d._lex("twenty first")).is_ordinal()
+        assert not CombinationRule().action(t2d._lex("twenty one")).is_ordinal()
+
+        combined = CombinationRule().action(t2d._lex("thirty second"))
+        concatenated = ConcatenationRule().action([Token("one", " "), combined])
+        assert concatenated.is_ordinal()
+        assert concatenated.word_raw == "one thirty second"
+
+    def test_no_instance_dict(self):
+        token = CombinationRule().action(text2digits.Text2Digits()._lex("twenty one"))
+        assert not hasattr(token, "__dict__")
+
+
 class TestMatchType:
     def test_match_type_is_module_level(self):
         """MatchType must be importable at module level, not recreated per call."""
@@ -0,0 +1,113 @@
+import ast
+import random
+from pathlib import Path
+from typing import List, Tuple
+
+import pytest
+
+from text2digits import Text2Digits
+from text2digits.text_processing_helpers import split_glues
+from text2digits.tokens_basic import OtherWordClass, Token, WordType, word_class
+from text2digits.vocabulary import number_words, scan, similar_number_word
+
+
+def reference_lex(t2d: Text2Digits, text: str) -> List[Token]:
+    """
+    The tokenization of _lex() built on split_glues() and the classification of each word.
+    """
+    tokens = []
+    conjunctions = []
+    offset = 0
+    for i, (word, glue) in enumerate(split_glues(text)):
+        start = offset
+        offset += len(word) + len(glue)
+        if t2d.similarity_threshold != 1:
+            word = similar_number_word(word, t2d.similarity_threshold) or word
+
+        token = Token(word, glue, start)
+        if token.type in t2d._disabled_types:
+            token.type = WordType.OTHER
+        tokens.append(token)
+        if token.type == WordType.CONJUNCTION:
+            conjunctions.append(i)
+
+    t2d._resolve_conjunctions(tokens, conjunctions)
+
+    return tokens
+
+
+def token_stream(tokens: List[Token]) -> List[Tuple[str, str, int, WordType]]:
+    return [(token.word_raw, token.glue, token.start, token.type) for token in tokens]
+
+
+def suite_texts() -> List[str]:
+    """
+    Returns all string literals of the test suite.
+    """
+    texts = set()
+    for path in Path(__file__).parent.glob("test_*.py"):
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                texts.add(node.value)
+
+    return sorted(texts)
+
+
+PIECES = [" ", "  ", "\n", "\t", "\x1c", "\xa0", " ", ".", ",", ";", ":", "-", "_", "'", "!", "(", "5", "٣", "½"]
+PIECES += ["1,000", "2.5", "a", "Z", "İ", "K", "ſ", "é", "TWENTY", "Fifth", "twen,ty", "laKh", "ſix"]
+PIECES += sorted(number_words())
+
+CONFIGS = [{}, {"similarity_threshold": 0.8}, {"negation": False, "decimal_words": False, "conjunctions": False}]
+
+
+@pytest.mark.parametrize("kwargs", CONFIGS)
+def test_same_tokens_on_suite_texts(kwargs):
+    t2d = Text2Digits(**kwargs)
+    for text in suite_texts():
+        assert token_stream(t2d._lex(text)) == token_stream(reference_lex(t2d, text)), text
+
+
+@pytest.mark.parametrize("kwargs", CONFIGS)
+def test_same_tokens_on_random_texts(kwargs):
+    rng = random.Random(0)
+    t2d = Text2Digits(**kwargs)
+    for _ in range(2000):
+        text = "".join(rng.choice(PIECES) for _ in range(rng.randint(0, 12)))
+        assert token_stream(t2d._lex(text)) == token_stream(reference_lex(t2d, text)), text
+
+
+def test_kinds():
+    assert list(scan("Twentieth apples, 1,000 and 2.5 naïve -5")) == [
+        ("number", "Twentieth", " "),
+        ("other", "apples", ","),
+        ("word", "", " "),
+        ("word", "1,000", " "),
+        ("number", "and", " "),
+        ("literal", "2.5", " "),
+        ("word", "naïve", " "),
+        ("word", "-5", ""),
+    ]
+    assert list(scan("twenty-one")) == [("number", "twenty", "-"), ("number", "one", "")]
+    assert list(scan("")) == []
+
+
+def test_other_words_are_never_numbers():
+    words = [word for text in PIECES for word in [text, text.upper(), text.title(), text + "s", "x" + text]]
+    for kind, word, _ in scan(" ".join(words)):
+        if kind == "other":
+            assert word_class(word).type == WordType.OTHER, word
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"similarity_threshold": 0.8}])
+def test_other_words_are_not_classified(kwargs):
+    t2d = Text2Digits(**kwargs)
+    text = "Zebras quizzed 21 Xylophones and twenty one"
+    t2d._lex(text)
+    misses = word_class.cache_info().misses
+
+    tokens = t2d._lex(text.replace("Zebras", "Zebrasx"))
+    assert word_class.cache_info().misses == misses
+    others = [type(token.word_class) is OtherWordClass for token in tokens]
+    assert others == [True, True, False, True, False, False, False]
+    assert tokens[0].word_raw == "Zebrasx"
+    assert tokens[0].type == WordType.OTHER
@@ -0,0 +1,161 @@
+import http.client
+import io
+import json
+import sys
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from text2digits import Text2Digits
+from text2digits.serve import Batcher, ConversionServer, main
+
+TEXTS = ["twenty one", "I was born in nineteen sixty four", "the third day", "no numbers", ""]
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ConversionServer(("127.0.0.1", 0), Batcher(workers=0, max_wait=0.05), max_body_size=1024)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.close()
+
+
+def request(server, method, path, body=None, headers=None):
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=10)
+    try:
+        connection.request(method, path, body, headers or {})
+        response = connection.getresponse()
+        return response.status, response.getheader("Content-Type"), response.read()
+    finally:
+        connection.close()
+
+
+class TestBatcher:
+    def test_in_process(self):
+        batcher = Batcher(workers=0)
+        try:
+            assert batcher.submit(TEXTS).result() == Text2Digits().convert_batch(TEXTS)
+        finally:
+            batcher.close()
+
+    def test_worker_process(self):
+        batcher = Batcher({"add_ordinal_ending": True}, workers=1)
+        try:
+            assert batcher.submit(TEXTS).result() == Text2Digits(add_ordinal_ending=True).convert_batch(TEXTS)
+            assert batcher.stats()["conversion"]["calls"] == len(TEXTS)
+        finally:
+            batcher.close()
+
+    def test_concurrent_requests_are_merged(self):
+        batcher = Batcher(workers=0, max_batch_size=1000, max_wait=0.5)
+        try:
+            futures = [batcher.submit([text]) for text in TEXTS]
+            assert [future.result()[0] for future in futures] == Text2Digits().convert_batch(TEXTS)
+
+            stats = batcher.stats()
+            assert stats["requests"] == stats["texts"] == len(TEXTS)
+            assert stats["batches"] < len(TEXTS)
+        finally:
+            batcher.close()
+
+    def test_max_batch_size(self):
+        batcher = Batcher(workers=0, max_batch_size=2, max_wait=0.5)
+        try:
+            futures = [batcher.submit([text]) for text in TEXTS]
+            for future in futures:
+                future.result()
+            assert batcher.stats()["largest_batch"] <= 2
+        finally:
+            batcher.close()
+
+    def test_recovers_from_dead_worker(self):
+        batcher = Batcher(workers=1)
+        try:
+            assert batcher.submit(["one"]).result() == ["1"]
+            for process in list(batcher._executor._processes.values()):
+                process.kill()
+                process.join()
+
+            # The batch which was in flight when the worker died may fail, the later ones are converted by a new worker
+            try:
+                batcher.submit(["two"]).result()
+            except BrokenProcessPool:
+                pass
+            assert batcher.submit(["twenty one"]).result() == ["21"]
+            assert batcher.stats()["restarts"] == 1
+        finally:
+            batcher.close()
+
+    def test_submit_after_close(self):
+        batcher = Batcher(workers=0)
+        batcher.close()
+        with pytest.raises(RuntimeError):
+            batcher.submit(["one"])
+        batcher.close()
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"workers": -1}, {"max_batch_size": 0}, {"max_wait": -1}, {"config": {"similarity_threshold": 2}}]
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            Batcher(**kwargs)
+
+
+class TestServer:
+    def test_plain_text(self, server):
+        status, content_type, body = request(server, "POST", "/convert", b"twenty one apples")
+        assert status == 200
+        assert content_type.startswith("text/plain")
+        assert body.decode("utf-8") == "21 apples"
+
+    def test_json_text(self, server):
+        headers = {"Content-Type": "application/json"}
+        status, _, body = request(server, "POST", "/convert", json.dumps({"text": "two hundred"}), headers)
+        assert status == 200
+        assert json.loads(body) == {"text": "200"}
+
+    def test_json_batch(self, server):
+        headers = {"Content-Type": "application/json"}
+        status, _, body = request(server, "POST", "/convert", json.dumps({"texts": TEXTS}), headers)
+        assert status == 200
+        assert json.loads(body) == {"texts": Text2Digits().convert_batch(TEXTS)}
+
+    @pytest.mark.parametrize("body", ["{", "[]", '{"texts": [1]}', '{"text": null}'])
+    def test_invalid_json(self, server, body):
+        status, _, response = request(server, "POST", "/convert", body, {"Content-Type": "application/json"})
+        assert status == 400
+        assert "error" in json.loads(response)
+
+    def test_health(self, server):
+        status, _, body = request(server, "GET", "/health")
+        assert (status, json.loads(body)) == (200, {"status": "ok"})
+
+    def test_stats(self, server):
+        request(server, "POST", "/convert", b"one")
+        status, _, body = request(server, "GET", "/stats")
+        stats = json.loads(body)
+        assert status == 200
+        assert stats["requests"] >= 1
+        assert stats["conversion"]["calls"] >= 1
+
+    @pytest.mark.parametrize("method, path, status", [("GET", "/unknown", 404), ("GET", "/convert", 405)])
+    def test_errors(self, server, method, path, status):
+        assert request(server, method, path)[0] == status
+
+    def test_body_too_large(self, server):
+        assert request(server, "POST", "/convert", b"x" * (server.max_body_size + 1))[0] == 413
+
+    def test_negative_content_length(self, server):
+        assert request(server, "POST", "/convert", headers={"Content-Length": "-1"})[0] == 400
+
+
+def test_main_feature_flags(monkeypatch):
+    text = "minus three point five, one hundred and five, twenty ten"
+    stdout = io.TextIOWrapper(io.BytesIO())
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(json.dumps({"text": text}).encode() + b"\n")))
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    main(["--worker", "--no-negation", "--no-decimal-words", "--no-concatenate", "--no-conjunctions"])
+
+    assert json.loads(stdout.buffer.getvalue())["text"] == "minus 3 point 5, 100 and 5, 20 10"
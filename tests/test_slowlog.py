@@ -0,0 +1,136 @@
+import hashlib
+
+import pytest
+
+from text2digits import MetricsRegistry, SlowLog, Text2Digits
+from text2digits.slowlog import read_records
+
+
+class TestConverterSlowLog:
+    def test_nothing_recorded_by_default(self):
+        assert Text2Digits().slow_log is None
+
+    def test_record(self):
+        slow_log = SlowLog(threshold=0)
+        t2d = Text2Digits(slow_log=slow_log, add_ordinal_ending=True)
+        assert t2d.convert("the twenty first of may") == "the 21st of may"
+
+        (record,) = slow_log.records()
+        assert record["method"] == "convert"
+        assert record["text"] == "the twenty first of may"
+        assert not record["truncated"]
+        assert record["length"] == len("the twenty first of may")
+        assert record["sha256"] == hashlib.sha256(b"the twenty first of may").hexdigest()
+        assert record["config"] == t2d._config()
+        assert record["tokens"] == 5
+        assert record["numbers"] == 1
+        assert set(record["stages"]) == {"lex", "parse", "other"}
+        assert sum(record["stages"].values()) == pytest.approx(record["seconds"])
+
+    def test_threshold(self):
+        slow_log = SlowLog(threshold=60)
+        Text2Digits(slow_log=slow_log).convert("twenty one")
+        assert slow_log.records() == []
+
+    @pytest.mark.parametrize("kwargs", [{"windowed": True}, {"similarity_threshold": 0.8}, {}])
+    def test_paths(self, kwargs):
+        slow_log = SlowLog(threshold=0)
+        t2d = Text2Digits(slow_log=slow_log, **kwargs)
+        assert t2d.convert("apples and one hundred pears") == "apples and 100 pears"
+        assert t2d.convert_batch(["two", "three"]) == ["2", "3"]
+        assert t2d.convert_bytes(b"four") == b"4"
+
+        records = slow_log.records()
+        assert [record["text"] for record in records] == ["apples and one hundred pears", "two", "three", "four"]
+        # Spelling correction falls back to convert()
+        assert records[-1]["method"] == ("convert" if "similarity_threshold" in kwargs else "convert_bytes")
+        assert records[0]["stages"]["lex"] > 0
+
+    def test_sampling(self):
+        slow_log = SlowLog(threshold=0, sample_rate=0)
+        Text2Digits(slow_log=slow_log).convert("one")
+        assert slow_log.records() == []
+
+        # Instances with metrics time every call anyway
+        Text2Digits(slow_log=slow_log, metrics=MetricsRegistry()).convert("one")
+        assert len(slow_log.records()) == 1
+
+    def test_metrics_and_slow_log(self):
+        metrics = MetricsRegistry()
+        slow_log = SlowLog(threshold=0)
+        t2d = Text2Digits(metrics=metrics, slow_log=slow_log)
+        t2d.convert("one")
+        t2d.convert_bytes(b"two")
+        assert metrics.snapshot()["calls"] == 2
+        assert len(slow_log.records()) == 2
+
+
+class TestSlowLog:
+    def test_capture_hash(self):
+        slow_log = SlowLog(threshold=0, capture="hash")
+        Text2Digits(slow_log=slow_log).convert("secret twenty")
+        (record,) = slow_log.records()
+        assert "text" not in record
+        assert record["sha256"] == hashlib.sha256(b"secret twenty").hexdigest()
+
+    def test_truncation(self):
+        slow_log = SlowLog(threshold=0, max_text_length=5)
+        t2d = Text2Digits(slow_log=slow_log)
+        t2d.convert("one two three")
+        t2d.convert("four")
+        assert [(record["text"], record["truncated"]) for record in slow_log.records()] == [
+            ("one t", True),
+            ("four", False),
+        ]
+
+    def test_ring_buffer(self):
+        slow_log = SlowLog(threshold=0, capacity=2)
+        t2d = Text2Digits(slow_log=slow_log)
+        for text in ["one", "two", "three"]:
+            t2d.convert(text)
+        assert [record["text"] for record in slow_log.records()] == ["two", "three"]
+
+        slow_log.clear()
+        assert slow_log.records() == []
+
+    def test_file_rotation(self, tmp_path):
+        path = tmp_path / "slow.jsonl"
+        slow_log = SlowLog(threshold=0, path=path, max_bytes=1000, backup_count=2)
+        t2d = Text2Digits(slow_log=slow_log)
+        texts = [f"text {i} " + "x" * 300 for i in range(10)]
+        for text in texts:
+            t2d.convert(text)
+
+        files = [tmp_path / "slow.jsonl.2", tmp_path / "slow.jsonl.1", path]
+        assert all(file.stat().st_size <= 1000 for file in files)
+        assert not (tmp_path / "slow.jsonl.3").exists()
+
+        # The oldest records were dropped with the oldest file
+        texts_in_files = [record["text"] for record in read_records(files)]
+        assert texts_in_files == texts[-len(texts_in_files) :]
+
+    def test_file_truncated_without_backups(self, tmp_path):
+        path = tmp_path / "slow.jsonl"
+        slow_log = SlowLog(threshold=0, path=path, max_bytes=500, backup_count=0)
+        t2d = Text2Digits(slow_log=slow_log)
+        for i in range(5):
+            t2d.convert(f"text {i} " + "x" * 300)
+
+        assert [record["text"][:6] for record in read_records([path])] == ["text 4"]
+        assert list(tmp_path.iterdir()) == [path]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"threshold": -1},
+            {"sample_rate": 1.5},
+            {"capacity": 0},
+            {"max_bytes": 0},
+            {"backup_count": -1},
+            {"capture": "none"},
+            {"max_text_length": -1},
+        ],
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            SlowLog(**kwargs)
@@ -1,4 +1,7 @@
-from text2digits.text_processing_helpers import bigram_similarity, find_similar_word
+import pytest
+
+from text2digits.text_processing_helpers import BigramIndex, bigram_similarity, find_similar_word
+from text2digits.tokens_basic import Token
 
 
 class TestBigramSimilarity:
@@ -66,3 +69,35 @@ class TestFindSimilarWord:
         # the initial max_similarity of 0, so the strict > check keeps it out.
         result = find_similar_word("abc", ["xyz"], threshold=0.0)
         assert result is None
+
+
+class TestBigramIndex:
+    THRESHOLDS = [0.0, 0.25, 1 / 3, 0.5, 2 / 3, 0.8, 1.0]
+
+    @pytest.mark.parametrize(
+        "word",
+        ["", "a", "o", "oh", "Twenty", "twentyy", "fourty", "thre", "nnine", "hundredth", "xyz", "tenn", "İki", "and"],
+    )
+    def test_same_as_find_similar_word(self, word):
+        index = BigramIndex(Token.numwords.keys())
+        for threshold in self.THRESHOLDS:
+            assert index.find_similar_word(word, threshold) == find_similar_word(word, Token.numwords.keys(), threshold)
+
+    def test_ties_are_won_by_the_first_word(self):
+        collection = ["abx", "aby", "ab", "abz"]
+        index = BigramIndex(collection)
+        assert index.find_similar_word("abc", 0.0) == find_similar_word("abc", collection, 0.0) == "abx"
+
+    def test_short_words(self):
+        collection = ["ab", "A", "a", "b"]
+        index = BigramIndex(collection)
+        assert index.find_similar_word("a", 1.0) == "A"
+        assert index.find_similar_word("c", 0.0) is None
+
+    def test_repeated_bigrams(self):
+        """Bigrams are counted with their multiplicity in the searched word."""
+        collection = ["aab", "aaaa", "ba"]
+        index = BigramIndex(collection)
+        for word in ["aaaa", "aaab", "abab", "aa"]:
+            for threshold in self.THRESHOLDS:
+                assert index.find_similar_word(word, threshold) == find_similar_word(word, collection, threshold)
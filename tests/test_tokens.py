@@ -3,7 +3,7 @@ from decimal import Decimal
 import pytest
 
 from text2digits import text2digits
-from text2digits.tokens_basic import Token, WordType
+from text2digits.tokens_basic import WORD_CLASS_CACHE_SIZE, Token, WordType, word_class
 
 
 def test_lexer():
@@ -76,6 +76,22 @@ class TestOtherTokenValueScale:
         assert Token("hundred", "").scale() == Decimal(100)
         assert Token("100", "").scale() == Decimal(100)
 
+    @pytest.mark.parametrize("word", ["and", "seven", "1000", "hundred"])
+    def test_raises_after_changing_type_to_other(self, word):
+        """The numeric attributes are computed once but the type may still be changed to OTHER later on."""
+        t = Token(word, "")
+        t.type = WordType.OTHER
+        assert not t.has_large_scale()
+        with pytest.raises(ValueError):
+            t.value()
+        with pytest.raises(ValueError):
+            t.scale()
+
+    def test_large_scale_literal(self):
+        t = Token("1,000", "")
+        assert t.has_large_scale()
+        assert (t.scale(), t.value()) == (Decimal(1000), Decimal(0))
+
 
 class TestOhToken:
     """'oh' is a spoken alias for zero (phone numbers) and must NOT be an ordinal."""
@@ -139,3 +155,23 @@ class TestOrdinalEndingBreak:
         assert t._word == "six"
         assert t.is_ordinal()
         assert t.type == WordType.UNITS
+
+
+class TestWordClass:
+    def test_occurrences_share_the_classification(self):
+        first, second = Token("Twentieth", " "), Token("Twentieth", ", ", 10)
+        assert first.word_class is second.word_class
+        assert (second.word_raw, second.glue, second.start) == ("Twentieth", ", ", 10)
+        assert (second._word, second.ordinal_ending, second.type) == ("twenty", "th", WordType.TENS)
+
+    def test_type_belongs_to_the_occurrence(self):
+        first, second = Token("and", " "), Token("and", " ")
+        first.type = WordType.OTHER
+        assert second.type == WordType.CONJUNCTION
+        assert word_class("and").type == WordType.CONJUNCTION
+
+    def test_cache_is_bounded(self):
+        assert word_class.cache_info().maxsize == WORD_CLASS_CACHE_SIZE
+
+    def test_tokens_have_no_dict(self):
+        assert not hasattr(Token("one", ""), "__dict__")
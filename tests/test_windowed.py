@@ -0,0 +1,69 @@
+import pytest
+
+from text2digits import MetricsRegistry, Text2Digits
+from text2digits.tokens_basic import Token
+from text2digits.vocabulary import candidate_pattern, number_words
+
+PROSE = "Someone had gone often to the station and nobody knew. "
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "no numbers at all",
+        PROSE * 20 + "I have twenty one apples and three pears. " + PROSE * 20,
+        "twenty one",
+        "and and and two and and",
+        "It costs 1,000 dollars or two point five thousand Euro. The first one is negative twenty.",
+        "forty--two and, and five _one ,two s,ix",
+        "Forty-Two_SEVENTH; Hundredth,\tnine\x1cthousand",
+        "laKh and İone, fünf naïve twenty one — ok",
+        "one" + PROSE + "nine",
+    ],
+)
+@pytest.mark.parametrize("kwargs", [{}, {"convert_ordinals": False}, {"add_ordinal_ending": True}])
+def test_same_result_as_full_pipeline(text, kwargs):
+    assert Text2Digits(windowed=True, **kwargs).convert(text) == Text2Digits(**kwargs).convert(text)
+
+
+def test_spelling_correction_is_not_supported():
+    with pytest.raises(ValueError):
+        Text2Digits(similarity_threshold=0.8, windowed=True)
+
+
+def test_budget_uses_full_pipeline():
+    result = Text2Digits(windowed=True).convert("twenty one apples and two pears", max_tokens=3, partial=True)
+    assert result == "21 apples and two pears"
+    assert result.truncated
+
+
+def test_metrics():
+    metrics = MetricsRegistry()
+    Text2Digits(windowed=True, metrics=metrics).convert(PROSE * 3 + "twenty one apples")
+    assert metrics.snapshot()["numbers"] == 1
+    assert 0 < metrics.snapshot()["tokens"] < len((PROSE * 3).split())
+
+
+def test_workers():
+    text = (PROSE * 50 + "twenty one apples. ") * 60
+    t2d = Text2Digits(windowed=True)
+    assert t2d.convert(text, workers=2) == Text2Digits().convert(text)
+
+
+class TestCandidatePattern:
+    @pytest.mark.parametrize("ignore_case", [True, False])
+    def test_matches_all_number_words(self, ignore_case):
+        pattern = candidate_pattern(ignore_case)
+        for word in number_words() - Token.CONJUNCTION:
+            assert pattern.fullmatch(word), word
+            assert pattern.fullmatch(",".join(word)), word
+
+    @pytest.mark.parametrize("text", ["Someone", "gone", "often", "stone", "sixt", "and"])
+    def test_skips_number_words_within_other_words(self, text):
+        assert candidate_pattern().search(text) is None
+
+    def test_ignore_case(self):
+        assert candidate_pattern().search("TWENTY")
+        assert candidate_pattern().search("laKh")  # Kelvin sign
+        assert candidate_pattern(ignore_case=False).search("TWENTY") is None
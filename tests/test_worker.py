@@ -0,0 +1,137 @@
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from text2digits import Text2Digits
+from text2digits.worker import ProtocolError, Worker, read_frames, write_frame
+
+
+def frame(content, framing="ndjson"):
+    stream = io.BytesIO()
+    write_frame(stream, json.dumps(content).encode("utf-8"), framing)
+    return stream.getvalue()
+
+
+def run(requests, framing="ndjson", **kwargs):
+    stdin = io.BytesIO(b"".join(frame(request, framing) for request in requests))
+    stdout = io.BytesIO()
+    Worker(framing, **kwargs).run(stdin, stdout)
+    stdout.seek(0)
+    return [json.loads(response) for response in read_frames(stdout, framing)]
+
+
+class TestFrames:
+    @pytest.mark.parametrize("framing", ["ndjson", "binary"])
+    def test_round_trip(self, framing):
+        stream = io.BytesIO()
+        for payload in [b"{}", b'{"text": "\\u00e9\\n"}', b"[1, 2]"]:
+            write_frame(stream, payload, framing)
+        stream.seek(0)
+        assert list(read_frames(stream, framing)) == [b"{}", b'{"text": "\\u00e9\\n"}', b"[1, 2]"]
+
+    def test_ndjson_skips_empty_lines(self):
+        assert list(read_frames(io.BytesIO(b'\n{"a": 1}\r\n\n  \n{}'))) == [b'{"a": 1}', b"{}"]
+
+    @pytest.mark.parametrize("data", [b"\x00\x00", b"\x00\x00\x00\x05abc"])
+    def test_truncated_binary_frame(self, data):
+        with pytest.raises(ProtocolError):
+            list(read_frames(io.BytesIO(data), "binary"))
+
+    @pytest.mark.parametrize("framing, data", [("binary", b"\x00\x01\x00\x00" + b"x" * 65536), ("ndjson", b"x" * 1000)])
+    def test_frame_too_large(self, framing, data):
+        with pytest.raises(ProtocolError):
+            list(read_frames(io.BytesIO(data), framing, max_frame_size=100))
+
+    def test_unknown_framing(self):
+        with pytest.raises(ValueError):
+            list(read_frames(io.BytesIO(b""), "xml"))
+        with pytest.raises(ValueError):
+            Worker("xml")
+
+
+class TestWorker:
+    @pytest.mark.parametrize("framing", ["ndjson", "binary"])
+    def test_requests(self, framing):
+        responses = run(
+            [
+                {"id": 1, "text": "twenty one"},
+                {"id": "b", "texts": ["one hundred", "the third day", ""]},
+                {"text": "nineteen sixty four"},
+            ],
+            framing,
+        )
+        assert responses == [
+            {"id": 1, "text": "21"},
+            {"id": "b", "texts": ["100", "the 3 day", ""]},
+            {"id": None, "text": "1964"},
+        ]
+
+    def test_options(self):
+        responses = run(
+            [
+                {"id": 1, "text": "the twentieth"},
+                {"id": 2, "text": "the twentieth", "options": {"add_ordinal_ending": True}},
+                {"id": 3, "text": "thirtyy", "options": {"similarity_threshold": 0.8}},
+                {"id": 4, "text": "the twentieth", "options": {"add_ordinal_ending": False}},
+            ],
+            defaults={"convert_ordinals": False},
+        )
+        assert [response["text"] for response in responses] == [
+            "the twentieth",
+            "the 20th",
+            Text2Digits(similarity_threshold=0.8, convert_ordinals=False).convert("thirtyy"),
+            "the twentieth",
+        ]
+
+    @pytest.mark.parametrize(
+        "request_",
+        [
+            {"id": 1},
+            {"id": 1, "texts": ["one", 2]},
+            {"id": 1, "text": "one", "options": {"unknown": True}},
+            {"id": 1, "text": "one", "options": {"similarity_threshold": 2}},
+            {"id": 1, "text": "one", "options": {"similarity_threshold": [1]}},
+            {"id": 1, "text": "one", "options": []},
+        ],
+    )
+    def test_invalid_request(self, request_):
+        responses = run([request_, {"id": 2, "text": "two"}])
+        assert responses[0]["id"] == 1
+        assert "error" in responses[0]
+        assert responses[1] == {"id": 2, "text": "2"}
+
+    def test_invalid_json(self):
+        stdout = io.BytesIO()
+        Worker().run(io.BytesIO(b'{"id": \n[1]\n{"text": "one"}\n'), stdout)
+        responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        assert ["error" in response for response in responses] == [True, True, False]
+
+    def test_pipelined_requests_are_answered_in_order(self):
+        requests = [{"id": i, "text": f"{'twenty' if i % 2 else 'thirty'} one"} for i in range(1000)]
+        responses = run(requests, max_batch_size=7)
+        assert [response["id"] for response in responses] == list(range(1000))
+        assert all(response["text"] == ("21" if response["id"] % 2 else "31") for response in responses)
+
+    def test_protocol_error_after_answering_the_complete_frames(self):
+        stdout = io.BytesIO()
+        with pytest.raises(ProtocolError):
+            Worker("binary").run(io.BytesIO(frame({"id": 1, "text": "one"}, "binary") + b"\x00\x00\x00\x09{"), stdout)
+        stdout.seek(0)
+        assert [json.loads(response) for response in read_frames(stdout, "binary")] == [{"id": 1, "text": "1"}]
+
+
+@pytest.mark.parametrize("framing", ["ndjson", "binary"])
+def test_command_line(framing):
+    requests = b"".join(frame({"id": i, "text": "two hundred"}, framing) for i in range(3))
+    process = subprocess.run(
+        [sys.executable, "-m", "text2digits.serve", "--worker", "--framing", framing, "--add-ordinal-ending"],
+        input=requests + frame({"id": 3, "text": "fifth"}, framing),
+        capture_output=True,
+        check=True,
+        timeout=60,
+    )
+    responses = [json.loads(response) for response in read_frames(io.BytesIO(process.stdout), framing)]
+    assert responses == [{"id": i, "text": "200"} for i in range(3)] + [{"id": 3, "text": "5th"}]
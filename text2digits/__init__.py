@@ -1,5 +1,9 @@
 from importlib.metadata import PackageNotFoundError, version
 
+from text2digits.budget import ConversionResult, ConversionTimeout
+from text2digits.disk_cache import DiskCache
+from text2digits.metrics import MetricsRegistry
+from text2digits.slowlog import SlowLog
 from text2digits.text2digits import Text2Digits
 
 name = "text2digits"
@@ -9,4 +13,4 @@ try:
 except PackageNotFoundError:
     __version__ = "unknown"
 
-__all__ = ["Text2Digits"]
+__all__ = ["ConversionResult", "ConversionTimeout", "DiskCache", "MetricsRegistry", "SlowLog", "Text2Digits"]
@@ -0,0 +1,112 @@
+import time
+from typing import Optional
+
+
+class ConversionResult(str):
+    """
+    The result of a conversion with a budget (see Text2Digits.convert()). It behaves like a normal string and additionally tells whether the budget ran out before the whole input was converted.
+    """
+
+    truncated: bool
+    position: Optional[int]
+
+    def __new__(cls, text: str, truncated: bool = False, position: Optional[int] = None) -> "ConversionResult":
+        """
+        :param text: The converted text.
+        :param truncated: Whether the budget ran out. In this case, only the input up to *position* is converted and the remainder is copied unchanged.
+        :param position: The offset in the input where the unconverted remainder starts (None if the input was converted completely).
+        """
+        result = super().__new__(cls, text)
+        result.truncated = truncated
+        result.position = position
+
+        return result
+
+
+class ConversionTimeout(TimeoutError):
+    """
+    Raised when the deadline or the token budget of a conversion runs out.
+    """
+
+    def __init__(self, message: str, result: ConversionResult) -> None:
+        """
+        :param message: The error message.
+        :param result: The partial result, i.e. the converted prefix followed by the unconverted remainder of the input.
+        """
+        super().__init__(message)
+        self.result = result
+
+
+class Budget:
+    """
+    Keeps track of the deadline and the token budget of a single conversion.
+    """
+
+    __slots__ = ("deadline", "max_tokens", "truncated_at", "reason")
+
+    # The deadline is only checked every CHECK_INTERVAL tokens while lexing to keep the overhead of the clock low
+    CHECK_INTERVAL = 1024
+
+    def __init__(self, deadline: Optional[float] = None, max_tokens: Optional[int] = None) -> None:
+        """
+        :param deadline: The point in time (as returned by time.monotonic()) when the conversion must stop.
+        :param max_tokens: The maximal number of tokens to process.
+        """
+        if max_tokens is not None and max_tokens < 0:
+            raise ValueError("max_tokens must not be negative")
+
+        self.deadline = deadline
+        self.max_tokens = max_tokens
+        # Offset in the input where the conversion stopped (None as long as the budget did not run out)
+        self.truncated_at: Optional[int] = None
+        self.reason = ""
+
+    def lexing_exhausted(self, n_tokens: int, offset: int) -> bool:
+        """
+        Checks the budget before the next token is created.
+
+        :param n_tokens: The number of tokens created so far.
+        :param offset: The offset of the next word in the input.
+        :return: True if lexing must stop.
+        """
+        if self.max_tokens is not None and n_tokens >= self.max_tokens:
+            return self._stop(offset, f"token budget of {self.max_tokens} exhausted")
+        if self.deadline is not None and n_tokens % self.CHECK_INTERVAL == 0 and time.monotonic() > self.deadline:
+            return self._stop(offset, "deadline exceeded")
+
+        return False
+
+    def parsing_exhausted(self, offset: int) -> bool:
+        """
+        Checks the budget before the next number run is processed.
+
+        :param offset: The offset of the number run in the input.
+        :return: True if parsing must stop.
+        """
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            return self._stop(offset, "deadline exceeded")
+
+        return False
+
+    def finish(self, text: str, partial: bool) -> str:
+        """
+        Builds the final result of the conversion.
+
+        :param text: The (possibly partially) converted text.
+        :param partial: Whether to return a partial result instead of raising an exception when the budget ran out.
+        :return: A ConversionResult if *partial* is set and the converted text otherwise.
+        """
+        if self.truncated_at is None:
+            return ConversionResult(text) if partial else text
+
+        result = ConversionResult(text, truncated=True, position=self.truncated_at)
+        if partial:
+            return result
+
+        raise ConversionTimeout(f"Conversion stopped at offset {self.truncated_at}: {self.reason}", result)
+
+    def _stop(self, offset: int, reason: str) -> bool:
+        self.truncated_at = offset
+        self.reason = reason
+
+        return True
@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# Changing the key derivation invalidates all existing entries
+_KEY_FORMAT = 1
+
+# SQLite limits the number of parameters of a statement (999 in older versions)
+_MAX_PARAMETERS = 500
+
+# The access time of an entry is only updated when it is older than this (in seconds), so that lookups rarely write
+_TOUCH_INTERVAL = 3600.0
+
+# The size of the cache is checked whenever this fraction of max_bytes has been written by an instance
+_PRUNE_CHECK_FRACTION = 0.05
+
+# Pruning removes the least recently used entries until the cache is this fraction of max_bytes
+_PRUNE_TARGET_FRACTION = 0.9
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS conversions (key BLOB PRIMARY KEY, result TEXT NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL) WITHOUT ROWID",
+    "CREATE INDEX IF NOT EXISTS conversions_accessed ON conversions (accessed)",
+)
+
+
+def _package_version() -> str:
+    try:
+        return version("text2digits")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class DiskCache:
+    """
+    A persistent cache of conversion results in an SQLite database, e.g. to skip the texts which did not change when a corpus is processed again.
+
+    Basic usage:
+
+    >>> from text2digits import DiskCache, Text2Digits
+    >>> t2d = Text2Digits(disk_cache=DiskCache("conversions.sqlite"))  # doctest: +SKIP
+    >>> t2d.convert_batch(["twenty one", "two hundred"])  # doctest: +SKIP
+    ['21', '200']
+
+    The entries are keyed by the SHA-256 hash of the library version, the configuration of the converter and the input text, so a cache can be shared by converters with different options and results of other versions are never returned.
+
+    The database uses write-ahead logging, so any number of threads and processes can read the cache while another one writes to it. Each thread and process opens its own connection.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        max_bytes: int = 1024 * 1024 * 1024,
+        timeout: float = 30.0,
+        version: Optional[str] = None,
+    ) -> None:
+        """
+        :param path: The database file. It is created if it does not exist.
+        :param max_bytes: The maximal size of the cached entries (keys and UTF-8 encoded results) in bytes. When the cache becomes larger, the least recently used entries are removed. The database file does not shrink but the space is reused.
+        :param timeout: How long (in seconds) to wait for a lock held by another connection before an operation fails.
+        :param version: The library version which is part of the keys (default: the installed version of text2digits).
+        """
+        if max_bytes < 1:
+            raise ValueError("The max_bytes must be positive")
+
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.version = version if version is not None else _package_version()
+
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._written_bytes = 0
+
+        connection = self._connection()
+        connection.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+
+    def keys(self, texts: Iterable[str], config: Dict[str, Any]) -> List[bytes]:
+        """
+        Returns the cache keys of the texts.
+
+        :param texts: The input texts.
+        :param config: The configuration of the converter (the constructor arguments which determine the result).
+        """
+        prefix = hashlib.sha256(f"{_KEY_FORMAT}\0{self.version}\0{json.dumps(config, sort_keys=True)}\0".encode())
+        keys = []
+        for text in texts:
+            digest = prefix.copy()
+            digest.update(text.encode("utf-8", errors="surrogatepass"))
+            keys.append(digest.digest())
+
+        return keys
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, str]:
+        """
+        Looks up the results of the keys.
+
+        :param keys: The keys (see keys()).
+        :return: The cached results by key. Keys which are not in the cache are missing.
+        """
+        connection = self._connection()
+        unique_keys = list(dict.fromkeys(keys))
+        now = time.time()
+
+        results = {}
+        stale = []
+        for start in range(0, len(unique_keys), _MAX_PARAMETERS):
+            chunk = unique_keys[start : start + _MAX_PARAMETERS]
+            rows = connection.execute(
+                f"SELECT key, result, accessed FROM conversions WHERE key IN ({','.join('?' * len(chunk))})", chunk
+            )
+            for key, result, accessed in rows:
+                results[key] = result
+                if now - accessed > _TOUCH_INTERVAL:
+                    stale.append(key)
+
+        if stale:
+            with connection:
+                connection.execute("BEGIN")
+                for start in range(0, len(stale), _MAX_PARAMETERS):
+                    chunk = stale[start : start + _MAX_PARAMETERS]
+                    connection.execute(
+                        f"UPDATE conversions SET accessed = ? WHERE key IN ({','.join('?' * len(chunk))})",
+                        [now, *chunk],
+                    )
+
+        return results
+
+    def set_many(self, items: Iterable[Tuple[bytes, str]]) -> None:
+        """
+        Stores the results of the keys (in one transaction).
+
+        :param items: The keys (see keys()) and their results.
+        """
+        now = time.time()
+        rows = [
+            (key, result, len(key) + len(result.encode("utf-8", errors="surrogatepass")), now) for key, result in items
+        ]
+        if not rows:
+            return
+
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN")
+            connection.executemany("INSERT OR REPLACE INTO conversions VALUES (?, ?, ?, ?)", rows)
+
+        with self._lock:
+            self._written_bytes += sum(row[2] for row in rows)
+            check = self._written_bytes >= self.max_bytes * _PRUNE_CHECK_FRACTION
+            if check:
+                self._written_bytes = 0
+        if check:
+            self.prune()
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Removes the least recently used entries if the cache is larger than max_bytes. The cache is then reduced to 90% of max_bytes, so that it is not pruned again right away.
+
+        :param max_bytes: The maximal size of the cache in bytes (default: the max_bytes of the cache).
+        :return: The number of removed entries.
+        """
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        connection = self._connection()
+        with connection:
+            # Take the write lock right away so that concurrent pruning processes do not remove the same entries twice
+            connection.execute("BEGIN IMMEDIATE")
+            total = self._size(connection)
+            if total <= max_bytes:
+                return 0
+
+            excess = total - int(max_bytes * _PRUNE_TARGET_FRACTION)
+            removed: List[bytes] = []
+            for key, size in connection.execute("SELECT key, size FROM conversions ORDER BY accessed"):
+                removed.append(key)
+                excess -= size
+                if excess <= 0:
+                    break
+
+            for start in range(0, len(removed), _MAX_PARAMETERS):
+                chunk = removed[start : start + _MAX_PARAMETERS]
+                connection.execute(f"DELETE FROM conversions WHERE key IN ({','.join('?' * len(chunk))})", chunk)
+
+        return len(removed)
+
+    def size(self) -> int:
+        """
+        Returns the size of all entries (keys and UTF-8 encoded results) in bytes.
+        """
+        return self._size(self._connection())
+
+    @staticmethod
+    def _size(connection: sqlite3.Connection) -> int:
+        return connection.execute("SELECT COALESCE(SUM(size), 0) FROM conversions").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM conversions").fetchone()[0]
+
+    def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM conversions")
+
+    def close(self) -> None:
+        """
+        Closes the connections of all threads. The cache reconnects when it is used again.
+        """
+        with self._lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+            self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        # Connections must not be shared between threads nor inherited by forked processes
+        if getattr(local, "pid", None) != os.getpid():
+            # Autocommit mode, the transactions are managed explicitly. Each connection is only used by its thread but close() may be called from any thread
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            local.connection = connection
+            local.pid = os.getpid()
+            with self._lock:
+                self._connections.append(connection)
+
+        return local.connection
@@ -0,0 +1,204 @@
+import threading
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence
+
+# Upper bounds of the latency histogram buckets (in seconds)
+DEFAULT_LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+# Upper bounds of the input length buckets (in bytes). Each length bucket has its own latency histogram
+DEFAULT_SIZE_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+_COUNTERS = (
+    ("calls", "Number of converted texts."),
+    ("bytes", "Number of input bytes (UTF-8) processed."),
+    ("tokens", "Number of tokens processed."),
+    ("numbers", "Number of numbers found in the input."),
+    ("corrections", "Number of words changed by the spelling correction."),
+)
+
+
+class CallStats:
+    """
+    Counts the events of a single conversion. The converter fills this object while processing the text and hands it to the metrics registry afterwards so that the registry is only locked once per call.
+    """
+
+    __slots__ = ("tokens", "numbers", "corrections", "phrase_hits", "phrase_misses", "lex_seconds", "parse_seconds")
+
+    def __init__(self) -> None:
+        self.tokens = 0
+        self.numbers = 0
+        self.corrections = 0
+        self.phrase_hits = 0
+        self.phrase_misses = 0
+        # The time spent in the tokenization and in the replacement of the number runs
+        self.lex_seconds = 0.0
+        self.parse_seconds = 0.0
+
+    def stages(self) -> Dict[str, float]:
+        """
+        Returns the time (in seconds) spent in each processing stage.
+        """
+        return {"lex": self.lex_seconds, "parse": self.parse_seconds}
+
+
+def text_size(text: str) -> int:
+    """
+    Returns the number of bytes of the UTF-8 representation of the text.
+    """
+    return len(text) if text.isascii() else len(text.encode("utf-8", errors="surrogatepass"))
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, n_buckets: int) -> None:
+        # The last entry counts the observations which are larger than the largest bucket bound
+        self.counts = [0] * (n_buckets + 1)
+        self.sum = 0.0
+
+
+class MetricsRegistry:
+    """
+    Collects aggregate numbers (counters, cache hit rates and latency histograms bucketed by the input length) of one or more Text2Digits instances.
+
+    Basic usage:
+
+    >>> from text2digits import MetricsRegistry, Text2Digits
+    >>> metrics = MetricsRegistry()
+    >>> t2d = Text2Digits(metrics=metrics)
+    >>> t2d.convert("twenty one")
+    '21'
+    >>> metrics.snapshot()["numbers"]
+    1
+
+    The registry is thread-safe. It is locked exactly once per observation and all bucket lookups happen outside of the lock.
+    """
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        size_buckets: Sequence[int] = DEFAULT_SIZE_BUCKETS,
+    ) -> None:
+        """
+        :param latency_buckets: Ascending upper bounds (in seconds) of the latency histogram buckets.
+        :param size_buckets: Ascending upper bounds (in bytes) of the input length buckets. There is one latency histogram per input length bucket.
+        """
+        if list(latency_buckets) != sorted(latency_buckets) or list(size_buckets) != sorted(size_buckets):
+            raise ValueError("The bucket bounds must be sorted in ascending order")
+
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Sets all metrics back to zero.
+        """
+        with self._lock:
+            self._counters = {name: 0 for name, _ in _COUNTERS}
+            self._caches: Dict[str, List[int]] = {}
+            self._histograms = [_Histogram(len(self.latency_buckets)) for _ in range(len(self.size_buckets) + 1)]
+
+    def observe_call(self, n_bytes: int, n_tokens: int, n_numbers: int, n_corrections: int, seconds: float) -> None:
+        """
+        Records one conversion.
+
+        :param n_bytes: The size of the input in bytes.
+        :param n_tokens: The number of tokens of the input.
+        :param n_numbers: The number of numbers found in the input.
+        :param n_corrections: The number of words changed by the spelling correction.
+        :param seconds: The duration of the conversion.
+        """
+        size_index = bisect_left(self.size_buckets, n_bytes)
+        latency_index = bisect_left(self.latency_buckets, seconds)
+
+        with self._lock:
+            counters = self._counters
+            counters["calls"] += 1
+            counters["bytes"] += n_bytes
+            counters["tokens"] += n_tokens
+            counters["numbers"] += n_numbers
+            counters["corrections"] += n_corrections
+
+            histogram = self._histograms[size_index]
+            histogram.counts[latency_index] += 1
+            histogram.sum += seconds
+
+    def observe_cache(self, name: str, hits: int = 0, misses: int = 0) -> None:
+        """
+        Records lookups of a cache.
+
+        :param name: The name of the cache (e.g. phrase).
+        :param hits: The number of lookups which were answered by the cache.
+        :param misses: The number of lookups which were not answered by the cache.
+        """
+        with self._lock:
+            counts = self._caches.setdefault(name, [0, 0])
+            counts[0] += hits
+            counts[1] += misses
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a consistent copy of all metrics as a plain dictionary (e.g. to serialize it as JSON).
+
+        The latency histograms are keyed by the upper bound of the input length bucket. Their bucket counts are cumulative (as in the Prometheus exposition format), i.e. each bucket counts all observations which are less than or equal to its upper bound.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            caches = {name: list(counts) for name, counts in self._caches.items()}
+            histograms = [(list(histogram.counts), histogram.sum) for histogram in self._histograms]
+
+        snapshot: Dict[str, Any] = counters
+        snapshot["caches"] = {
+            name: {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses) if hits + misses else 0.0}
+            for name, (hits, misses) in sorted(caches.items())
+        }
+
+        latency = {}
+        for size_label, (counts, total) in zip(self._bucket_labels(self.size_buckets), histograms):
+            cumulative = 0
+            buckets = {}
+            for latency_label, count in zip(self._bucket_labels(self.latency_buckets), counts):
+                cumulative += count
+                buckets[latency_label] = cumulative
+            latency[size_label] = {"buckets": buckets, "sum": total, "count": cumulative}
+        snapshot["latency"] = latency
+
+        return snapshot
+
+    def to_prometheus(self, prefix: str = "text2digits") -> str:
+        """
+        Returns all metrics in the Prometheus text exposition format.
+
+        :param prefix: The prefix of all metric names.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        for name, description in _COUNTERS:
+            metric = f"{prefix}_{name}_total"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {snapshot[name]}")
+
+        metric = f"{prefix}_cache_lookups_total"
+        lines.append(f"# HELP {metric} Number of cache lookups by cache and result.")
+        lines.append(f"# TYPE {metric} counter")
+        for cache, counts in snapshot["caches"].items():
+            lines.append(f'{metric}{{cache="{cache}",result="hit"}} {counts["hits"]}')
+            lines.append(f'{metric}{{cache="{cache}",result="miss"}} {counts["misses"]}')
+
+        metric = f"{prefix}_convert_duration_seconds"
+        lines.append(f"# HELP {metric} Duration of conversions by input length (in bytes).")
+        lines.append(f"# TYPE {metric} histogram")
+        for size_label, histogram in snapshot["latency"].items():
+            for latency_label, count in histogram["buckets"].items():
+                lines.append(f'{metric}_bucket{{input_bytes="{size_label}",le="{latency_label}"}} {count}')
+            lines.append(f'{metric}_sum{{input_bytes="{size_label}"}} {histogram["sum"]!r}')
+            lines.append(f'{metric}_count{{input_bytes="{size_label}"}} {histogram["count"]}')
+
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _bucket_labels(bounds: Sequence[float]) -> List[str]:
+        return [str(bound) for bound in bounds] + ["+Inf"]
@@ -0,0 +1,408 @@
+"""
+Converts selected fields of CSV and JSON Lines records while streaming them from an input to an output file (only the standard library is required).
+
+Usage::
+
+    python -m text2digits.records csv --fields comment,notes input.csv output.csv
+    python -m text2digits.records jsonl --fields text,messages.*.body --workers 4 < input.jsonl > output.jsonl
+
+CSV fields are column names of the header row. JSON Lines fields are paths of object keys and list indices separated by dots, where ``*`` stands for all keys of an object or all items of a list. Only string values are converted; all other fields are passed through unchanged.
+
+The values of the fields are collected from batches of records, so that each distinct value of a batch is converted only once with Text2Digits.convert_batch() (which also uses its phrase and disk caches). With ``--workers``, the batches are converted by a pool of processes and the records are still written in the order of the input.
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple, cast
+
+from text2digits.disk_cache import DiskCache
+from text2digits.text2digits import Text2Digits
+
+FORMATS = ("csv", "jsonl")
+
+# A field of a record: the container (a CSV row, a JSON object or list) and the key or index of the value
+_Field = Tuple[Any, Any]
+
+
+class RecordStats(NamedTuple):
+    """
+    The counters of a conversion.
+    """
+
+    # The number of records (without the CSV header row)
+    records: int
+    # The number of field values which were converted (including duplicates)
+    fields: int
+    # The number of distinct field values per batch, i.e. the number of texts which were converted
+    unique: int
+    # The number of field values which were changed by the conversion
+    changed: int
+    seconds: float
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else 0.0
+
+
+class _Batch(NamedTuple):
+    records: List[Any]
+    fields: List[List[_Field]]
+    texts: List[str]
+    future: "Future[List[str]]"
+
+
+class RecordConverter:
+    """
+    Converts selected fields of CSV and JSON Lines records.
+
+    >>> import io
+    >>> target = io.StringIO()
+    >>> with RecordConverter() as converter:
+    ...     converter.convert_jsonl(io.StringIO('{"id": 1, "text": "twenty one"}\\n'), target, ["text"]).changed
+    1
+    >>> target.getvalue()
+    '{"id": 1, "text": "21"}\\n'
+    """
+
+    def __init__(
+        self,
+        t2d: Optional[Text2Digits] = None,
+        batch_size: int = 1024,
+        workers: int = 0,
+        progress: Optional[Callable[[RecordStats], None]] = None,
+    ) -> None:
+        """
+        :param t2d: The converter of the field values (default: Text2Digits()).
+        :param batch_size: The number of records whose field values are converted at once.
+        :param workers: The number of worker processes. With 0 workers, the values are converted in the current process. The workers create instances with the configuration of t2d (and open its disk cache, if any), but its metrics and slow log are only used without workers.
+        :param progress: Called with the counters so far after each written batch (if provided).
+        """
+        if batch_size < 1:
+            raise ValueError("The batch_size must be at least 1")
+        if workers < 0:
+            raise ValueError("The number of workers must not be negative")
+
+        self.t2d = t2d if t2d is not None else Text2Digits()
+        self.batch_size = batch_size
+        self.workers = workers
+        self.progress = progress
+
+        disk_cache = self.t2d.disk_cache
+        self._worker_args: Tuple[Tuple[Tuple[str, Any], ...], Optional[Tuple[Any, ...]]] = (
+            tuple(sorted(self.t2d._config().items())),
+            (disk_cache.path, disk_cache.max_bytes, disk_cache.timeout, disk_cache.version)
+            if disk_cache is not None
+            else None,
+        )
+        self._executor = (
+            ProcessPoolExecutor(workers, initializer=_warm_up, initargs=self._worker_args) if workers else None
+        )
+
+    def convert_csv(
+        self, source: TextIO, target: TextIO, fields: Iterable[str], header: bool = True, **format_params: Any
+    ) -> RecordStats:
+        """
+        Converts the columns of CSV records. The header row is written unchanged. The records are written with csv.writer(), so the quoting and the line terminators (\\r\\n by default) of the output may differ from the input, but all values except for the converted ones are the same.
+
+        :param source: The input (opened with newline="", see the csv module).
+        :param target: The output (opened with newline="").
+        :param fields: The names of the columns. Without a header row, the 0-based indices of the columns (negative indices count from the end of each row).
+        :param header: Whether the first row is a header row.
+        :param format_params: Passed to csv.reader() and csv.writer() (e.g. delimiter=";").
+        :return: The counters of the conversion.
+        :raises ValueError: If a column is not part of the header row.
+        """
+        reader = csv.reader(source, **format_params)
+        writer = csv.writer(target, **format_params)
+        fields = list(fields)
+
+        if header:
+            names = next(reader, None)
+            if names is None:
+                return RecordStats(0, 0, 0, 0, 0.0)
+            writer.writerow(names)
+
+            missing = [field for field in fields if field not in names]
+            if missing:
+                raise ValueError(f"Unknown columns: {', '.join(missing)} (available: {', '.join(names)})")
+            columns = [names.index(field) for field in fields]
+        else:
+            columns = [int(field) for field in fields]
+
+        # A column which is listed twice must not be converted twice
+        columns = list(dict.fromkeys(columns))
+        relative = any(column < 0 for column in columns)
+
+        def row_fields(row: List[str]) -> List[_Field]:
+            indices: Iterable[int] = columns
+            if relative:
+                # Negative indices count from the end of the row, so they may refer to the same value as another index
+                indices = dict.fromkeys(column + len(row) if column < 0 else column for column in columns)
+            return [(row, index) for index in indices if 0 <= index < len(row) and row[index]]
+
+        return self._convert_records(reader, row_fields, lambda row, changed: writer.writerow(row))
+
+    def convert_jsonl(self, source: TextIO, target: TextIO, fields: Iterable[str]) -> RecordStats:
+        """
+        Converts the string values at the paths of JSON Lines records. Records without changes (and blank lines) are written unchanged, the others are serialized again with json.dumps() (without escaping non-ASCII characters).
+
+        :param source: The input.
+        :param target: The output.
+        :param fields: The paths of the values (object keys and list indices separated by dots, * stands for all keys or items).
+        :return: The counters of the conversion.
+        :raises ValueError: If a line is not valid JSON.
+        """
+        paths = [field.split(".") for field in fields]
+
+        def line_fields(record: Tuple[str, Any]) -> List[_Field]:
+            # Overlapping paths (e.g. text and *) must not convert a value twice
+            found: Dict[Tuple[int, Any], _Field] = {}
+            for path in paths:
+                for container, key in _json_fields(record[1], path):
+                    found[(id(container), key)] = (container, key)
+            return list(found.values())
+
+        def write(record: Tuple[str, Any], changed: bool) -> None:
+            line, value = record
+            if changed:
+                body = line.rstrip("\r\n")
+                line = json.dumps(value, ensure_ascii=False) + line[len(body) :]
+            target.write(line)
+
+        return self._convert_records(_read_jsonl(source), line_fields, write)
+
+    def close(self) -> None:
+        """
+        Stops the worker processes.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+
+    def __enter__(self) -> "RecordConverter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _convert_records(
+        self,
+        records: Iterable[Any],
+        record_fields: Callable[[Any], List[_Field]],
+        write: Callable[[Any, bool], None],
+    ) -> RecordStats:
+        start = time.perf_counter()
+        counters = dict.fromkeys(["records", "fields", "unique", "changed"], 0)
+        # With workers, two batches per worker are in flight. The oldest batch is always written first
+        pending: Deque[_Batch] = deque()
+        max_pending = 2 * self.workers if self.workers else 1
+
+        def finish(batch: _Batch) -> None:
+            converted = dict(zip(batch.texts, batch.future.result()))
+            for record, fields in zip(batch.records, batch.fields):
+                changed = False
+                for container, key in fields:
+                    result = converted[container[key]]
+                    if result != container[key]:
+                        container[key] = result
+                        changed = True
+                        counters["changed"] += 1
+                write(record, changed)
+
+            counters["records"] += len(batch.records)
+            if self.progress is not None:
+                self.progress(RecordStats(**counters, seconds=time.perf_counter() - start))
+
+        for records_batch in _batches(records, self.batch_size):
+            fields = [record_fields(record) for record in records_batch]
+            texts = list(dict.fromkeys(container[key] for record in fields for container, key in record))
+            counters["fields"] += sum(map(len, fields))
+            counters["unique"] += len(texts)
+
+            pending.append(_Batch(records_batch, fields, texts, self._submit(texts)))
+            if len(pending) >= max_pending:
+                finish(pending.popleft())
+
+        while pending:
+            finish(pending.popleft())
+
+        return RecordStats(**counters, seconds=time.perf_counter() - start)
+
+    def _submit(self, texts: List[str]) -> "Future[List[str]]":
+        if self._executor is not None:
+            return self._executor.submit(_convert_texts, *self._worker_args, texts)
+
+        future: Future[List[str]] = Future()
+        future.set_result(self.t2d.convert_batch(texts))
+        return future
+
+
+def _batches(records: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def _read_jsonl(source: TextIO) -> Iterator[Tuple[str, Any]]:
+    """
+    Yields the lines of the source with their parsed value (None for blank lines, which have no fields).
+    """
+    for number, line in enumerate(source, 1):
+        if not line.strip():
+            yield line, None
+            continue
+
+        try:
+            yield line, json.loads(line)
+        except ValueError as error:
+            raise ValueError(f"Line {number} is not valid JSON: {error}") from error
+
+
+def _json_fields(value: Any, path: List[str]) -> Iterator[_Field]:
+    """
+    Yields the fields with string values at the path below the value.
+    """
+    segment, rest = path[0], path[1:]
+    if isinstance(value, dict):
+        keys: Iterable[Any] = list(value) if segment == "*" else [segment] if segment in value else []
+    elif isinstance(value, list):
+        if segment == "*":
+            keys = range(len(value))
+        elif segment.isdigit() and int(segment) < len(value):
+            keys = [int(segment)]
+        else:
+            keys = []
+    else:
+        return
+
+    for key in keys:
+        if rest:
+            yield from _json_fields(value[key], rest)
+        elif isinstance(value[key], str):
+            yield value, key
+
+
+@lru_cache(maxsize=None)
+def _converter(config: Tuple[Tuple[str, Any], ...], disk_cache: Optional[Tuple[Any, ...]]) -> Text2Digits:
+    return Text2Digits(**dict(config), disk_cache=DiskCache(*disk_cache) if disk_cache is not None else None)
+
+
+def _warm_up(config: Tuple[Tuple[str, Any], ...], disk_cache: Optional[Tuple[Any, ...]]) -> None:
+    # Builds the instance and the lazily created vocabulary structures before the first batch arrives
+    _converter(config, disk_cache).convert("twenty one")
+
+
+def _convert_texts(
+    config: Tuple[Tuple[str, Any], ...], disk_cache: Optional[Tuple[Any, ...]], texts: List[str]
+) -> List[str]:
+    """
+    Converts the distinct field values of a batch in a worker.
+    """
+    return _converter(config, disk_cache).convert_batch(texts)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("format", choices=FORMATS, help="The format of the records")
+    parser.add_argument(
+        "--fields", required=True, help="Comma-separated column names (CSV) or paths (JSON Lines) to convert"
+    )
+    parser.add_argument("input", nargs="?", default="-", help="The input file (default: standard input)")
+    parser.add_argument("output", nargs="?", default="-", help="The output file (default: standard output)")
+    parser.add_argument("--delimiter", default=",", help="The delimiter of the CSV fields (default: %(default)s)")
+    parser.add_argument(
+        "--no-header", action="store_true", help="The CSV input has no header row (--fields are indices)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1024, help="Records per converted batch (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="The number of worker processes; 0 converts in the main process (default: %(default)s)",
+    )
+    parser.add_argument("--disk-cache", help="An SQLite file which caches the conversions across runs")
+    parser.add_argument("--similarity-threshold", type=float, default=1.0, help="Spelling correction threshold")
+    parser.add_argument("--no-convert-ordinals", action="store_true", help="Do not convert ordinal numbers")
+    parser.add_argument("--add-ordinal-ending", action="store_true", help="Keep the ordinal ending (e.g. 20th)")
+    parser.add_argument("--windowed", action="store_true", help="Only tokenize the regions around numbers")
+    parser.add_argument("--no-negation", action="store_true", help="Treat negation words (e.g. minus) as other words")
+    parser.add_argument(
+        "--no-decimal-words", action="store_true", help="Treat the decimal separator word (point) as another word"
+    )
+    parser.add_argument(
+        "--no-concatenate", action="store_true", help="Do not concatenate consecutive numbers (e.g. twenty ten)"
+    )
+    parser.add_argument(
+        "--no-conjunctions", action="store_true", help="Do not combine numbers with conjunctions (e.g. and)"
+    )
+    parser.add_argument("--progress", action="store_true", help="Report the records per second while converting")
+    args = parser.parse_intermixed_args(argv)
+
+    t2d = Text2Digits(
+        similarity_threshold=args.similarity_threshold,
+        convert_ordinals=not args.no_convert_ordinals,
+        add_ordinal_ending=args.add_ordinal_ending,
+        windowed=args.windowed,
+        negation=not args.no_negation,
+        decimal_words=not args.no_decimal_words,
+        concatenate=not args.no_concatenate,
+        conjunctions=not args.no_conjunctions,
+        disk_cache=DiskCache(args.disk_cache) if args.disk_cache else None,
+    )
+    fields = [field for field in args.fields.split(",") if field]
+
+    last_report = [time.perf_counter()]
+
+    def report(stats: RecordStats) -> None:
+        if time.perf_counter() - last_report[0] >= 1:
+            last_report[0] = time.perf_counter()
+            print(f"{stats.records:,} records ({stats.records_per_second:,.0f} records/s)", file=sys.stderr, flush=True)
+
+    # The line endings are passed through as they are (the csv module handles them itself)
+    if args.input == "-":
+        cast(io.TextIOWrapper, sys.stdin).reconfigure(encoding="utf-8", newline="")
+    if args.output == "-":
+        cast(io.TextIOWrapper, sys.stdout).reconfigure(encoding="utf-8", newline="")
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", newline="")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+
+    try:
+        with RecordConverter(t2d, args.batch_size, args.workers, report if args.progress else None) as converter:
+            if args.format == "csv":
+                stats = converter.convert_csv(
+                    source, target, fields, header=not args.no_header, delimiter=args.delimiter
+                )
+            else:
+                stats = converter.convert_jsonl(source, target, fields)
+    except ValueError as error:
+        sys.exit(f"text2digits records: {error}")
+    finally:
+        target.flush()
+        if args.input != "-":
+            source.close()
+        if args.output != "-":
+            target.close()
+
+    print(
+        f"{stats.records:,} records, {stats.fields:,} fields ({stats.unique:,} converted, {stats.changed:,} changed) "
+        f"in {stats.seconds:.2f} s ({stats.records_per_second:,.0f} records/s)",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@ from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import List, Union
 
-from text2digits.tokens_basic import NoneToken, Token, WordType
+from text2digits.tokens_basic import NONE_TOKEN, Token, WordType
 from text2digits.tokens_rules import CombinedToken, ConcatenatedToken, RuleToken
 
 
@@ -13,12 +13,13 @@ class Rule(ABC):
     """
 
     @abstractmethod
-    def match(self, tokens: List[Union[Token, RuleToken]]) -> int:
+    def match(self, tokens: List[Union[Token, RuleToken]], start: int = 0) -> int:
         """
         Analyses the tokens and tries to find a consecutive sequence of tokens which should be combined for the specified rule. The focus of this function lies on *which* tokens should be combined (instead of *how*).
 
         :param tokens: List of tokens.
-        :return: Number of tokens which match the specified rule.
+        :param start: The index of the first token of the sequence (the tokens before it are ignored). Passing the index instead of a slice keeps matching at every position of a long number run linear.
+        :return: Number of tokens (starting at index start) which match the specified rule.
         """
         pass
 
@@ -55,36 +56,38 @@ class CombinationRule(Rule):
             WordType.SCALES,
         ]
 
-    def match(self, tokens: List[Token]) -> int:  # type: ignore[override]
+    def match(self, tokens: List[Token], start: int = 0) -> int:  # type: ignore[override]
+        n_tokens = len(tokens) - start
+
         # We need at least two tokens to combine something
-        if len(tokens) < 2:
+        if n_tokens < 2:
             return 0
 
         last_match = None
         last_scale: Decimal = Decimal(0)
         consumed_tokens = 0
-        while consumed_tokens < len(tokens):
+        while consumed_tokens < n_tokens:
             consumed_conjunctions = 0
-            first = tokens[consumed_tokens]
+            first = tokens[start + consumed_tokens]
 
             # In case of a conjunction, we are interested in the word which follows next
             if consumed_tokens > 0 and first.type == WordType.CONJUNCTION:
                 # Consume the conjunction
                 consumed_conjunctions = 1
-                first = tokens[consumed_tokens + consumed_conjunctions]
+                first = tokens[start + consumed_tokens + consumed_conjunctions]
 
             # Same for the second considered token. However, it is a bit more complicated in this case since we may reach the end of the string
             second = (
-                tokens[consumed_tokens + consumed_conjunctions + 1]
-                if consumed_tokens < len(tokens) - consumed_conjunctions - 1
-                else NoneToken()
+                tokens[start + consumed_tokens + consumed_conjunctions + 1]
+                if consumed_tokens < n_tokens - consumed_conjunctions - 1
+                else NONE_TOKEN
             )
             if second.type == WordType.CONJUNCTION:
                 consumed_conjunctions += 1
                 second = (
-                    tokens[consumed_tokens + consumed_conjunctions + 1]
-                    if consumed_tokens < len(tokens) - consumed_conjunctions - 1
-                    else NoneToken()
+                    tokens[start + consumed_tokens + consumed_conjunctions + 1]
+                    if consumed_tokens < n_tokens - consumed_conjunctions - 1
+                    else NONE_TOKEN
                 )
 
             # Now the tricky part: we need to decide how many tokens we need to combine
@@ -139,6 +142,11 @@ class CombinationRule(Rule):
         prev_scale: Decimal = Decimal(1)
         all_scales = [token.scale() for token in tokens]
 
+        # The largest scale of each suffix of the tokens (computed once instead of for every token)
+        suffix_max = all_scales[:]
+        for index in range(len(suffix_max) - 2, -1, -1):
+            suffix_max[index] = max(suffix_max[index], suffix_max[index + 1])
+
         for index, token in enumerate(tokens):
             assert token.type != WordType.OTHER, "Invalid token type (only numbers are allowed here)"
 
@@ -146,15 +154,16 @@ class CombinationRule(Rule):
                 # Multiply the scale at least with a value of 1 (and not 0)
                 current = max(Decimal(1), current)
 
-            if token.scale() < prev_scale and prev_scale > max(all_scales[index:]):
+            scale = all_scales[index]
+            if scale < prev_scale and prev_scale > suffix_max[index]:
                 # Flush the result when switching from a larger to a smaller scale
                 # e.g. one thousand *FLUSH* six hundred *FLUSH* sixty six
                 result += current
                 current = Decimal(0)
 
-            current = current * token.scale() + token.value()
+            current = current * scale + token.value()
             last_glue = token.glue
-            prev_scale = token.scale()
+            prev_scale = scale
 
         result += current
 
@@ -169,8 +178,8 @@ class ConcatenationRule(Rule):
     def __init__(self):
         self.valid_types = [WordType.UNITS, WordType.TEENS, WordType.TENS, WordType.SCALES, WordType.REPLACED]
 
-    def match(self, tokens: List[Union[Token, CombinedToken]]) -> int:  # type: ignore[override]
-        i = 0
+    def match(self, tokens: List[Union[Token, CombinedToken]], start: int = 0) -> int:  # type: ignore[override]
+        i = start
 
         # Find all numeric tokens
         while i < len(tokens):
@@ -180,17 +189,10 @@ class ConcatenationRule(Rule):
             else:
                 break
 
-        return i
+        return i - start
 
     def action(self, tokens: List[Union[Token, CombinedToken]]) -> ConcatenatedToken:  # type: ignore[override]
         if len(tokens) < 1:
             raise ValueError(f"ConcatenationRule.action requires at least 1 token, got {len(tokens)}")
 
-        last_glue = ""
-        result = ""
-
-        for token in tokens:
-            result += token.text()
-            last_glue = token.glue
-
-        return ConcatenatedToken(tokens, result, last_glue)  # type: ignore[arg-type]
+        return ConcatenatedToken(tokens, "".join([token.text() for token in tokens]), tokens[-1].glue)  # type: ignore[arg-type]
@@ -0,0 +1,495 @@
+"""
+A small HTTP server which converts texts for other services (only the standard library is required).
+
+Usage::
+
+    python -m text2digits.serve --port 8000 --workers 2
+
+Endpoints:
+
+- ``POST /convert`` with a ``text/plain`` body converts a single text and returns it as ``text/plain``. With an ``application/json`` body, ``{"text": "..."}`` returns ``{"text": "..."}`` and ``{"texts": [...]}`` returns ``{"texts": [...]}``.
+- ``GET /health`` returns ``{"status": "ok"}``.
+- ``GET /stats`` returns the request, batch and conversion counters as JSON.
+
+With ``--worker``, the process answers framed requests on stdin/stdout instead (see text2digits.worker).
+
+Concurrent requests are merged into batches: the first queued request waits at most ``--max-wait-ms`` for more requests (or until ``--max-batch-size`` texts are queued) and the whole batch is converted with one call of Text2Digits.convert_batch() on a warm instance in one of the worker processes.
+"""
+
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+from text2digits.metrics import MetricsRegistry
+from text2digits.text2digits import Text2Digits
+from text2digits.worker import FRAMINGS, ProtocolError, Worker
+
+# The conversion counters of the MetricsRegistry which are reported by /stats
+_CONVERSION_COUNTERS = ("calls", "bytes", "tokens", "numbers", "corrections")
+
+
+class _Job:
+    __slots__ = ("texts", "future")
+
+    def __init__(self, texts: List[str]) -> None:
+        self.texts = texts
+        self.future: Future[List[str]] = Future()
+
+
+class Batcher:
+    """
+    Merges the texts of concurrent requests into batches and converts them on a pool of warm Text2Digits instances.
+
+    >>> batcher = Batcher(workers=0)
+    >>> batcher.submit(["twenty one", "one hundred"]).result()
+    ['21', '100']
+    >>> batcher.close()
+    """
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        workers: int = 1,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+    ) -> None:
+        """
+        :param config: The arguments of the Text2Digits instances (e.g. {"similarity_threshold": 0.8}).
+        :param workers: The number of worker processes. With 0 workers, the texts are converted by a thread of the current process.
+        :param max_batch_size: The number of texts after which a batch is dispatched without waiting any longer. A single request with more texts is dispatched as one batch.
+        :param max_wait: The maximal time (in seconds) the first request of a batch waits for more requests.
+        """
+        if workers < 0:
+            raise ValueError("The number of workers must not be negative")
+        if max_batch_size < 1:
+            raise ValueError("The max_batch_size must be at least 1")
+        if max_wait < 0:
+            raise ValueError("The max_wait must not be negative")
+
+        self.config: Tuple[Tuple[str, Any], ...] = tuple(sorted((config or {}).items()))
+        self.workers = workers
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+
+        # Creating an instance validates the config before any worker is started
+        Text2Digits(**dict(self.config))
+
+        self._executor = self._create_executor()
+
+        # Keep at most two batches per worker in flight. While all slots are taken, the requests queue up and form larger batches
+        self._slots = threading.BoundedSemaphore(2 * max(workers, 1))
+        self._queue: queue.Queue[Optional[_Job]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._counters = {"requests": 0, "texts": 0, "batches": 0, "errors": 0, "largest_batch": 0, "restarts": 0}
+        self._conversion = dict.fromkeys(_CONVERSION_COUNTERS, 0)
+        self._started = time.monotonic()
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="text2digits-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: List[str]) -> "Future[List[str]]":
+        """
+        Queues the texts of one request.
+
+        :param texts: The input strings.
+        :return: A future with the converted texts (in the same order).
+        :raises RuntimeError: If the batcher is closed.
+        """
+        job = _Job(texts)
+        with self._lock:
+            # Jobs queued after close() would never be dispatched
+            if self._closed:
+                raise RuntimeError("The batcher is closed")
+            self._counters["requests"] += 1
+            self._counters["texts"] += len(texts)
+            self._queue.put(job)
+
+        return job.future
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the request and batch counters and the conversion counters of all workers as a plain dictionary.
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            conversion = dict(self._conversion)
+
+        stats["mean_batch_size"] = stats["texts"] / stats["batches"] if stats["batches"] else 0.0
+        stats["queued"] = self._queue.qsize()
+        stats["workers"] = self.workers
+        stats["uptime_seconds"] = time.monotonic() - self._started
+        stats["conversion"] = conversion
+
+        return stats
+
+    def close(self) -> None:
+        """
+        Converts the queued requests and stops the batcher thread and the workers. Later calls of submit() raise a RuntimeError.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+
+        self._thread.join()
+        self._executor.shutdown()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            self._slots.acquire()
+
+            job = self._queue.get()
+            if job is None:
+                self._slots.release()
+                break
+
+            batch = [job]
+            n_texts = len(job.texts)
+            deadline = time.monotonic() + self.max_wait
+            while n_texts < self.max_batch_size:
+                try:
+                    job = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+
+                if job is None:
+                    stopping = True
+                    break
+
+                batch.append(job)
+                n_texts += len(job.texts)
+
+            self._dispatch(batch, n_texts)
+
+    def _dispatch(self, batch: List[_Job], n_texts: int) -> None:
+        texts = [text for job in batch for text in job.texts]
+        with self._lock:
+            self._counters["batches"] += 1
+            self._counters["largest_batch"] = max(self._counters["largest_batch"], n_texts)
+
+        executor = self._executor
+        try:
+            try:
+                future = executor.submit(_convert_batch, self.config, texts)
+            except BrokenProcessPool:
+                # A worker died after the last batch finished, so this batch was not affected yet
+                executor = self._replace_executor(executor)
+                future = executor.submit(_convert_batch, self.config, texts)
+        except Exception as error:
+            self._slots.release()
+            self._fail(batch, error)
+            return
+
+        future.add_done_callback(lambda done: self._finish(batch, executor, done))
+
+    def _finish(self, batch: List[_Job], executor: Executor, done: "Future[Tuple[List[str], Dict[str, int]]]") -> None:
+        self._slots.release()
+
+        error = done.exception()
+        if error is not None:
+            if isinstance(error, BrokenProcessPool):
+                # Only the batches which were in flight fail, the next ones are converted by new workers
+                self._replace_executor(executor)
+            self._fail(batch, error)
+            return
+
+        results, conversion = done.result()
+        with self._lock:
+            for name, value in conversion.items():
+                self._conversion[name] += value
+
+        start = 0
+        for job in batch:
+            job.future.set_result(results[start : start + len(job.texts)])
+            start += len(job.texts)
+
+    def _create_executor(self) -> Executor:
+        if self.workers == 0:
+            return ThreadPoolExecutor(1, initializer=_warm_up, initargs=(self.config,))
+
+        return ProcessPoolExecutor(self.workers, initializer=_warm_up, initargs=(self.config,))
+
+    def _replace_executor(self, broken: Executor) -> Executor:
+        """
+        Replaces the executor after one of its worker processes died. Each of its failed batches calls this, but the executor is only replaced once.
+
+        :param broken: The executor whose worker died.
+        :return: The current executor.
+        """
+        with self._lock:
+            if self._executor is broken and not self._closed:
+                self._executor = self._create_executor()
+                self._counters["restarts"] += 1
+            executor = self._executor
+
+        broken.shutdown(wait=False)
+
+        return executor
+
+    def _fail(self, batch: List[_Job], error: BaseException) -> None:
+        with self._lock:
+            self._counters["errors"] += len(batch)
+
+        for job in batch:
+            job.future.set_exception(error)
+
+
+@lru_cache(maxsize=None)
+def _converter(config: Tuple[Tuple[str, Any], ...]) -> Text2Digits:
+    return Text2Digits(**dict(config), metrics=MetricsRegistry())
+
+
+def _warm_up(config: Tuple[Tuple[str, Any], ...]) -> None:
+    # Builds the instance and the lazily created vocabulary structures before the first request arrives
+    _converter(config).convert_batch(["twenty one"])
+    _converter(config).metrics.reset()  # type: ignore[union-attr]
+
+
+def _convert_batch(config: Tuple[Tuple[str, Any], ...], texts: List[str]) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Converts a batch in a worker. Returns the results and the conversion counters of the batch.
+    """
+    t2d = _converter(config)
+    assert t2d.metrics is not None
+    results = t2d.convert_batch(texts)
+
+    # Each worker converts one batch at a time, so the counters since the last reset belong to this batch
+    snapshot = t2d.metrics.snapshot()
+    t2d.metrics.reset()
+
+    return results, {name: snapshot[name] for name in _CONVERSION_COUNTERS}
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    # Keep connections alive so that clients do not need a new connection per request
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written separately, which would otherwise wait for the delayed ACK of the client
+    disable_nagle_algorithm = True
+    server: "ConversionServer"
+
+    def do_GET(self) -> None:
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/stats":
+            self._send_json(200, self.server.batcher.stats())
+        elif self.path == "/convert":
+            self._send_error(405, "Use POST to convert texts")
+        else:
+            self._send_error(404, f"Unknown path: {self.path}")
+
+    def do_POST(self) -> None:
+        if self.path != "/convert":
+            self._send_error(404, f"Unknown path: {self.path}")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", ""))
+        except ValueError:
+            self._send_error(411, "The Content-Length header is required")
+            return
+
+        # rfile.read() with a negative length would block until the client closes the connection
+        if length < 0:
+            self.close_connection = True
+            self._send_error(400, "The Content-Length must not be negative")
+            return
+
+        if length > self.server.max_body_size:
+            self.close_connection = True
+            self._send_error(413, f"The body must not be larger than {self.server.max_body_size} bytes")
+            return
+
+        body = self.rfile.read(length)
+        content_type = self.headers.get("Content-Type", "text/plain").split(";")[0].strip().lower()
+
+        try:
+            if content_type == "application/json":
+                texts, key = self._parse_json(body)
+            else:
+                texts, key = [body.decode("utf-8")], None
+        except ValueError as error:
+            self._send_error(400, str(error))
+            return
+
+        try:
+            results = self.server.batcher.submit(texts).result()
+        except Exception as error:
+            self._send_error(500, f"Conversion failed: {error}")
+            return
+
+        if key is None:
+            self._send(200, "text/plain; charset=utf-8", results[0].encode("utf-8"))
+        elif key == "text":
+            self._send_json(200, {"text": results[0]})
+        else:
+            self._send_json(200, {"texts": results})
+
+    @staticmethod
+    def _parse_json(body: bytes) -> Tuple[List[str], str]:
+        request = json.loads(body)  # json.JSONDecodeError is a ValueError
+        if isinstance(request, dict) and isinstance(request.get("text"), str):
+            return [request["text"]], "text"
+        elif (
+            isinstance(request, dict)
+            and isinstance(request.get("texts"), list)
+            and all(isinstance(text, str) for text in request["texts"])
+        ):
+            return request["texts"], "texts"
+        else:
+            raise ValueError('Expected a JSON object with a "text" string or a "texts" list of strings')
+
+    def _send_json(self, status: int, content: Any) -> None:
+        self._send(status, "application/json", json.dumps(content).encode("utf-8"))
+
+    def _send_error(self, status: int, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ConversionServer(ThreadingHTTPServer):
+    """
+    HTTP server which hands the texts of all requests to a Batcher.
+
+    >>> server = ConversionServer(("127.0.0.1", 0), Batcher(workers=0))
+    >>> threading.Thread(target=server.serve_forever, daemon=True).start()
+    >>> server.server_address  # doctest: +SKIP
+    ('127.0.0.1', 41207)
+    >>> server.close()
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        batcher: Batcher,
+        max_body_size: int = 16 * 1024 * 1024,
+        verbose: bool = False,
+    ) -> None:
+        """
+        :param address: The host and port to listen on (port 0 picks a free port).
+        :param batcher: The batcher which converts the texts.
+        :param max_body_size: The maximal size of a request body in bytes. Larger requests are rejected with status 413.
+        :param verbose: Whether to log every request to stderr.
+        """
+        self.batcher = batcher
+        self.max_body_size = max_body_size
+        self.verbose = verbose
+        super().__init__(address, _RequestHandler)
+
+    def close(self) -> None:
+        """
+        Stops serving (if serve_forever() is running) and shuts the batcher down.
+        """
+        self.shutdown()
+        self.server_close()
+        self.batcher.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1", help="The address to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=8000, help="The port to listen on (default: %(default)s)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="The number of worker processes; 0 converts in the server process (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-batch-size", type=int, default=64, help="Texts per batch before it is dispatched (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--max-wait-ms",
+        type=float,
+        default=2.0,
+        help="How long the first request of a batch waits for more requests (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-body-size",
+        type=int,
+        default=16 * 1024 * 1024,
+        help="Maximal request size in bytes (default: %(default)s)",
+    )
+    parser.add_argument("--similarity-threshold", type=float, default=1.0, help="Spelling correction threshold")
+    parser.add_argument("--no-convert-ordinals", action="store_true", help="Do not convert ordinal numbers")
+    parser.add_argument("--add-ordinal-ending", action="store_true", help="Keep the ordinal ending (e.g. 20th)")
+    parser.add_argument("--windowed", action="store_true", help="Only tokenize the regions around numbers")
+    parser.add_argument("--no-negation", action="store_true", help="Treat negation words (e.g. minus) as other words")
+    parser.add_argument(
+        "--no-decimal-words", action="store_true", help="Treat the decimal separator word (point) as another word"
+    )
+    parser.add_argument(
+        "--no-concatenate", action="store_true", help="Do not concatenate consecutive numbers (e.g. twenty ten)"
+    )
+    parser.add_argument(
+        "--no-conjunctions", action="store_true", help="Do not combine numbers with conjunctions (e.g. and)"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    parser.add_argument(
+        "--worker", action="store_true", help="Answer framed requests on stdin/stdout instead of serving HTTP"
+    )
+    parser.add_argument(
+        "--framing",
+        choices=FRAMINGS,
+        default="ndjson",
+        help="The framing of the --worker protocol: newline-delimited JSON or length-prefixed JSON (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+
+    config = {
+        "similarity_threshold": args.similarity_threshold,
+        "convert_ordinals": not args.no_convert_ordinals,
+        "add_ordinal_ending": args.add_ordinal_ending,
+        "windowed": args.windowed,
+        "negation": not args.no_negation,
+        "decimal_words": not args.no_decimal_words,
+        "concatenate": not args.no_concatenate,
+        "conjunctions": not args.no_conjunctions,
+    }
+
+    if args.worker:
+        try:
+            Worker(args.framing, config, args.max_batch_size, args.max_body_size).run(
+                sys.stdin.buffer, sys.stdout.buffer
+            )
+        except ProtocolError as error:
+            sys.exit(f"text2digits worker: {error}")
+        return
+
+    batcher = Batcher(config, args.workers, args.max_batch_size, args.max_wait_ms / 1000)
+    server = ConversionServer((args.host, args.port), batcher, args.max_body_size, args.verbose)
+
+    print(f"Serving text2digits on http://{args.host}:{server.server_port} with {args.workers} worker(s)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Union
+
+from text2digits.text_processing_helpers import BytesLike
+
+CAPTURES = ("text", "hash")
+
+
+class SlowLog:
+    """
+    Records the conversions which take longer than a threshold together with their input, the configuration of the converter and the time spent in each processing stage, so that rare slow inputs can be reproduced offline (e.g. with ``python benchmarks/run.py --replay slow.jsonl``).
+
+    Basic usage:
+
+    >>> from text2digits import SlowLog, Text2Digits
+    >>> slow_log = SlowLog(threshold=0)
+    >>> t2d = Text2Digits(slow_log=slow_log)
+    >>> t2d.convert("twenty one")
+    '21'
+    >>> slow_log.records()[0]["text"]
+    'twenty one'
+
+    The records are kept in a bounded ring buffer and are optionally appended (as JSON lines) to a local file which is rotated when it becomes too large. The log is thread-safe and may be shared by multiple instances.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 1.0,
+        sample_rate: float = 1.0,
+        capacity: int = 100,
+        path: Optional[Union[str, "os.PathLike[str]"]] = None,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 3,
+        capture: str = "text",
+        max_text_length: Optional[int] = 65536,
+    ) -> None:
+        """
+        :param threshold: The duration (in seconds) from which on a conversion is recorded.
+        :param sample_rate: The fraction of conversions in the range [0, 1] which are timed. The other conversions skip the timing of the stages (instances which collect metrics time every conversion anyway, so all of them are checked).
+        :param capacity: The number of most recent records which are kept in memory.
+        :param path: The file to which the records are appended as JSON lines (if provided).
+        :param max_bytes: The size in bytes from which on the file is rotated (renamed to path.1, the previous path.1 to path.2 and so on).
+        :param backup_count: The number of rotated files which are kept. With 0, the file is truncated instead.
+        :param capture: Either text (the input is stored, see max_text_length) or hash (only the SHA-256 hash and the length of the input are stored, e.g. for sensitive inputs).
+        :param max_text_length: The maximal number of characters of a stored input. Longer inputs are truncated (and marked as such). None stores the complete input.
+        """
+        if threshold < 0:
+            raise ValueError("The threshold must not be negative")
+        if sample_rate < 0 or sample_rate > 1:
+            raise ValueError("The sample_rate must be in the range [0, 1]")
+        if capacity < 1:
+            raise ValueError("The capacity must be at least 1")
+        if max_bytes < 1 or backup_count < 0:
+            raise ValueError("The max_bytes must be positive and the backup_count must not be negative")
+        if capture not in CAPTURES:
+            raise ValueError(f"Unknown capture {capture!r} (available: {', '.join(CAPTURES)})")
+        if max_text_length is not None and max_text_length < 0:
+            raise ValueError("The max_text_length must not be negative")
+
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.path = os.fspath(path) if path is not None else None
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.capture = capture
+        self.max_text_length = max_text_length
+
+        self._records: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def sample(self) -> bool:
+        """
+        Decides whether the next conversion is timed.
+        """
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def observe(
+        self,
+        text: Union[str, BytesLike],
+        config: Dict[str, Any],
+        seconds: float,
+        stages: Dict[str, float],
+        n_tokens: int = 0,
+        n_numbers: int = 0,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Records the conversion if it took at least as long as the threshold.
+
+        :param text: The input of the conversion (a string for convert() or UTF-8 encoded data for convert_bytes()).
+        :param config: The configuration of the converter (the constructor arguments which determine the result).
+        :param seconds: The duration of the conversion.
+        :param stages: The time (in seconds) spent in each processing stage (e.g. lex and parse). The remaining time is recorded as the stage other.
+        :param n_tokens: The number of tokens of the input.
+        :param n_numbers: The number of numbers found in the input.
+        :return: The record or None if the conversion was not slow.
+        """
+        if seconds < self.threshold:
+            return None
+
+        if isinstance(text, str):
+            method = "convert"
+            data = text.encode("utf-8", errors="surrogatepass")
+        else:
+            method = "convert_bytes"
+            data = bytes(text)
+            text = data.decode("utf-8", errors="surrogateescape")
+
+        record: Dict[str, Any] = {
+            "time": time.time(),
+            "seconds": seconds,
+            # The time which is not spent in any of the stages (e.g. the search for the windows of windowed instances)
+            "stages": {**stages, "other": max(0.0, seconds - sum(stages.values()))},
+            "method": method,
+            "config": dict(config),
+            "length": len(text),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "tokens": n_tokens,
+            "numbers": n_numbers,
+        }
+        if self.capture == "text":
+            truncated = self.max_text_length is not None and len(text) > self.max_text_length
+            record["text"] = text[: self.max_text_length] if truncated else text
+            record["truncated"] = truncated
+
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            self._records.append(record)
+            if self.path is not None:
+                self._write(line)
+
+        return record
+
+    def records(self) -> List[Dict[str, Any]]:
+        """
+        Returns the records in the ring buffer (oldest first).
+        """
+        with self._lock:
+            return list(self._records)
+
+    def clear(self) -> None:
+        """
+        Removes all records from the ring buffer (the file is left unchanged).
+        """
+        with self._lock:
+            self._records.clear()
+
+    def _write(self, line: str) -> None:
+        assert self.path is not None
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if size > 0 and size + len(line) > self.max_bytes:
+            self._rotate()
+
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(line)
+
+    def _rotate(self) -> None:
+        assert self.path is not None
+        if self.backup_count == 0:
+            os.remove(self.path)
+            return
+
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+def read_records(paths: Iterable[Union[str, "os.PathLike[str]"]]) -> Iterator[Dict[str, Any]]:
+    """
+    Reads the records of slow log files (e.g. to replay them).
+
+    :param paths: The files written by SlowLog (including rotated ones).
+    :return: The records in the order of the files.
+    """
+    for path in paths:
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
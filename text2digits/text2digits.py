@@ -1,8 +1,36 @@
-from typing import List, Tuple
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
 
-from text2digits.rules import CombinationRule, ConcatenationRule
-from text2digits.text_processing_helpers import find_similar_word, split_glues
-from text2digits.tokens_basic import Token, WordType
+from text2digits.budget import Budget, ConversionResult
+from text2digits.disk_cache import DiskCache
+from text2digits.metrics import CallStats, MetricsRegistry, text_size
+from text2digits.rules import CombinationRule, ConcatenationRule, Rule
+from text2digits.slowlog import SlowLog
+from text2digits.text_processing_helpers import (
+    BytesLike,
+    has_only_inert_non_ascii,
+    offsets_view,
+    split_glues,
+    split_glues_bytes,
+    unique_words,
+)
+from text2digits.tokens_basic import Token, WordType, other_word_class
+from text2digits.vocabulary import (
+    candidate_pattern,
+    candidate_pattern_bytes,
+    number_words,
+    number_words_bytes,
+    scanner_pattern,
+    similar_number_word,
+    similar_number_words,
+)
 
 # Token types that produce a numeric output after the rule passes.
 _NUMERIC_TYPES = frozenset(
@@ -17,9 +45,48 @@ _NUMERIC_TYPES = frozenset(
     }
 )
 
+# Words (without thousand separators) which Token classifies as WordType.LITERAL_INT or WordType.LITERAL_FLOAT
+_LITERAL_PAT = re.compile(r"\d+\.?\d*|\.\d+")
+
+# Byte words (without thousand separators) which Token classifies as WordType.LITERAL_INT or WordType.LITERAL_FLOAT
+_LITERAL_BYTES_PAT = re.compile(rb"[0-9]+\.?[0-9]*|\.[0-9]+")
+
+# Number of bytes which convert_arrow() scans for candidate rows at once
+_SCAN_CHUNK_SIZE = 1 << 16
+
+# Minimal number of characters per chunk when a text is converted by multiple workers and the number of chunks per worker
+_MIN_CHUNK_SIZE = 1 << 16
+_CHUNKS_PER_WORKER = 4
+
+# Default number of characters which convert_to() reads and converts at once
+STREAM_CHUNK_SIZE = 1 << 16
+
+_WHITESPACE_PAT = re.compile(r"\s+")
+# The end of a whitespace run
+_WHITESPACE_END_PAT = re.compile(r"\s\S")
+
+# Default number of number runs whose replacement is cached by each instance
+PHRASE_CACHE_SIZE = 4096
+# Longer number runs (in characters) are not cached. They rarely repeat and would make the cache size unbounded in bytes
+_MAX_PHRASE_LENGTH = 256
+
 
 class Text2Digits:
-    def __init__(self, similarity_threshold=1.0, convert_ordinals=True, add_ordinal_ending=False):
+    def __init__(
+        self,
+        similarity_threshold=1.0,
+        convert_ordinals=True,
+        add_ordinal_ending=False,
+        metrics: Optional[MetricsRegistry] = None,
+        windowed: bool = False,
+        phrase_cache_size: int = PHRASE_CACHE_SIZE,
+        negation: bool = True,
+        decimal_words: bool = True,
+        concatenate: bool = True,
+        conjunctions: bool = True,
+        slow_log: Optional[SlowLog] = None,
+        disk_cache: Optional[DiskCache] = None,
+    ):
         """
         This class can be used to convert text representations of numbers to digits. That is, it replaces all occurrences of numbers (e.g. forty-two) to the digit representation (e.g. 42).
 
@@ -33,6 +100,15 @@ class Text2Digits:
         :param similarity_threshold: Used for spelling correction. It specifies the minimal similarity in the range [0, 1] of a word to one of the number words. 0 indicates that every other word is similar and 1 requires a perfect match, i.e. no spelling correction is performed with a value of 1.
         :param convert_ordinals: Whether to convert ordinal numbers (e.g. third --> 3).
         :param add_ordinal_ending: Whether to add the ordinal ending to the converted ordinal number (e.g. twentieth --> 20th). Implies convert_ordinals=True.
+        :param metrics: Registry which collects aggregate numbers about all conversions (e.g. calls, numbers found and latencies). The same registry may be shared by multiple instances. No metrics are collected by default.
+        :param windowed: Whether to only tokenize the parts of the input which may contain numbers (found with a regular expression over the number words and digits) and copy everything else unchanged. This gives the same results and is much faster for texts with few numbers. Requires similarity_threshold=1.
+        :param phrase_cache_size: The number of number runs (e.g. twenty one) whose replacement is cached, so that a repeated run is replaced without applying the rules again. 0 disables the cache.
+        :param negation: Whether negation words turn the following number negative (e.g. minus five --> -5). Otherwise, they are treated as other words.
+        :param decimal_words: Whether the decimal separator word combines two numbers (e.g. three point one four --> 3.14). Otherwise, it is treated as another word.
+        :param concatenate: Whether consecutive numbers which cannot be combined are concatenated (e.g. twenty ten --> 2010). Otherwise, they are converted individually (e.g. 20 10).
+        :param conjunctions: Whether conjunctions may combine numbers (e.g. one hundred and five --> 105). Otherwise, they are treated as other words (e.g. 100 and 5).
+        :param slow_log: Records the conversions which take longer than its threshold together with their input and stage timings (see SlowLog). The same log may be shared by multiple instances. Nothing is recorded by default.
+        :param disk_cache: Persistent cache of the results of convert() and convert_batch() (see DiskCache). The same cache may be shared by multiple instances and processes. Nothing is cached by default.
         """
         self.similarity_threshold = similarity_threshold
 
@@ -46,93 +122,943 @@ class Text2Digits:
         if self.add_ordinal_ending:
             self.convert_ordinals = True
 
-        self._rules = [CombinationRule(), ConcatenationRule()]
+        self.metrics = metrics
+        self.slow_log = slow_log
+        self.disk_cache = disk_cache
+
+        # The spelling correction may turn any word into a number word, so there are no regions which can be skipped
+        if windowed and self.similarity_threshold != 1:
+            raise ValueError("Windowed processing requires similarity_threshold=1")
+        self.windowed = windowed
+
+        if phrase_cache_size < 0:
+            raise ValueError("The phrase_cache_size must not be negative")
+        self.phrase_cache_size = phrase_cache_size
+        # Maps the input text of a number run (without the glue of the last word) to its replacement and the number of numbers in it
+        self._phrase_cache: Optional[OrderedDict[Union[str, bytes], Tuple[str, int]]] = (
+            OrderedDict() if phrase_cache_size > 0 else None
+        )
+
+        # The worker processes of convert(text, workers=n), started by the first call which splits a text (see close())
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_workers = 0
+        self._executor_lock = threading.Lock()
+
+        self.negation = negation
+        self.decimal_words = decimal_words
+        self.concatenate = concatenate
+        self.conjunctions = conjunctions
+
+        # The pipeline is specialized once for the enabled features: the words of disabled features become WordType.OTHER right after the classification, they are left out of the vocabularies and the rules of disabled features are not applied
+        disabled_types = set()
+        if not negation:
+            disabled_types.add(WordType.NEGATION)
+        if not decimal_words:
+            disabled_types.add(WordType.DECIMAL_SEPARATOR)
+        if not conjunctions:
+            disabled_types.add(WordType.CONJUNCTION)
+        self._disabled_types = frozenset(disabled_types)
+        self._number_words = number_words(self._disabled_types)
 
-    def convert(self, text: str) -> str:
+        self._rules: List[Rule] = [CombinationRule()]
+        if concatenate:
+            self._rules.append(ConcatenationRule())
+
+    def convert(
+        self,
+        text: str,
+        deadline: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        partial: bool = False,
+        workers: int = 1,
+    ) -> str:
         """
         Converts all number representations to digits.
 
+        The conversion can be limited with a deadline and/or a token budget. When the budget runs out, the conversion stops before the next number run and a ConversionTimeout is raised. If partial results are requested, the converted prefix followed by the unconverted remainder of the input is returned instead (as a ConversionResult with the truncated flag set).
+
+        Large texts can be converted by multiple worker processes. The text is cut into chunks after words which cannot be part of a number (so that no number spans two chunks), the chunks are converted in parallel and the results are joined. The result is the same as with a single worker.
+
         :param text: The input string.
+        :param deadline: The point in time (as returned by time.monotonic()) when the conversion must stop.
+        :param max_tokens: The maximal number of tokens (words) to process.
+        :param partial: Whether to return a ConversionResult (which may be truncated) instead of raising a ConversionTimeout when the budget runs out.
+        :param workers: The number of processes which convert the text. Texts which are too short to be split (or which cannot be cut safely) are converted in the current process. The processes are kept for later calls until close() is called. Cannot be combined with a deadline or token budget.
         :return: The input string with all numbers replaced with their corresponding digit representation.
         """
+        if workers < 1:
+            raise ValueError("The number of workers must be at least 1")
+
+        budget = Budget(deadline, max_tokens) if deadline is not None or max_tokens is not None else None
+        if budget is not None and workers > 1:
+            raise ValueError("A deadline or token budget cannot be combined with multiple workers")
+
+        # Conversions with a budget are not cached since their result depends on the time
+        if self.disk_cache is not None and budget is None:
+            result = self._convert_cached([text], lambda texts: [self._convert(texts[0], None, workers)])[0]
+        else:
+            result = self._convert(text, budget, workers)
+
+        if budget is not None:
+            return budget.finish(result, partial)
+        elif partial:
+            return ConversionResult(result)
+        else:
+            return result
+
+    def _convert(self, text: str, budget: Optional[Budget], workers: int) -> str:
+        if workers > 1 and len(text) >= 2 * _MIN_CHUNK_SIZE:
+            result = self._convert_parallel(text, workers)
+        elif self._instrumented():
+            result = self._convert_with_metrics(text, budget)
+        elif self.windowed and budget is None:
+            result = self._convert_windowed(text)
+        else:
+            # Tokenize the input string by assigning a type to each word (e.g. representing the number type like units (e.g. one) or teens (twelve))
+            # This makes it easier for the subsequent steps to decide which parts of the sentence need to be combined
+            # e.g. I like forty-two apples --> I [WordType.Other] like [WordType.Other] forty [WordType.TENS] two [WordType.UNITS] apples [WordType.Other]
+            tokens = self._lex(text, budget=budget)
+
+            # Apply a set of rules to the tokens to combine the numeric tokens and replace them with the corresponding digit
+            # e.g. I [WordType.Other] like [WordType.Other] 42 [ConcatenatedToken] apples [WordType.Other] (it merged the TENS and UNITS tokens)
+            result = self._parse(tokens, text, budget=budget)
+
+        return result
+
+    def _convert_parallel(self, text: str, workers: int) -> str:
+        start = time.perf_counter()
+
+        # A few chunks per worker balance the load if some chunks contain more numbers than others
+        chunk_size = max(_MIN_CHUNK_SIZE, len(text) // (workers * _CHUNKS_PER_WORKER))
+        chunks = self._split_safely(text, chunk_size)
+        if len(chunks) == 1:
+            # There is no safe cut, so there is nothing to distribute
+            return self._convert(text, None, 1)
+
+        configs = [tuple(sorted(self._config().items()))] * len(chunks)
+        converted = list(self._worker_pool(workers).map(_convert_chunk, configs, chunks))
+
+        if self.metrics is not None or self.slow_log is not None:
+            stats = CallStats()
+            for _, chunk_stats in converted:
+                for name in CallStats.__slots__:
+                    setattr(stats, name, getattr(stats, name) + getattr(chunk_stats, name))
+            self._observe(text, stats, time.perf_counter() - start)
+
+        return "".join(chunk[0] for chunk in converted)
+
+    def _worker_pool(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Returns the pool of worker processes, which is replaced if a different number of workers is requested.
+        """
+        with self._executor_lock:
+            if self._executor is None or self._executor_workers != workers:
+                if self._executor is not None:
+                    self._executor.shutdown()
+                self._executor = ProcessPoolExecutor(workers)
+                self._executor_workers = workers
+
+            return self._executor
+
+    def close(self) -> None:
+        """
+        Stops the worker processes of convert(text, workers=n) (if any). They are started again when needed.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+                self._executor_workers = 0
+
+    def __del__(self) -> None:
+        # Without waiting, since the instance may be collected while the interpreter shuts down (the attribute is missing if the constructor failed)
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _config(self) -> Dict[str, Any]:
+        """
+        Returns the constructor arguments which determine the result of a conversion (i.e. everything except for the metrics).
+        """
+        return {
+            "similarity_threshold": self.similarity_threshold,
+            "convert_ordinals": self.convert_ordinals,
+            "add_ordinal_ending": self.add_ordinal_ending,
+            "windowed": self.windowed,
+            "negation": self.negation,
+            "decimal_words": self.decimal_words,
+            "concatenate": self.concatenate,
+            "conjunctions": self.conjunctions,
+        }
+
+    def _split_safely(self, text: str, chunk_size: int) -> List[str]:
+        """
+        Splits the text into chunks of roughly chunk_size characters which can be converted independently, i.e. the concatenation of the converted chunks is the same as the converted text.
+
+        A chunk ends after the whitespace which follows a word that is neither part of a number nor a conjunction (e.g. apples in "two apples and three pears"). Such a word ends every number run before it and the conversion of the words after the cut does not depend on the words before the cut.
+        """
+        chunks = []
+        start = 0
+        while len(text) - start >= 2 * chunk_size:
+            cut = self._safe_cut(text, start + chunk_size)
+            if cut is None:
+                break
+            chunks.append(text[start:cut])
+            start = cut
+        chunks.append(text[start:])
+
+        return chunks
+
+    def _safe_cut(self, text: str, position: int) -> Optional[int]:
+        """
+        Returns the first position after *position* where the text can be cut safely (see _split_safely()) or None if there is no such position.
+        """
+        word_start = None
+        for match in _WHITESPACE_PAT.finditer(text, position):
+            # The end of a whitespace run is always the start of a token
+            if word_start is not None:
+                # Tokenizing from the previous token start gives the same tokens as tokenizing the whole text
+                *_, (word, _) = split_glues(text[word_start : match.end()])
+                if self._is_other_word(word):
+                    return match.end()
+            word_start = match.end()
+
+        return None
+
+    def _safe_cut_before(self, text: str, position: int, lower_bound: int) -> int:
+        """
+        Returns the last position before *position* (but not before *lower_bound*, which must be a safe position itself) where the text can be cut safely (see _split_safely()).
+        """
+        step = 64
+        while True:
+            # Look at the whitespace runs in a growing stretch before the position
+            window_start = max(lower_bound, position - step)
+            ends = [match.end() for match in _WHITESPACE_PAT.finditer(text, window_start, position)]
+
+            # The word before a whitespace run starts at the end of the previous run. The word before the first run only starts at a known token start if the stretch begins at the lower bound
+            if window_start == lower_bound:
+                spans = list(zip([lower_bound] + ends, ends))
+            else:
+                spans = list(zip(ends, ends[1:]))
+
+            for word_start, end in reversed(spans):
+                *_, (word, _) = split_glues(text[word_start:end])
+                if self._is_other_word(word):
+                    return end
+
+            if window_start == lower_bound:
+                return lower_bound
+            step *= 4
+
+    def _is_other_word(self, word: str) -> bool:
+        """
+        Checks whether the word becomes a token of type WordType.OTHER which is left unchanged by the spelling correction.
+        """
+        if self.similarity_threshold != 1:
+            matched_num = similar_number_word(word, self.similarity_threshold)
+            if matched_num is not None and matched_num != word:
+                return False
+
+        # Same classification as in Token (see number_words()) without creating a token
+        key = word.lower().replace(",", "")
+        return key not in self._number_words and _LITERAL_PAT.fullmatch(key) is None
+
+    def convert_to(self, source: Union[str, TextIO], writer: TextIO, chunk_size: int = STREAM_CHUNK_SIZE) -> int:
+        """
+        Converts all number representations of a text or a text stream and writes the result piece by piece, so that the converted text is never held in memory as a whole. The written text is the same as convert(text).
+
+        The input is converted in chunks of about chunk_size characters which end after words that cannot be part of a number (see _split_safely()). A stream is read in blocks of chunk_size characters, so the memory use only depends on the chunk size (unless the input has long stretches without such a word, e.g. a long list of numbers, which are kept in memory until they end). The disk cache is not used and metrics and the slow log observe each chunk as a separate conversion.
+
+        :param source: The input string or a stream with a read() method which returns strings (e.g. a file opened in text mode).
+        :param writer: An object with a write() method which accepts strings (e.g. a file opened in text mode). It receives one converted chunk per call.
+        :param chunk_size: The number of characters which are read and converted at once.
+        :return: The number of written characters.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk_size must be at least 1")
+
+        chunks = (
+            self._text_chunks(source, chunk_size)
+            if isinstance(source, str)
+            else self._stream_chunks(source, chunk_size)
+        )
+        n_written = 0
+        for chunk in chunks:
+            converted = self._convert(chunk, None, 1)
+            if converted:
+                writer.write(converted)
+                n_written += len(converted)
+
+        return n_written
+
+    def _text_chunks(self, text: str, chunk_size: int) -> Iterator[str]:
+        """
+        Yields chunks of the text which can be converted independently (see _split_safely()) without splitting the whole text at once.
+        """
+        start = 0
+        while len(text) - start > chunk_size:
+            cut = self._safe_cut(text, start + chunk_size)
+            if cut is None:
+                break
+            yield text[start:cut]
+            start = cut
+
+        yield text[start:]
+
+    def _stream_chunks(self, reader: TextIO, chunk_size: int) -> Iterator[str]:
+        """
+        Reads the stream in blocks and yields chunks which can be converted independently (see _split_safely()).
+
+        The blocks are only joined when a chunk is yielded. The search for a safe cut only covers the text from the last word which could not be checked yet, and it waits until a whitespace run has been completed (e.g. not within a very long word), so that a long stretch without safe cuts is still processed in linear time.
+        """
+        blocks: List[str] = []
+        n_pending = 0
+        # The text which still needs to be searched for a safe cut. It starts at window_start of the pending text
+        window: List[str] = []
+        window_start = 0
+        # Whether a whitespace run was completed since the last search, i.e. whether there may be a new safe cut
+        searchable = False
+        last_char = ""
+        while True:
+            block = reader.read(chunk_size)
+            if not block:
+                break
+
+            blocks.append(block)
+            window.append(block)
+            n_pending += len(block)
+            searchable = searchable or _WHITESPACE_END_PAT.search(last_char + block) is not None
+            last_char = block[-1]
+            if n_pending < chunk_size or not searchable:
+                continue
+            searchable = False
+
+            text = "".join(window)
+            # The whitespace at the end may continue in the next block, so it cannot be the end of a chunk yet. Cuts in the first half of the pending text would make the chunks small
+            searched = text.rstrip()
+            cut = self._safe_cut(searched, max(0, n_pending // 2 - window_start))
+            if cut is None:
+                # The last word is checked once the whitespace after it is complete
+                last_word = searched.rsplit(None, 1)[-1] if searched else ""
+                restart = max(0, len(searched) - len(last_word) - 1)
+                window = [text[restart:]]
+                window_start += restart
+                continue
+
+            pending = "".join(blocks)
+            yield pending[: window_start + cut]
+            rest = pending[window_start + cut :]
+            blocks = [rest]
+            window = [rest]
+            window_start = 0
+            n_pending = len(rest)
+            searchable = True
+
+        if n_pending:
+            yield "".join(blocks)
+
+    def convert_batch(self, texts: Iterable[str]) -> List[str]:
+        """
+        Converts all number representations in each of the texts to digits. The results are the same as calling convert() for each text.
+
+        With spelling correction (similarity_threshold < 1), the unique words of the whole batch are corrected at once before the texts are converted (using NumPy, if available, to score all words in one go).
+
+        :param texts: The input strings.
+        :return: The input strings with all numbers replaced with their corresponding digit representation.
+        """
+        texts = list(texts)
+        if self.disk_cache is not None:
+            return self._convert_cached(texts, self._convert_batch)
+
+        return self._convert_batch(texts)
+
+    def _convert_batch(self, texts: List[str]) -> List[str]:
+        if self.similarity_threshold == 1:
+            # Metrics and the slow log observe each conversion, so no text is skipped
+            if self.metrics is not None or self.slow_log is not None:
+                return [self._convert(text, None, 1) for text in texts]
+            return self._convert_scanned(texts)
+
+        corrections = similar_number_words(unique_words(texts), self.similarity_threshold)
+
+        results = []
+        for text in texts:
+            if self._instrumented():
+                results.append(self._convert_with_metrics(text, corrections=corrections))
+            else:
+                results.append(self._parse(self._lex(text, corrections=corrections), text))
+
+        return results
+
+    def _convert_scanned(self, texts: List[str]) -> List[str]:
+        """
+        Converts the texts without spelling correction. The joined texts are searched for the candidate pattern once (see _convert_windowed()) and only the texts with a match are converted, the others are returned unchanged. The results are the same as converting each text.
+        """
+        # The NUL character is neither a letter nor a digit, so the pattern matches at the start and the end of each text the same way as at the ends of a separate text
+        joined = "\x00".join(texts)
+        if joined.isascii():
+            joined = joined.lower()
+            pattern = candidate_pattern(False, self._disabled_types)
+        else:
+            pattern = candidate_pattern(True, self._disabled_types)
+
+        starts = []
+        position = 0
+        for text in texts:
+            starts.append(position)
+            position += len(text) + 1
+
+        results = list(texts)
+        index = 0
+        match = pattern.search(joined)
+        while match is not None:
+            index = bisect_right(starts, match.start(), index) - 1
+            results[index] = self._convert(texts[index], None, 1)
+            if index + 1 == len(texts):
+                break
+            match = pattern.search(joined, starts[index + 1])
+
+        return results
+
+    def _convert_cached(self, texts: List[str], convert: Callable[[List[str]], List[str]]) -> List[str]:
+        """
+        Looks up the results of the texts in the disk cache and converts (and stores) only the missing ones.
+
+        :param texts: The input strings.
+        :param convert: Converts a list of texts which are not in the cache.
+        """
+        assert self.disk_cache is not None
+        keys = self.disk_cache.keys(texts, self._config())
+        results = self.disk_cache.get_many(keys)
+
+        # Identical texts are converted once
+        missing = {key: text for key, text in zip(keys, texts) if key not in results}
+        if missing:
+            converted = dict(zip(missing, convert(list(missing.values()))))
+            self.disk_cache.set_many(converted.items())
+            results.update(converted)
+
+        if self.metrics is not None:
+            self.metrics.observe_cache("disk", len(texts) - len(missing), len(missing))
+
+        return [results[key] for key in keys]
+
+    def _convert_with_metrics(
+        self, text: str, budget: Optional[Budget] = None, corrections: Optional[Dict[str, Optional[str]]] = None
+    ) -> str:
+        stats = CallStats()
+        start = time.perf_counter()
+        result = self._convert_timed(text, stats, budget, corrections)
+        self._observe(text, stats, time.perf_counter() - start)
+
+        return result
+
+    def _convert_timed(
+        self,
+        text: str,
+        stats: CallStats,
+        budget: Optional[Budget] = None,
+        corrections: Optional[Dict[str, Optional[str]]] = None,
+    ) -> str:
+        """
+        Converts the text and measures the time spent in each stage.
+        """
+        if self.windowed and budget is None:
+            return self._convert_windowed(text, stats)
+
+        start = time.perf_counter()
+        tokens = self._lex(text, stats, budget, corrections)
+        lexed = time.perf_counter()
+        result = self._parse(tokens, text, stats, budget)
+        stats.lex_seconds += lexed - start
+        stats.parse_seconds += time.perf_counter() - lexed
+
+        return result
+
+    def _instrumented(self) -> bool:
+        """
+        Checks whether the next call collects statistics, i.e. whether metrics are collected or the call is sampled by the slow log.
+        """
+        return self.metrics is not None or (self.slow_log is not None and self.slow_log.sample())
 
-        # Tokenize the input string by assigning a type to each word (e.g. representing the number type like units (e.g. one) or teens (twelve))
-        # This makes it easier for the subsequent steps to decide which parts of the sentence need to be combined
-        # e.g. I like forty-two apples --> I [WordType.Other] like [WordType.Other] forty [WordType.TENS] two [WordType.UNITS] apples [WordType.Other]
-        tokens = self._lex(text)
+    def _observe(self, text: Union[str, BytesLike], stats: CallStats, seconds: float) -> None:
+        """
+        Hands the statistics of a call to the metrics registry and the slow log.
+        """
+        if self.metrics is not None:
+            n_bytes = text_size(text) if isinstance(text, str) else len(text)
+            self.metrics.observe_call(n_bytes, stats.tokens, stats.numbers, stats.corrections, seconds)
+            if self._phrase_cache is not None:
+                self.metrics.observe_cache("phrase", stats.phrase_hits, stats.phrase_misses)
+
+        if self.slow_log is not None:
+            self.slow_log.observe(text, self._config(), seconds, stats.stages(), stats.tokens, stats.numbers)
+
+    def _convert_windowed(self, text: str, stats: Optional[CallStats] = None) -> str:
+        """
+        Converts only the windows of the text which may contain numbers. Each match of the candidate pattern is extended to the closest safe positions before and after it (see _split_safely()), so the window is converted the same way as within the whole text. The text between the windows does not contain any number-related words and is copied unchanged.
+        """
+        # Lowercasing ASCII texts does not change the positions and allows a faster case-sensitive pattern
+        if text.isascii():
+            scanned = text.lower()
+            pattern = candidate_pattern(False, self._disabled_types)
+        else:
+            scanned = text
+            pattern = candidate_pattern(True, self._disabled_types)
+
+        parts = []
+        emitted = 0
+        match = pattern.search(scanned)
+        while match is not None:
+            start = self._safe_cut_before(text, match.start(), emitted)
+            end = self._safe_cut(text, match.end())
+            if end is None:
+                end = len(text)
+
+            window = text[start:end]
+            parts.append(text[emitted:start])
+            if stats is None:
+                parts.append(self._parse(self._lex(window), window))
+            else:
+                window_start = time.perf_counter()
+                tokens = self._lex(window, stats)
+                lexed = time.perf_counter()
+                parts.append(self._parse(tokens, window, stats))
+                stats.lex_seconds += lexed - window_start
+                stats.parse_seconds += time.perf_counter() - lexed
+            emitted = end
+
+            match = pattern.search(scanned, end)
+
+        parts.append(text[emitted:])
+
+        return "".join(parts)
+
+    def convert_bytes(self, data: BytesLike) -> bytes:
+        """
+        Converts all number representations in UTF-8 encoded data to digits. The result is the same as convert(data.decode()).encode().
+
+        ASCII data is processed without decoding it: the words are matched against the number vocabulary as bytes, only the number runs are decoded and converted and everything else is copied unchanged. Data with non-ASCII characters which matter for the tokenization (whitespace, digits and characters with an ASCII lowercase form) as well as spelling correction (similarity_threshold < 1) fall back to decoding the data.
+
+        :param data: The UTF-8 encoded input (bytes, bytearray or memoryview).
+        :return: The UTF-8 encoded input with all numbers replaced with their corresponding digit representation.
+        """
+        if isinstance(data, memoryview) and data.format != "B":
+            data = data.cast("B")
+        if self.similarity_threshold != 1 or not has_only_inert_non_ascii(data):
+            return self.convert(str(data, "utf-8")).encode("utf-8")
+
+        stats = CallStats() if self._instrumented() else None
+        start_time = time.perf_counter()
+
+        tokens = self._lex_bytes(data, stats)
+        lexed = time.perf_counter()
+
+        parts: List[BytesLike] = []
+        emitted = 0
+        for start, end, replacement in self._replacements(tokens, data, stats):
+            parts.append(data[emitted:start])
+            parts.append(replacement.encode("ascii"))
+            emitted = end
+        parts.append(data[emitted:])
+        result = b"".join(parts)
+
+        if stats is not None:
+            end_time = time.perf_counter()
+            stats.lex_seconds = lexed - start_time
+            stats.parse_seconds = end_time - lexed
+            self._observe(data, stats, end_time - start_time)
+
+        return result
+
+    def convert_arrow(self, data: BytesLike, offsets: Any) -> Tuple[bytearray, "array[int]"]:
+        """
+        Converts a column of UTF-8 encoded strings in the Arrow layout, i.e. one contiguous data buffer and an offsets buffer where row i spans data[offsets[i]:offsets[i + 1]]. Each converted row is the same as convert_bytes() of the row.
+
+        Without spelling correction, the data buffer is scanned once for possible numbers. Rows without a match are copied unchanged (in stretches of consecutive rows) and only the remaining rows are sliced and converted. Rows which are copied unchanged are not validated as UTF-8 and are not counted in the metrics.
+
+        :param data: The data buffer (bytes, bytearray or memoryview).
+        :param offsets: The offsets buffer with 32 or 64 bit signed integers in native byte order (e.g. an array.array or NumPy array).
+        :return: A new data buffer and offsets array (starting at 0) with the converted rows. The offsets have the same integer size as the input offsets.
+        :raises ValueError: If the offsets buffer has an unsupported format or the offsets are outside of the data buffer.
+        :raises OverflowError: If the converted data does not fit into 32 bit offsets.
+        """
+        view = memoryview(data)
+        if view.format != "B":
+            view = view.cast("B")
+        positions = offsets_view(offsets)
+
+        out = bytearray()
+        out_offsets = array(positions.format)
+        if len(positions) == 0:
+            return out, out_offsets
+        n_rows = len(positions) - 1
+        if positions[0] < 0 or positions[n_rows] > len(view):
+            raise ValueError("The offsets must be within the data buffer")
+
+        out_offsets.append(0)
+        if self.similarity_threshold == 1:
+            candidates: Iterable[int] = self._candidate_rows(view, positions)
+        else:
+            candidates = range(n_rows)
 
-        # Apply a set of rules to the tokens to combine the numeric tokens and replace them with the corresponding digit
-        # e.g. I [WordType.Other] like [WordType.Other] 42 [ConcatenatedToken] apples [WordType.Other] (it merged the TENS and UNITS tokens)
-        text = self._parse(tokens)
+        row = 0
+        for candidate in candidates:
+            self._copy_rows(view, positions, row, candidate, out, out_offsets)
+            out += self.convert_bytes(view[positions[candidate] : positions[candidate + 1]])
+            out_offsets.append(len(out))
+            row = candidate + 1
 
-        return text
+        self._copy_rows(view, positions, row, n_rows, out, out_offsets)
 
-    def _lex(self, text: str) -> List[Token]:
+        return out, out_offsets
+
+    @staticmethod
+    def _candidate_rows(data: memoryview, positions: memoryview) -> Iterator[int]:
+        """
+        Yields the indices of all rows which may contain a number in ascending order.
+        """
+        pattern = candidate_pattern_bytes()
+        n_rows = len(positions) - 1
+        row = 0
+        while row < n_rows:
+            # The data is scanned in stretches of whole rows which are lowercased at once (a match across a row boundary only makes the first row a candidate)
+            stop = bisect_left(positions, positions[row] + _SCAN_CHUNK_SIZE, row + 1, n_rows)
+            base = positions[row]
+            chunk = data[base : positions[stop]].tobytes().lower()
+
+            match = pattern.search(chunk)
+            while match is not None:
+                # The match starts in the last row whose offset is not larger than the match position (empty rows have equal offsets)
+                candidate = bisect_right(positions, base + match.start(), row, stop) - 1
+                yield candidate
+                if candidate + 1 == stop:
+                    break
+                match = pattern.search(chunk, positions[candidate + 1] - base)
+
+            row = stop
+
+    @staticmethod
+    def _copy_rows(
+        data: memoryview, positions: memoryview, first: int, stop: int, out: bytearray, out_offsets: "array[int]"
+    ) -> None:
+        """
+        Appends the rows [first, stop) unchanged to the output buffers.
+        """
+        if first >= stop:
+            return
+
+        shift = len(out) - positions[first]
+        out += data[positions[first] : positions[stop]]
+        if shift == 0:
+            out_offsets.frombytes(positions[first + 1 : stop + 1].cast("B"))
+        else:
+            out_offsets.extend(position + shift for position in positions[first + 1 : stop + 1])
+
+    def _lex(
+        self,
+        text: str,
+        stats: Optional[CallStats] = None,
+        budget: Optional[Budget] = None,
+        corrections: Optional[Dict[str, Optional[str]]] = None,
+    ) -> List[Token]:
         """
         This function takes an arbitrary input string, splits it into tokens (words) and assigns each token a type corresponding to the role in the sentence.
 
         :param text: The input string.
+        :param stats: Collects the events of the call (if provided).
+        :param budget: Stops the tokenization when the budget runs out (if provided). The remaining input is not tokenized.
+        :param corrections: Precomputed spelling corrections (if provided), see convert_batch(). Words without an entry are corrected individually.
         :return: The tokenized input string.
         """
         tokens = []
+        disabled_types = self._disabled_types
+        correct_spelling = self.similarity_threshold != 1
 
         conjunctions = []
-        for i, (word, glue) in enumerate(split_glues(text)):
+        text_length = len(text)
+        # The words are split and sorted into kinds by a single regex pass (see scan())
+        for i, match in enumerate(scanner_pattern().finditer(text)):
+            start = match.start()
+            if start == text_length:
+                break
+            if budget is not None and budget.lexing_exhausted(i, start):
+                break
+
+            number, literal, other, word, glue = match.groups()
+            # The scanner already knows that other words are not number-related, so they are not classified again
+            if other is not None:
+                if not correct_spelling:
+                    tokens.append(Token(other, glue, start, other_word_class(other)))
+                    continue
+                word = other
+            elif word is None:
+                word = number if number is not None else literal
+
             # Address spelling corrections
-            if self.similarity_threshold != 1:
-                matched_num = find_similar_word(word, Token.numwords.keys(), self.similarity_threshold)
+            classification = None
+            if correct_spelling:
+                if corrections is not None and word in corrections:
+                    matched_num = corrections[word]
+                else:
+                    matched_num = similar_number_word(word, self.similarity_threshold)
                 if matched_num is not None:
+                    if stats is not None and matched_num != word:
+                        stats.corrections += 1
                     word = matched_num
+                elif other is not None:
+                    classification = other_word_class(word)
 
-            token = Token(word, glue)
+            token = Token(word, glue, start, classification)
+            if disabled_types and token.type in disabled_types:
+                token.type = WordType.OTHER
             tokens.append(token)
 
             # Conjunctions need special treatment since they can be used for both, to combine numbers or to combine other parts in the sentence
             if token.type == WordType.CONJUNCTION:
                 conjunctions.append(i)
 
-        # A word should only have the type WordType.CONJUNCTION when it actually combines two digits and not some other words in the sentence
+        if budget is not None and budget.truncated_at is not None:
+            budget.truncated_at = self._drop_cut_run(tokens, text, budget.truncated_at)
+            conjunctions = [i for i in conjunctions if i < len(tokens)]
+
+        self._resolve_conjunctions(tokens, conjunctions)
+        if stats is not None:
+            stats.tokens += len(tokens)
+
+        return tokens
+
+    def _lex_bytes(self, data: BytesLike, stats: Optional[CallStats] = None) -> List[Token]:
+        """
+        Byte counterpart of _lex() for data which passes has_only_inert_non_ascii(). The words are matched against the number vocabulary without decoding them and only the number-related words become real tokens. Each stretch of other words is represented by a single empty OTHER token which marks the start of the stretch.
+
+        :param data: The input data.
+        :param stats: Collects the events of the call (if provided).
+        :return: The tokenized input data (offsets are byte offsets).
+        """
+        # The words of disabled features are left out of the vocabulary, so they become part of the stretches of other words
+        vocabulary = number_words_bytes(self._disabled_types)
+        tokens: List[Token] = []
+
+        conjunctions = []
+        offset = 0
+        n_words = 0
+        in_other_words = False
+        for word, glue in split_glues_bytes(data):
+            start = offset
+            offset += len(word) + len(glue)
+            n_words += 1
+
+            key = bytes(word).lower().replace(b",", b"")
+            if key in vocabulary or _LITERAL_BYTES_PAT.fullmatch(key):
+                token = Token(str(word, "ascii"), str(glue, "ascii"), start)
+                if token.type == WordType.CONJUNCTION:
+                    conjunctions.append(len(tokens))
+                tokens.append(token)
+                in_other_words = False
+            elif not in_other_words:
+                tokens.append(Token("", "", start))
+                in_other_words = True
+
+        self._resolve_conjunctions(tokens, conjunctions)
+        if stats is not None:
+            stats.tokens = n_words
+
+        return tokens
+
+    def _drop_cut_run(self, tokens: List[Token], text: str, end: int) -> int:
+        """
+        Removes the number run at the end of the tokens when the tokenization ran out of budget, since the run may continue in the untokenized remainder (e.g. "twenty | one"). The run is copied unchanged instead, so that the partial result is the conversion of the input up to the returned offset followed by the raw remainder.
+
+        :param tokens: The tokens created before the budget ran out. They are modified in place.
+        :param text: The input string.
+        :param end: The offset where the tokenization stopped.
+        :return: The offset where the unconverted remainder starts.
+        """
+        corrected = self.similarity_threshold != 1
+        while tokens and (
+            tokens[-1].type != WordType.OTHER or (corrected and self._is_corrected(tokens, len(tokens) - 1, text, end))
+        ):
+            end = tokens.pop().start
+
+        return end
+
+    @staticmethod
+    def _resolve_conjunctions(tokens: List[Token], conjunctions: List[int]) -> None:
+        """
+        A word should only have the type WordType.CONJUNCTION when it actually combines two digits and not some other words in the sentence.
+
+        :param tokens: The tokens of the input.
+        :param conjunctions: The indices of the tokens which were classified as WordType.CONJUNCTION.
+        """
         for i in conjunctions:
             if i >= len(tokens) - 1 or tokens[i + 1].type in [WordType.CONJUNCTION, WordType.OTHER]:
                 tokens[i].type = WordType.OTHER
 
-        return tokens
-
-    def _parse(self, tokens: List[Token]) -> str:
+    def _parse(
+        self, tokens: List[Token], text: str, stats: Optional[CallStats] = None, budget: Optional[Budget] = None
+    ) -> str:
         """
         Parses the tokenized input based on predefined rules which combine certain tokens to find the correct digit representation of the textual number description.
 
         :param tokens: The tokenized input string.
+        :param text: The input string the tokens were created from.
+        :param stats: Collects the events of the call (if provided).
+        :param budget: Stops the conversion before the next number run when the budget runs out (if provided). The remaining input is copied unchanged.
         :return: The transformed input string.
         """
-        # Apply each rule to process the tokens
+        # The output is assembled in one join from the untouched stretches of the input and the replacements
+        parts = []
+        emitted = 0
+        for start, end, replacement in self._replacements(tokens, text, stats, budget):
+            parts.append(text[emitted:start])
+            parts.append(replacement)
+            emitted = end
+        parts.append(text[emitted:])
+
+        return "".join(parts)
+
+    def _replacements(
+        self,
+        tokens: List[Token],
+        text: Union[str, BytesLike],
+        stats: Optional[CallStats] = None,
+        budget: Optional[Budget] = None,
+    ) -> Iterator[Tuple[int, int, str]]:
+        """
+        Finds the spans of the input which need to be replaced.
+
+        The rules only ever combine consecutive tokens which are not of type WordType.OTHER. Hence, the tokens are processed in a single forward pass: OTHER tokens are skipped (they stay untouched in the input) while each run of number-related tokens is passed through all rules and rendered on its own.
+
+        :param tokens: The tokenized input string.
+        :param text: The input string (or data) the tokens were created from.
+        :param stats: Collects the events of the call (if provided).
+        :param budget: Stops the generator before the next number run when the budget runs out (if provided).
+        :return: A generator yielding (start, end, replacement) tuples in the order of the input.
+        """
+        # With spelling correction enabled, an OTHER token may hold a corrected word which differs from the input
+        corrected = self.similarity_threshold != 1
+        n_tokens = len(tokens)
+        # The tokens may only cover a prefix of the input if the tokenization ran out of budget
+        tokens_end = len(text) if budget is None or budget.truncated_at is None else budget.truncated_at
+        i = 0
+
+        while i < n_tokens:
+            token = tokens[i]
+            if token.type == WordType.OTHER and not (corrected and self._is_corrected(tokens, i, text, tokens_end)):
+                i += 1
+                continue
+
+            if budget is not None and budget.parsing_exhausted(token.start):
+                return
+
+            # Find the end of the number run (the next OTHER token)
+            j = i + 1
+            while j < n_tokens and tokens[j].type != WordType.OTHER:
+                j += 1
+
+            end = tokens[j].start if j < n_tokens else tokens_end
+            yield token.start, end, self._replace_run(tokens, i, j, text, end, stats)
+
+            i = j
+
+    def _replace_run(
+        self,
+        tokens: List[Token],
+        i: int,
+        j: int,
+        text: Union[str, BytesLike],
+        end: int,
+        stats: Optional[CallStats] = None,
+    ) -> str:
+        """
+        Returns the replacement of the number run tokens[i:j] which spans text[tokens[i].start:end].
+
+        The tokens of a run (and hence its replacement) only depend on the input text of the run: the words determine the types and a conjunction at the end of a run is never kept. The glue of the last word is the end of the replacement and is not part of the cache key, so that e.g. "twenty one " and "twenty one." share an entry.
+        """
+        cache = self._phrase_cache
+        glue = tokens[j - 1].glue
+        start = tokens[i].start
+        key_end = end - len(glue)
+        if cache is None or key_end - start > _MAX_PHRASE_LENGTH:
+            run: List = tokens[i:j]
+            for rule in self._rules:
+                run = self._apply_rule(rule, run)
+            return self._tokens_to_string(run, stats)
+
+        key = text[start:key_end] if isinstance(text, str) else bytes(text[start:key_end])
+        cached = cache.get(key)
+        if cached is not None:
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                # Removed by another thread in the meantime
+                pass
+            replacement, n_numbers = cached
+            if stats is not None:
+                stats.numbers += n_numbers
+                stats.phrase_hits += 1
+            return replacement + glue
+
+        run = tokens[i:j]
         for rule in self._rules:
-            new_tokens = []
-            i = 0
-
-            while i < len(tokens):
-                if tokens[i].is_ordinal() and not self.convert_ordinals:
-                    # When keeping ordinal numbers, treat the whole number (which may consists of multiple parts, e.g. ninety-seventh) as a normal word
-                    tokens[i].type = WordType.OTHER
-
-                if tokens[i].type != WordType.OTHER:
-                    # Check how many tokens this rule wants to process...
-                    n_match = rule.match(tokens[i:])
-                    if n_match > 0:
-                        # ... and then merge these tokens into a new one (e.g. a token representing the digit)
-                        token = rule.action(tokens[i : i + n_match])
-                        new_tokens.append(token)
-                        i += n_match
-                    else:
-                        new_tokens.append(tokens[i])
-                        i += 1
+            run = self._apply_rule(rule, run)
+        run_stats = CallStats()
+        replacement = self._tokens_to_string(run, run_stats)
+
+        cache[key] = (replacement[: len(replacement) - len(glue)], run_stats.numbers)
+        if len(cache) > self.phrase_cache_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                pass
+        if stats is not None:
+            stats.numbers += run_stats.numbers
+            stats.phrase_misses += 1
+
+        return replacement
+
+    @staticmethod
+    def _is_corrected(tokens: List[Token], i: int, text: Union[str, BytesLike], tokens_end: int) -> bool:
+        """
+        Checks whether the word of the token at index *i* was changed by the spelling correction.
+        """
+        token = tokens[i]
+        end = tokens[i + 1].start if i + 1 < len(tokens) else tokens_end
+        return text[token.start : end] != token.word_raw + token.glue
+
+    def _apply_rule(self, rule: Rule, tokens: List) -> List:
+        """
+        Applies a single rule to a number run.
+
+        :param rule: The rule to apply.
+        :param tokens: The tokens of the number run.
+        :return: The new tokens where all matches of the rule are replaced by the corresponding rule token.
+        """
+        new_tokens = []
+        i = 0
+
+        while i < len(tokens):
+            if tokens[i].is_ordinal() and not self.convert_ordinals:
+                # When keeping ordinal numbers, treat the whole number (which may consists of multiple parts, e.g. ninety-seventh) as a normal word
+                tokens[i].type = WordType.OTHER
+
+            if tokens[i].type != WordType.OTHER:
+                # Check how many tokens this rule wants to process...
+                n_match = rule.match(tokens, i)
+                if n_match > 0:
+                    # ... and then merge these tokens into a new one (e.g. a token representing the digit)
+                    token = rule.action(tokens[i : i + n_match])
+                    new_tokens.append(token)
+                    i += n_match
                 else:
                     new_tokens.append(tokens[i])
                     i += 1
+            else:
+                new_tokens.append(tokens[i])
+                i += 1
 
-            tokens = new_tokens
-
-        return self._tokens_to_string(tokens)
+        return new_tokens
 
     def _consume_numeric(self, tokens: List, i: int) -> Tuple[str, str, int]:
         """
@@ -160,20 +1086,21 @@ class Text2Digits:
 
         return tok_text, token.glue, 1
 
-    def _tokens_to_string(self, tokens: List) -> str:
+    def _tokens_to_string(self, tokens: List, stats: Optional[CallStats] = None) -> str:
         """
         Reconstruct the final string from the processed token list, applying
         negation (``negative``/``minus`` → unary ``-``) and decimal-word
-        (``X point Y`` → ``X.Y``) post-processing.
+        (``X point Y`` → ``X.Y``) post-processing. Each emitted number is
+        counted in *stats* (if provided).
         """
-        text = ""
+        parts = []
         i = 0
         while i < len(tokens):
             token = tokens[i]
 
             # Unconverted ordinals are emitted verbatim
             if token.is_ordinal() and not self.convert_ordinals:
-                text += token.word_raw + token.glue
+                parts.append(token.word_raw + token.glue)
                 i += 1
                 continue
 
@@ -182,24 +1109,43 @@ class Text2Digits:
                 j = i + 1
                 if j < len(tokens) and tokens[j].type in _NUMERIC_TYPES:
                     num_text, glue, consumed = self._consume_numeric(tokens, j)
-                    text += "-" + num_text + glue
+                    parts.append("-" + num_text + glue)
+                    if stats is not None:
+                        stats.numbers += 1
                     i = j + consumed
                     continue
                 # Not followed by a number — fall through and emit as a plain word
-                text += token.word_raw + token.glue
+                parts.append(token.word_raw + token.glue)
                 i += 1
                 continue
 
             # Numeric tokens: check for "X point Y" decimal-word pattern
             if token.type in _NUMERIC_TYPES:
                 num_text, glue, consumed = self._consume_numeric(tokens, i)
-                text += num_text + glue
+                parts.append(num_text + glue)
+                if stats is not None:
+                    stats.numbers += 1
                 i += consumed
                 continue
 
             # Everything else (OTHER, CONJUNCTION, DECIMAL_SEPARATOR without a
             # preceding numeric, …) passes through unchanged
-            text += token.text() + token.glue
+            parts.append(token.text() + token.glue)
             i += 1
 
-        return text
+        return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def _chunk_converter(config: Tuple[Tuple[str, Any], ...]) -> Text2Digits:
+    return Text2Digits(**dict(config))
+
+
+def _convert_chunk(config: Tuple[Tuple[str, Any], ...], text: str) -> Tuple[str, CallStats]:
+    """
+    Converts a chunk of a text in a worker process of Text2Digits.convert(). Returns the result and the statistics of the call.
+    """
+    t2d = _chunk_converter(config)
+    stats = CallStats()
+
+    return t2d._convert_timed(text, stats), stats
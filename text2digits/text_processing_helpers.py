@@ -1,5 +1,15 @@
 import re
-from typing import Iterable, Iterator, Optional, Tuple
+import sys
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple, Union
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment]
+
+# Number of words which are scored at once by BigramIndex.find_similar_words() (limits the size of the matrices)
+_SCORING_CHUNK_SIZE = 4096
 
 
 def bigram_similarity(word1: str, word2: str) -> float:
@@ -54,7 +64,150 @@ def find_similar_word(word: str, collection: Iterable[str], threshold: float) ->
     return match
 
 
-def split_glues(text: str, separator: str = r"\s+|(?<=\D)[.,;:\-_](?=\D|$)") -> Iterator[Tuple[str, str]]:
+class BigramIndex:
+    def __init__(self, collection: Iterable[str]) -> None:
+        """
+        Inverted index from bigrams to the words of a collection. It finds the same word as find_similar_word() (including ties, which are won by the first word in the collection) but only scores the words which share at least one bigram with the searched word and are not too long to reach the threshold.
+
+        :param collection: The words to search in.
+        """
+        self._words = list(collection)
+        self._bigram_counts = []
+
+        # Words shorter than two characters have no bigrams and are only similar to equal words
+        self._short_words: Dict[str, int] = {}
+
+        postings: Dict[str, List[int]] = {}
+        for index, item in enumerate(self._words):
+            item = item.lower()
+            bigrams = [item[i : i + 2] for i in range(len(item) - 1)]
+            self._bigram_counts.append(len(bigrams))
+            if not bigrams:
+                self._short_words.setdefault(item, index)
+            for bigram in dict.fromkeys(bigrams):
+                postings.setdefault(bigram, []).append(index)
+
+        # The postings are sorted by the number of bigrams of the words so that long words can be skipped with a bisection
+        self._postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        for bigram, indices in postings.items():
+            indices.sort(key=lambda index: self._bigram_counts[index])
+            self._postings[bigram] = ([self._bigram_counts[index] for index in indices], indices)
+
+        # Bigram-by-word presence matrix for find_similar_words() (built on first use)
+        self._presence: Any = None
+
+    def find_similar_word(self, word: str, threshold: float) -> Optional[str]:
+        """
+        Returns the most syntactically similar word in the collection to the specified word (see find_similar_word()).
+
+        :param word: The word to search for.
+        :param threshold: The minimal similarity of the returned word.
+        :return: The most similar word or None if no word in the collection has a positive similarity which meets the threshold.
+        """
+        word = word.lower()
+        n_bigrams = len(word) - 1
+        if n_bigrams <= 0:
+            index = self._short_words.get(word)
+            return self._words[index] if index is not None and threshold <= 1 else None
+
+        # The similarity is at most n_bigrams / max(n_bigrams, item_bigrams), so longer words cannot reach the threshold (with a margin for rounding)
+        max_item_bigrams = int(n_bigrams / threshold) + 1 if threshold > 0 else sys.maxsize
+
+        shared: Dict[int, int] = {}
+        for i in range(n_bigrams):
+            posting = self._postings.get(word[i : i + 2])
+            if posting is not None:
+                lengths, indices = posting
+                for index in indices[: bisect_right(lengths, max_item_bigrams)]:
+                    shared[index] = shared.get(index, 0) + 1
+
+        match = None
+        max_similarity = 0.0
+        for index, count in shared.items():
+            # Same computation as in bigram_similarity() so that the comparisons with the threshold are identical
+            similarity = float(count) / float(max(n_bigrams, self._bigram_counts[index]))
+            if similarity >= threshold and (
+                similarity > max_similarity or (similarity == max_similarity and match is not None and index < match)
+            ):
+                match = index
+                max_similarity = similarity
+
+        return None if match is None else self._words[match]
+
+    def find_similar_words(self, words: Iterable[str], threshold: float) -> Dict[str, Optional[str]]:
+        """
+        Returns the most syntactically similar word in the collection for each of the words (see find_similar_word()). If NumPy is available, the words are scored all at once by multiplying their bigram counts with the bigram presence matrix of the collection.
+
+        :param words: The words to search for (duplicates are only searched once).
+        :param threshold: The minimal similarity of the returned words.
+        :return: Mapping from each word to its most similar word or None.
+        """
+        matches: Dict[str, Optional[str]] = {}
+        long_words = []
+        for word in dict.fromkeys(words):
+            if numpy is None or len(word.lower()) < 2:
+                matches[word] = self.find_similar_word(word, threshold)
+            else:
+                long_words.append(word)
+
+        for start in range(0, len(long_words), _SCORING_CHUNK_SIZE):
+            chunk = long_words[start : start + _SCORING_CHUNK_SIZE]
+            for word, match in zip(chunk, self._find_similar_words_numpy(chunk, threshold)):
+                matches[word] = match
+
+        return matches
+
+    def _find_similar_words_numpy(self, words: List[str], threshold: float) -> List[Optional[str]]:
+        if self._presence is None:
+            self._bigram_ids = {bigram: i for i, bigram in enumerate(self._postings)}
+            self._presence = numpy.zeros((len(self._bigram_ids), len(self._words)), dtype=numpy.int32)
+            for bigram, (_, indices) in self._postings.items():
+                self._presence[self._bigram_ids[bigram], indices] = 1
+            self._item_bigrams = numpy.array(self._bigram_counts, dtype=numpy.float64)
+
+        # Bigram counts of the words (with their multiplicity, as in bigram_similarity()). Bigrams which do not occur in the collection do not contribute to the similarity
+        counts = numpy.zeros((len(words), len(self._bigram_ids)), dtype=numpy.int32)
+        n_bigrams = numpy.empty(len(words), dtype=numpy.float64)
+        rows = []
+        columns = []
+        for row, word in enumerate(words):
+            word = word.lower()
+            n_bigrams[row] = len(word) - 1
+            for i in range(len(word) - 1):
+                column = self._bigram_ids.get(word[i : i + 2])
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+        numpy.add.at(counts, (rows, columns), 1)
+
+        # The float64 division gives the same values as bigram_similarity(), so the comparisons with the threshold are identical
+        similarity = (counts @ self._presence) / numpy.maximum(n_bigrams[:, None], self._item_bigrams[None, :])
+        similarity[similarity < threshold] = 0
+
+        # argmax() returns the first maximum, i.e. ties are won by the first word in the collection
+        best = similarity.argmax(axis=1)
+        best_similarity = similarity[numpy.arange(len(words)), best]
+
+        return [
+            self._words[index] if value > 0 else None for index, value in zip(best.tolist(), best_similarity.tolist())
+        ]
+
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+_DEFAULT_SEPARATOR = r"\s+|(?<=\D)[.,;:\-_](?=\D|$)"
+_DEFAULT_SEPARATOR_PAT = re.compile(_DEFAULT_SEPARATOR)
+_PUNCTUATION_GLUES = ".,;:-_"
+# Byte counterpart of the default separator for ASCII data. The whitespace class lists all ASCII characters which are
+# matched by \s in str patterns (\s in bytes patterns does not include the information separators \x1c-\x1f)
+_DEFAULT_SEPARATOR_BYTES_PAT = re.compile(rb"[\t-\r\x1c- ]+|(?<=[^0-9])[.,;:\-_](?=[^0-9]|$)")
+_PUNCTUATION_GLUES_BYTES = b".,;:-_"
+_NON_ASCII_BYTES_PAT = re.compile(rb"[\x80-\xff]+")
+# \u0130 (İ) and \u212a (Kelvin sign) are the only non-ASCII characters whose lowercase form contains ASCII letters
+_SIGNIFICANT_NON_ASCII_PAT = re.compile(r"[\s\d\u0130\u212a]")
+
+
+def split_glues(text: str, separator: str = _DEFAULT_SEPARATOR) -> Iterator[Tuple[str, str]]:
     """
     Splits a string and preserves the glue, i.e. the separator fragments.
     This is useful when words of a sentence should be processed while still
@@ -67,16 +220,92 @@ def split_glues(text: str, separator: str = r"\s+|(?<=\D)[.,;:\-_](?=\D|$)") ->
              the whitespace next to it. If no glue is left, an empty string
              is returned.
     """
+    if separator != _DEFAULT_SEPARATOR:
+        yield from _split_glues_sliced(text, re.compile(separator))
+    else:
+        yield from _split_glues_from_offsets(text, _DEFAULT_SEPARATOR_PAT, _PUNCTUATION_GLUES)
 
-    separator_pat = re.compile(separator)
 
-    while text:
-        match = separator_pat.search(text)
+def split_glues_bytes(data: BytesLike) -> Iterator[Tuple[BytesLike, BytesLike]]:
+    """
+    Byte counterpart of split_glues() with the default separator. For data which passes has_only_inert_non_ascii(), the result is the same as splitting the decoded string.
+
+    :param data: The data to be split.
+    :return: A generator yielding (match, glue) pairs. The words are slices of *data*.
+    """
+    return _split_glues_from_offsets(data, _DEFAULT_SEPARATOR_BYTES_PAT, _PUNCTUATION_GLUES_BYTES)
+
+
+def unique_words(texts: Iterable[str]) -> Set[str]:
+    """
+    Returns the unique words of the texts when split at the default separator of split_glues(). This is much faster than collecting the words from split_glues(), but punctuation at the start of a word is a separator here while split_glues() keeps it in the word (e.g. ".five").
+
+    :param texts: The texts to split.
+    :return: The set of words.
+    """
+    words: Set[str] = set()
+    for text in texts:
+        words.update(_DEFAULT_SEPARATOR_PAT.split(text))
+    words.discard("")
+
+    return words
+
+
+def has_only_inert_non_ascii(data: BytesLike) -> bool:
+    """
+    Checks whether UTF-8 encoded data can be tokenized without decoding it, i.e. none of its non-ASCII characters is whitespace, a digit or a character whose lowercase form contains ASCII letters (which could turn it into a number word).
+
+    :param data: The UTF-8 encoded data.
+    :return: True if the data can be tokenized byte-wise.
+    :raises UnicodeDecodeError: If the non-ASCII parts of the data are not valid UTF-8.
+    """
+    if not isinstance(data, memoryview) and data.isascii():
+        return True
+
+    # Multi-byte UTF-8 sequences consist of non-ASCII bytes only. Hence, only the non-ASCII stretches need to be decoded
+    for match in _NON_ASCII_BYTES_PAT.finditer(data):
+        if _SIGNIFICANT_NON_ASCII_PAT.search(match.group().decode("utf-8")):
+            return False
+
+    return True
+
+
+def _split_glues_from_offsets(text: Any, separator_pat: Pattern, punctuation: Any) -> Iterator[Tuple[Any, Any]]:
+    """
+    Implementation of split_glues() for the default separator which works on str and bytes-like objects.
+
+    Searching from an offset instead of slicing off the processed prefix keeps this linear in the length of the text. The semantics of the slicing implementation are preserved: there, the remaining text starts right after the previous glue so the lookbehind of the punctuation separator never matched at the first position.
+    """
+    pos = 0
+    text_length = len(text)
+
+    while pos < text_length:
+        match = separator_pat.search(text, pos)
+        if match and pos > 0 and match.start() == pos and text[pos] in punctuation:
+            match = separator_pat.search(text, pos + 1)
+
         if not match:
             # No separator remains; the whole tail is a single word with no
             # trailing glue. The tail is kept verbatim (including characters
             # like '.', '-', '%', etc.) so downstream tokenization can decide
             # whether it is a numeric literal or an opaque OTHER token.
+            yield text[pos:], text[:0]
+            break
+
+        yield text[pos : match.start()], match.group()
+
+        # Proceed with the remaining string
+        pos = match.end()
+
+
+def _split_glues_sliced(text: str, separator_pat: Pattern[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Implementation of split_glues() for custom separators. The processed prefix is sliced off after each match so that
+    anchors and lookarounds of arbitrary separators see the remaining text as a new string.
+    """
+    while text:
+        match = separator_pat.search(text)
+        if not match:
             yield text, ""
             break
 
@@ -84,3 +313,24 @@ def split_glues(text: str, separator: str = r"\s+|(?<=\D)[.,;:\-_](?=\D|$)") ->
 
         # Proceed with the remaining string
         text = text[match.end() :]
+
+
+def offsets_view(offsets: Any) -> memoryview:
+    """
+    Returns a view of an Arrow-style offsets buffer (e.g. an array.array or NumPy array) as native 32 or 64 bit signed integers.
+
+    :param offsets: An object supporting the buffer protocol which contains 32 or 64 bit signed integers in native byte order.
+    :return: A one-dimensional memoryview with the format "i" or "q".
+    :raises ValueError: If the buffer does not contain 32 or 64 bit signed integers in native byte order.
+    """
+    view = memoryview(offsets)
+    native_order = "<" if sys.byteorder == "little" else ">"
+    if (
+        view.ndim != 1
+        or view.itemsize not in (4, 8)
+        or view.format[-1:] not in ("i", "l", "q")
+        or view.format[:-1] not in ("", "@", "=", native_order)
+    ):
+        raise ValueError("The offsets must be 32 or 64 bit signed integers in native byte order")
+
+    return view.cast("B").cast("i" if view.itemsize == 4 else "q")
@@ -2,6 +2,7 @@ import enum
 import re
 import types
 from decimal import Decimal
+from functools import lru_cache
 from typing import NamedTuple, Optional
 
 
@@ -24,6 +25,15 @@ class WordType(enum.Enum):
     DECIMAL_SEPARATOR = 10  # "point"
 
 
+_LITERAL_TYPES = frozenset({WordType.LITERAL_INT, WordType.LITERAL_FLOAT})
+_NON_NUMERIC_TYPES = frozenset({WordType.OTHER, WordType.NEGATION, WordType.DECIMAL_SEPARATOR})
+_ZERO = Decimal(0)
+_ONE = Decimal(1)
+
+# Maximal number of distinct words whose classification is cached by word_class()
+WORD_CLASS_CACHE_SIZE = 65536
+
+
 class Token:
     # Static init code (only executed once and not for each token instance)
     UNITS = ("zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
@@ -100,64 +110,46 @@ class Token:
     numwords = types.MappingProxyType(_numwords_build)
     del _numwords_build
 
-    def __init__(self, word: str, glue: str) -> None:
+    # The (scale, value) pairs of the number words as Decimal objects so that they are only created once
+    _numword_decimals = types.MappingProxyType(
+        {word: (Decimal(entry.scale), Decimal(entry.value)) for word, entry in numwords.items()}
+    )
+
+    __slots__ = ("word_class", "glue", "start", "type")
+
+    def __init__(self, word: str, glue: str, start: int = 0, classification: Optional["WordClass"] = None) -> None:
         """
         Represents a word in the text with some additional knowledge about the word (e.g. information about its type).
 
+        The classification of the word is shared by all occurrences of the same word (see word_class()). Only the glue, the offset and the type (which may change depending on the context, e.g. for conjunctions) belong to the occurrence.
+
         :param word: The string representation in the text.
         :param glue: The glue (e.g. whitespace) which follows the word.
+        :param start: The offset of the word in the original text.
+        :param classification: The classification of the word if it is already known (e.g. from other_word_class()). By default, the word is classified with word_class().
         """
-        self.word_raw = word
+        self.word_class = word_class(word) if classification is None else classification
         self.glue = glue
+        self.start = start
+        self.type = self.word_class.type
 
-        # Basic preprocessing of the word to find the type
-        self._word = word.lower().replace(",", "")
+    @property
+    def word_raw(self) -> str:
+        return self.word_class.word_raw
 
-        # Try to match ordinal numbers and then treat them as cardinal ones
-        self.ordinal_ending = (
-            None  # We need to keep a reference to the original ending in case the user wants to preserve it
-        )
-        if self._word in Token.ORDINAL_WORDS:
-            self.ordinal_ending = self._word[-2:]
-            self._word = Token.ORDINAL_WORDS[self._word]
+    @property
+    def _word(self) -> str:
+        return self.word_class.word
 
-        for ending, replacement in Token.ORDINAL_ENDINGS:
-            if self._word.endswith(ending):
-                replaced = self._word[: -len(ending)] + replacement
-                if replaced in Token.numwords:
-                    self.ordinal_ending = self._word[-2:]
-                    self._word = replaced
-                    break
-
-        # Assign a type to each token (from specific to general)
-        if self._word == "oh":
-            self.type = WordType.UNITS
-        elif self._word in Token.UNITS:
-            self.type = WordType.UNITS
-        elif self._word in Token.TEENS:
-            self.type = WordType.TEENS
-        elif self._word in Token.TENS:
-            self.type = WordType.TENS
-        elif self._word in Token.SCALES or self._word in Token.INDIAN_SCALES:
-            self.type = WordType.SCALES
-        elif self._word in Token.CONJUNCTION:
-            self.type = WordType.CONJUNCTION
-        elif self._word in Token.NEGATION_WORDS:
-            self.type = WordType.NEGATION
-        elif self._word in Token.DECIMAL_SEPARATOR_WORDS:
-            self.type = WordType.DECIMAL_SEPARATOR
-        elif re.fullmatch(r"\d+\.\d*|\d*\.\d+", self._word):
-            self.type = WordType.LITERAL_FLOAT
-        elif re.fullmatch(r"\d+", self._word):
-            self.type = WordType.LITERAL_INT
-        else:
-            self.type = WordType.OTHER
+    @property
+    def ordinal_ending(self) -> Optional[str]:
+        return self.word_class.ordinal_ending
 
     def __repr__(self) -> str:
         return f"{self._word} ({self.type})"
 
     def is_ordinal(self) -> bool:
-        return self.ordinal_ending is not None
+        return self.word_class.ordinal_ending is not None
 
     def has_large_scale(self) -> bool:
         """
@@ -165,8 +157,8 @@ class Token:
         """
         if self.type == WordType.SCALES:
             return True
-        elif self.type in [WordType.LITERAL_INT, WordType.LITERAL_FLOAT]:
-            return Decimal(self._word) in self.SCALE_VALUES
+        elif self.type in _LITERAL_TYPES:
+            return self.word_class.large_scale
         else:
             return False
 
@@ -174,26 +166,18 @@ class Token:
         """
         Returns the value of a token (e.g. twelve -> 12). SCALES have a value of 0 since they are defined by their scale and not by their value, e.g. for two hundred we calculate 2 * 100 + 0.
         """
-        if self.type in [WordType.LITERAL_INT, WordType.LITERAL_FLOAT]:
-            if self.has_large_scale():
-                return Decimal(0)
-            else:
-                return Decimal(self._word)
-        elif self.type not in (WordType.OTHER, WordType.NEGATION, WordType.DECIMAL_SEPARATOR):
-            return Decimal(Token.numwords[self._word].value)
+        value = self.word_class.value
+        if value is not None and self.type not in _NON_NUMERIC_TYPES:
+            return value
         raise ValueError(f"Cannot compute value for token of type {self.type!r} (word={self.word_raw!r})")
 
     def scale(self) -> Decimal:
         """
         Returns the scale of a token (e.g. hundred -> 100).
         """
-        if self.type in [WordType.LITERAL_INT, WordType.LITERAL_FLOAT]:
-            if self.has_large_scale():
-                return Decimal(self._word)
-            else:
-                return Decimal(1)
-        elif self.type not in (WordType.OTHER, WordType.NEGATION, WordType.DECIMAL_SEPARATOR):
-            return Decimal(Token.numwords[self._word].scale)
+        scale = self.word_class.scale
+        if scale is not None and self.type not in _NON_NUMERIC_TYPES:
+            return scale
         raise ValueError(f"Cannot compute scale for token of type {self.type!r} (word={self.word_raw!r})")
 
     def text(self) -> str:
@@ -216,11 +200,123 @@ class Token:
             return str(self.value())
 
 
+class WordClass:
+    """
+    The classification of a distinct word (its normalized form, ordinal ending, type and numeric attributes). Instances are shared by all occurrences of the word and must not be modified.
+    """
+
+    __slots__ = ("word_raw", "word", "ordinal_ending", "type", "scale", "value", "large_scale")
+
+    def __init__(self, word: str) -> None:
+        """
+        :param word: The string representation in the text.
+        """
+        self.word_raw = word
+
+        # Basic preprocessing of the word to find the type
+        normalized = word.lower().replace(",", "")
+
+        # Try to match ordinal numbers and then treat them as cardinal ones
+        self.ordinal_ending: Optional[str] = (
+            None  # We need to keep a reference to the original ending in case the user wants to preserve it
+        )
+        if normalized in Token.ORDINAL_WORDS:
+            self.ordinal_ending = normalized[-2:]
+            normalized = Token.ORDINAL_WORDS[normalized]
+
+        for ending, replacement in Token.ORDINAL_ENDINGS:
+            if normalized.endswith(ending):
+                replaced = normalized[: -len(ending)] + replacement
+                if replaced in Token.numwords:
+                    self.ordinal_ending = normalized[-2:]
+                    normalized = replaced
+                    break
+
+        self.word = normalized
+
+        # Assign a type to each word (from specific to general)
+        if normalized == "oh":
+            self.type = WordType.UNITS
+        elif normalized in Token.UNITS:
+            self.type = WordType.UNITS
+        elif normalized in Token.TEENS:
+            self.type = WordType.TEENS
+        elif normalized in Token.TENS:
+            self.type = WordType.TENS
+        elif normalized in Token.SCALES or normalized in Token.INDIAN_SCALES:
+            self.type = WordType.SCALES
+        elif normalized in Token.CONJUNCTION:
+            self.type = WordType.CONJUNCTION
+        elif normalized in Token.NEGATION_WORDS:
+            self.type = WordType.NEGATION
+        elif normalized in Token.DECIMAL_SEPARATOR_WORDS:
+            self.type = WordType.DECIMAL_SEPARATOR
+        elif re.fullmatch(r"\d+\.\d*|\d*\.\d+", normalized):
+            self.type = WordType.LITERAL_FLOAT
+        elif re.fullmatch(r"\d+", normalized):
+            self.type = WordType.LITERAL_INT
+        else:
+            self.type = WordType.OTHER
+
+        # The numeric attributes belong to the assigned type. A token may still change its type to WordType.OTHER later on (e.g. for conjunctions), so the token accessors check the current type first
+        self.scale: Optional[Decimal] = None
+        self.value: Optional[Decimal] = None
+        self.large_scale = False
+        if self.type in _LITERAL_TYPES:
+            literal = Decimal(normalized)
+            self.large_scale = literal in Token.SCALE_VALUES
+            self.scale = literal if self.large_scale else _ONE
+            self.value = _ZERO if self.large_scale else literal
+        elif self.type not in _NON_NUMERIC_TYPES:
+            self.scale, self.value = Token._numword_decimals[normalized]
+
+    def __repr__(self) -> str:
+        return f"{self.word} ({self.type})"
+
+
+@lru_cache(maxsize=WORD_CLASS_CACHE_SIZE)
+def word_class(word: str) -> WordClass:
+    """
+    Returns the classification of the word. The classifications of the most recently used words are cached, so repeated words share the same (immutable) WordClass instance.
+    """
+    return WordClass(word)
+
+
+class OtherWordClass(WordClass):
+    """
+    The classification of a word which is known not to be number-related (e.g. the words of the kind other of vocabulary.scan()). It is created without the normalization and the type checks of WordClass.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, word: str) -> None:
+        """
+        :param word: The string representation in the text.
+        """
+        self.word_raw = word
+        self.word = word.lower()
+        self.ordinal_ending = None
+        self.type = WordType.OTHER
+        self.scale = None
+        self.value = None
+        self.large_scale = False
+
+
+@lru_cache(maxsize=WORD_CLASS_CACHE_SIZE)
+def other_word_class(word: str) -> WordClass:
+    """
+    Returns the classification of a word which is known to be of type WordType.OTHER. The cache is separate from the one of word_class(), so that the many distinct other words of a text do not evict the number words.
+    """
+    return OtherWordClass(word)
+
+
 class NoneToken:
     """
-    Special token type which serves as a mock-up for a word which does not exist in the input.
+    Special token type which serves as a mock-up for a word which does not exist in the input. It holds no state of its own, so the shared NONE_TOKEN instance can be used instead of creating new ones.
     """
 
+    __slots__ = ("type",)
+
     def __init__(self) -> None:
         self.type: Optional[WordType] = None
 
@@ -229,3 +325,6 @@ class NoneToken:
 
     def has_large_scale(self) -> bool:
         return False
+
+
+NONE_TOKEN = NoneToken()
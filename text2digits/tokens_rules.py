@@ -1,33 +1,47 @@
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
 from text2digits.tokens_basic import Token, WordType
 
 
 class RuleToken(ABC):
+    __slots__ = ("original_tokens", "ordinal_ending", "_ordinal", "_word_raw")
+
     def __init__(self, original_tokens: List[Token]):
         """
         Base class for tokens which are used during rule processing.
 
+        A rule token is created for every match of a rule but the representation of the original words (word_raw) is only needed for the few tokens which are emitted verbatim (e.g. unconverted ordinals). Hence, it is built on first access.
+
         :param original_tokens: List of tokens which are combined by the rule.
         """
         super().__init__()
         self.original_tokens = original_tokens
 
         # The last token determines the ordinal ending, e.g. thirty-second --> nd
-        self.ordinal_ending = self.original_tokens[-1].ordinal_ending
+        self.ordinal_ending = original_tokens[-1].ordinal_ending
+        self._ordinal = any(token.is_ordinal() for token in original_tokens)
+        self._word_raw: Optional[str] = None
 
-        # Build a representation of the original word consisting of all tokens
-        self.word_raw = ""
-        for i, token in enumerate(self.original_tokens):
-            self.word_raw += token.word_raw
-            if i < len(self.original_tokens) - 1:
+    @property
+    def word_raw(self) -> str:
+        """
+        Representation of the original word consisting of all tokens (e.g. two-hundred-thousandth).
+        """
+        if self._word_raw is None:
+            parts = []
+            for token in self.original_tokens:
+                parts.append(token.word_raw)
                 # The rule token is responsible for keeping the glue between the individual tokens (e.g. the hyphens in "two-hundred-thousandth") but not the glue of the last token
-                self.word_raw += token.glue
+                parts.append(token.glue)
+            parts.pop()
+            self._word_raw = "".join(parts)
+
+        return self._word_raw
 
     def is_ordinal(self) -> bool:
-        return any([token.is_ordinal() for token in self.original_tokens])
+        return self._ordinal
 
     @abstractmethod
     def text(self) -> str:
@@ -39,6 +53,8 @@ class CombinedToken(RuleToken):
     Special token type which is used by the CombinationRule.
     """
 
+    __slots__ = ("_value", "glue", "type")
+
     def __init__(self, original_tokens: List[Token], value: Decimal, glue: str):
         super().__init__(original_tokens)
         self._value = value
@@ -68,6 +84,8 @@ class ConcatenatedToken(RuleToken):
     Special token type which is used by the ConcatenationRule.
     """
 
+    __slots__ = ("_text", "glue", "type")
+
     def __init__(self, original_tokens: List[Token], text: str, glue: str):
         super().__init__(original_tokens)
         self._text = text
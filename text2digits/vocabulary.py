@@ -0,0 +1,187 @@
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+from text2digits.text_processing_helpers import BigramIndex
+from text2digits.tokens_basic import Token, WordType, word_class
+
+# Maximal number of spelling corrections which are cached by similar_number_word()
+SPELLING_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=None)
+def number_words(excluded_types: FrozenSet[WordType] = frozenset()) -> FrozenSet[str]:
+    """
+    Returns all words without digits which Token does not classify as WordType.OTHER (in lowercase and without thousand separators), i.e. the number words, conjunctions, negation and decimal words as well as all their ordinal forms (e.g. first, twentieth, hundredth).
+
+    :param excluded_types: Leaves out the words which are classified as one of these types (e.g. the negation words of converters which treat them as other words).
+    """
+    words = set(Token.numwords) | Token.NEGATION_WORDS | Token.DECIMAL_SEPARATOR_WORDS | set(Token.ORDINAL_WORDS)
+
+    # Ordinal endings are stripped from the word and the result is looked up in the number words (e.g. twentieth --> twenty)
+    for ending, replacement in Token.ORDINAL_ENDINGS:
+        for word in Token.numwords:
+            if word.endswith(replacement):
+                words.add(word[: len(word) - len(replacement)] + ending)
+
+    return frozenset(word for word in words if word_class(word).type not in excluded_types)
+
+
+@lru_cache(maxsize=None)
+def number_words_bytes(excluded_types: FrozenSet[WordType] = frozenset()) -> FrozenSet[bytes]:
+    """
+    Returns the words of number_words() encoded as ASCII.
+    """
+    return frozenset(word.encode("ascii") for word in number_words(excluded_types))
+
+
+def _candidate_words() -> List[str]:
+    """
+    Returns the number words (except for conjunctions) which do not contain another one of these words. Every text which contains a number word also contains one of these words.
+
+    Conjunctions are left out since they only stay conjunctions if they are followed by a number (otherwise, they become WordType.OTHER).
+    """
+    words = number_words() - Token.CONJUNCTION
+    return sorted(word for word in words if not any(other != word and other in word for other in words))
+
+
+def _trie_pattern(words: Iterable[str], shortest: bool = True, thousand_separators: bool = True) -> str:
+    """
+    Returns a regular expression which matches any of the words and allows thousand separators between the ASCII letters of a word. Common prefixes are factored out so that the regex engine tries only one branch per character.
+
+    :param words: The words to match.
+    :param shortest: Whether it is enough to match the shortest word of words which start with another word (e.g. six instead of sixty). Otherwise, the longer words are optional continuations of the shorter ones.
+    :param thousand_separators: Whether thousand separators are allowed between the letters of a word.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        alternatives = []
+        for char, child in sorted(node.items()):
+            if not char:
+                continue
+
+            alternative = re.escape(char)
+            if len(child) > 1 or "" not in child:
+                if "" not in child or not shortest:
+                    separator = ",*" if thousand_separators and char.isascii() and char.isalpha() else ""
+                    rest = separator + build(child)
+                    alternative += "(?:" + rest + ")?" if "" in child else rest
+            alternatives.append(alternative)
+
+        return alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+
+    return build(trie)
+
+
+@lru_cache(maxsize=None)
+def candidate_pattern(ignore_case: bool = True, excluded_types: FrozenSet[WordType] = frozenset()) -> Pattern[str]:
+    """
+    Returns a pattern which matches somewhere in all texts which may contain a number, i.e. a number word other than a conjunction (with optional thousand separators between its letters) which is not part of a longer word or a digit. Texts without a match are not changed by the conversion (without spelling correction). The pattern may also match texts without any number (e.g. the words oh or second), so it can only be used to skip texts.
+
+    :param ignore_case: Whether the pattern ignores the case. Otherwise, it only matches lowercase texts, which is faster for texts that can be lowercased without changing the positions of the characters (e.g. ASCII texts).
+    :param excluded_types: Leaves out the words which are classified as one of these types (see number_words()).
+    """
+    # Conjunctions only stay conjunctions if they are followed by a number (otherwise, they become WordType.OTHER)
+    words = _trie_pattern(number_words(excluded_types) - Token.CONJUNCTION, shortest=False)
+
+    # A number word is a whole token, i.e. it is delimited by whitespace, punctuation or the ends of the text
+    return re.compile(r"(?<![a-z0-9])" + words + r"(?![a-z0-9])|\d", re.IGNORECASE if ignore_case else 0)
+
+
+@lru_cache(maxsize=None)
+def candidate_pattern_bytes() -> Pattern[bytes]:
+    """
+    Byte counterpart of candidate_pattern() for ASCII-lowercased UTF-8 encoded texts. It also matches non-ASCII digits and the Kelvin sign (which is lowercased to k).
+    """
+    words = [word.encode("ascii") for word in _candidate_words()]
+    words.extend(str(digit).encode("ascii") for digit in range(10))
+    words.append("\u212a".encode("utf-8"))
+    words.extend(
+        chr(code_point).encode("utf-8") for code_point in range(0x80, sys.maxunicode + 1) if chr(code_point).isdecimal()
+    )
+
+    # Latin-1 maps each byte to the character with the same code point, so the trie is built over the bytes
+    return re.compile(_trie_pattern(word.decode("latin-1") for word in words).encode("latin-1"))
+
+
+# The kinds of words reported by scan() (in the order of the alternatives of the scanner pattern)
+SCAN_KINDS = ("number", "literal", "other", "word")
+
+
+@lru_cache(maxsize=None)
+def scanner_pattern() -> Pattern[str]:
+    """
+    Returns the pattern behind scan(). Each match is one word (in exactly one of the groups named after SCAN_KINDS) and its glue (the group glue), like split_glues() with the default separator. A final empty match marks the end of the text.
+    """
+    # Punctuation is a separator between two non-digits. At the start of a word, it is always part of the word (see split_glues())
+    punctuation = r"[.,;:\-_]"
+    word_end = r"(?=\s|(?<=\D)" + punctuation + r"(?!\d)|\Z)"
+    # A comma between two letters is always a separator
+    numbers = _trie_pattern(number_words(), shortest=False, thousand_separators=False)
+    # Printable ASCII characters except for digits and separators. Words of these characters are never part of a number unless they are number words, which are matched by the first alternative
+    other = r"[A-Za-z!\"#$%&'()*+/<=>?@\[\\\]^`{|}~]+"
+    word = punctuation + r"?[^\s.,;:\-_]*(?:(?:(?<=\d)" + punctuation + "|" + punctuation + r"(?=\d))[^\s.,;:\-_]*)*"
+
+    return re.compile(
+        rf"(?:(?P<number>(?i:{numbers})){word_end}"
+        rf"|(?P<literal>\d+(?:\.\d*)?|\.\d+){word_end}"
+        rf"|(?P<other>{other}){word_end}"
+        rf"|(?P<word>{word}))"
+        rf"(?P<glue>\s+|{punctuation}|)"
+    )
+
+
+def scan(text: str) -> Iterator[Tuple[str, str, str]]:
+    """
+    Splits a string into words and their glue (like split_glues() with the default separator) and sorts the words into kinds with a single regex pass:
+
+    - number: the number words and their ordinal forms, conjunctions, negation and decimal words (in any case, e.g. Twentieth).
+    - literal: integers and floats (e.g. 42 or 2.5).
+    - other: words of ASCII letters and symbols which are never part of a number (e.g. apples or don't).
+    - word: all remaining words (e.g. with thousand separators or non-ASCII letters).
+
+    Only the kind other is final. Words of the other kinds still need to be classified (see word_class()), e.g. 1,000 (with a thousand separator) or ſix (the case-insensitive pattern matches the long s as an s but the word is not a number word).
+
+    :param text: The string to be split.
+    :return: A generator yielding (kind, word, glue) tuples.
+    """
+    text_length = len(text)
+    for match in scanner_pattern().finditer(text):
+        if match.start() == text_length:
+            break
+        number, literal, other, word, glue = match.groups()
+        if other is not None:
+            yield "other", other, glue
+        elif number is not None:
+            yield "number", number, glue
+        elif literal is not None:
+            yield "literal", literal, glue
+        else:
+            yield "word", word, glue
+
+
+@lru_cache(maxsize=None)
+def _number_word_index() -> BigramIndex:
+    return BigramIndex(Token.numwords.keys())
+
+
+@lru_cache(maxsize=SPELLING_CACHE_SIZE)
+def similar_number_word(word: str, threshold: float) -> Optional[str]:
+    """
+    Returns the number word which is most similar to the word, i.e. the same as find_similar_word(word, Token.numwords.keys(), threshold). The results are cached since texts usually repeat many of their words.
+    """
+    return _number_word_index().find_similar_word(word, threshold)
+
+
+def similar_number_words(words: Iterable[str], threshold: float) -> Dict[str, Optional[str]]:
+    """
+    Returns similar_number_word() for each of the words. The words are scored all at once (see BigramIndex.find_similar_words()).
+    """
+    return _number_word_index().find_similar_words(words, threshold)
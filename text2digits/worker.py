@@ -0,0 +1,286 @@
+"""
+A long-lived conversion process which speaks a framed protocol on stdin/stdout, e.g. to embed text2digits as a sidecar of a JVM or Go service without paying the Python startup for every call.
+
+Usage::
+
+    python -m text2digits.serve --worker                    # newline-delimited JSON
+    python -m text2digits.serve --worker --framing binary   # 4-byte big-endian length prefix + JSON
+
+Every frame contains one JSON request and is answered by one JSON response (in the same order):
+
+- ``{"id": 1, "text": "twenty one"}`` → ``{"id": 1, "text": "21"}``
+- ``{"id": 2, "texts": ["one", "two"]}`` → ``{"id": 2, "texts": ["1", "2"]}``
+- ``{"id": 3, "text": "thirtyy", "options": {"similarity_threshold": 0.8}}`` → ``{"id": 3, "text": "30"}``
+- Invalid requests are answered with ``{"id": ..., "error": "..."}``.
+
+The options map to the Text2Digits constructor arguments and default to the ones given on the command line. Clients may pipeline any number of requests without waiting for the responses: the requests which are already available are grouped by their options and each group is converted with one call of Text2Digits.convert_batch() on a cached instance.
+"""
+
+import json
+import queue
+import threading
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from text2digits.text2digits import Text2Digits
+
+FRAMINGS = ("ndjson", "binary")
+
+# The options of a request, i.e. the constructor arguments which determine the result of a conversion
+OPTIONS = frozenset(Text2Digits()._config())
+
+# The number of cached Text2Digits instances (one per combination of options)
+INSTANCE_CACHE_SIZE = 64
+
+_LENGTH_PREFIX_SIZE = 4
+
+
+class ProtocolError(ValueError):
+    """
+    Raised when the input stream cannot be split into frames anymore (e.g. a truncated or oversized binary frame).
+    """
+
+
+def read_frames(stream: BinaryIO, framing: str = "ndjson", max_frame_size: int = 64 * 1024 * 1024) -> Iterator[bytes]:
+    """
+    Reads the frames of the input stream until the end of the stream.
+
+    :param stream: The binary input stream (e.g. sys.stdin.buffer).
+    :param framing: Either ndjson (one frame per line, empty lines are skipped) or binary (each frame is prefixed with its length as a 4-byte big-endian unsigned integer).
+    :param max_frame_size: The maximal size of a frame in bytes.
+    :return: The payloads of the frames.
+    """
+    if framing == "ndjson":
+        while True:
+            line = stream.readline(max_frame_size + 1)
+            if not line:
+                return
+            if len(line) > max_frame_size and not line.endswith(b"\n"):
+                raise ProtocolError(f"The frame is larger than {max_frame_size} bytes")
+
+            line = line.rstrip(b"\r\n")
+            if line.strip():
+                yield line
+    elif framing == "binary":
+        while True:
+            header = stream.read(_LENGTH_PREFIX_SIZE)
+            if not header:
+                return
+            if len(header) < _LENGTH_PREFIX_SIZE:
+                raise ProtocolError("The stream ended within a length prefix")
+
+            length = int.from_bytes(header, "big")
+            if length > max_frame_size:
+                raise ProtocolError(f"The frame is larger than {max_frame_size} bytes")
+
+            payload = stream.read(length)
+            if len(payload) < length:
+                raise ProtocolError("The stream ended within a frame")
+
+            yield payload
+    else:
+        raise ValueError(f"Unknown framing {framing!r} (available: {', '.join(FRAMINGS)})")
+
+
+def write_frame(stream: BinaryIO, payload: bytes, framing: str = "ndjson") -> None:
+    """
+    Writes one frame to the output stream (without flushing it).
+
+    :param stream: The binary output stream (e.g. sys.stdout.buffer).
+    :param payload: The content of the frame. With ndjson framing, it must not contain a newline.
+    :param framing: Either ndjson or binary (see read_frames()).
+    """
+    if framing == "ndjson":
+        stream.write(payload + b"\n")
+    elif framing == "binary":
+        stream.write(len(payload).to_bytes(_LENGTH_PREFIX_SIZE, "big") + payload)
+    else:
+        raise ValueError(f"Unknown framing {framing!r} (available: {', '.join(FRAMINGS)})")
+
+
+class _Request:
+    __slots__ = ("id", "texts", "single", "config", "error")
+
+    def __init__(self, id: Any = None) -> None:
+        self.id = id
+        self.texts: List[str] = []
+        self.single = True
+        self.config: Tuple[Tuple[str, Any], ...] = ()
+        self.error: Optional[str] = None
+
+
+class Worker:
+    """
+    Answers the requests of a framed input stream (see the module documentation for the protocol).
+
+    >>> import io
+    >>> output = io.BytesIO()
+    >>> Worker().run(io.BytesIO(b'{"id": 1, "text": "twenty one"}\\n'), output)
+    >>> output.getvalue()
+    b'{"id": 1, "text": "21"}\\n'
+    """
+
+    def __init__(
+        self,
+        framing: str = "ndjson",
+        defaults: Optional[Dict[str, Any]] = None,
+        max_batch_size: int = 256,
+        max_frame_size: int = 64 * 1024 * 1024,
+    ) -> None:
+        """
+        :param framing: Either ndjson (one JSON document per line) or binary (4-byte big-endian length prefix followed by the JSON document).
+        :param defaults: The options of requests which do not specify them (Text2Digits constructor arguments).
+        :param max_batch_size: The maximal number of pipelined requests which are answered together.
+        :param max_frame_size: The maximal size of a request frame in bytes.
+        """
+        if framing not in FRAMINGS:
+            raise ValueError(f"Unknown framing {framing!r} (available: {', '.join(FRAMINGS)})")
+        if max_batch_size < 1:
+            raise ValueError("The max_batch_size must be at least 1")
+
+        self.framing = framing
+        self.defaults = self._validate_options(defaults or {})
+        self.max_batch_size = max_batch_size
+        self.max_frame_size = max_frame_size
+
+        # Creating the default instance validates the defaults and warms up the lazily created vocabulary structures
+        _converter(tuple(sorted(self.defaults.items()))).convert("twenty one")
+
+    def run(self, stdin: BinaryIO, stdout: BinaryIO) -> None:
+        """
+        Answers all requests until the input stream ends.
+
+        A reader thread reads ahead so that all requests which were pipelined by the client are available when the previous group of requests is finished.
+
+        :param stdin: The binary input stream.
+        :param stdout: The binary output stream. It is flushed after each group of responses.
+        :raises ProtocolError: If the input stream cannot be split into frames. All requests before the broken frame are answered.
+        """
+        frames: queue.Queue[Union[bytes, ProtocolError, None]] = queue.Queue(maxsize=4 * self.max_batch_size)
+        reader = threading.Thread(target=self._read, args=(stdin, frames), name="text2digits-reader", daemon=True)
+        reader.start()
+
+        while True:
+            item = frames.get()
+            batch = []
+            while isinstance(item, bytes):
+                batch.append(item)
+                if len(batch) >= self.max_batch_size:
+                    break
+                try:
+                    item = frames.get_nowait()
+                except queue.Empty:
+                    break
+
+            for response in self.handle(batch):
+                write_frame(stdout, response, self.framing)
+            stdout.flush()
+
+            if isinstance(item, ProtocolError):
+                raise item
+            elif item is None:
+                return
+
+    def handle(self, frames: List[bytes]) -> List[bytes]:
+        """
+        Answers a list of request frames. Consecutive requests with the same options are converted with one convert_batch() call.
+
+        :param frames: The payloads of the request frames.
+        :return: The payloads of the response frames (in the same order).
+        """
+        requests = [self._parse(frame) for frame in frames]
+
+        start = 0
+        while start < len(requests):
+            if requests[start].error is not None:
+                start += 1
+                continue
+
+            config = requests[start].config
+            end = start + 1
+            while end < len(requests) and requests[end].error is None and requests[end].config == config:
+                end += 1
+
+            group = requests[start:end]
+            try:
+                results = _converter(config).convert_batch([text for request in group for text in request.texts])
+            except Exception as error:
+                for request in group:
+                    request.error = f"Conversion failed: {error}"
+            else:
+                offset = 0
+                for request in group:
+                    request.texts, offset = results[offset : offset + len(request.texts)], offset + len(request.texts)
+
+            start = end
+
+        return [self._response(request) for request in requests]
+
+    def _read(self, stdin: BinaryIO, frames: "queue.Queue[Union[bytes, ProtocolError, None]]") -> None:
+        try:
+            for frame in read_frames(stdin, self.framing, self.max_frame_size):
+                frames.put(frame)
+        except ProtocolError as error:
+            frames.put(error)
+        else:
+            frames.put(None)
+
+    def _parse(self, frame: bytes) -> _Request:
+        try:
+            content = json.loads(frame)
+        except ValueError as error:
+            request = _Request()
+            request.error = f"Invalid JSON: {error}"
+            return request
+
+        if not isinstance(content, dict):
+            request = _Request()
+            request.error = "The request must be a JSON object"
+            return request
+
+        request = _Request(content.get("id"))
+        try:
+            if isinstance(content.get("text"), str):
+                request.texts = [content["text"]]
+            elif isinstance(content.get("texts"), list) and all(isinstance(text, str) for text in content["texts"]):
+                request.texts = content["texts"]
+                request.single = False
+            else:
+                raise ValueError('Expected a "text" string or a "texts" list of strings')
+
+            options = content.get("options", {})
+            if not isinstance(options, dict):
+                raise ValueError("The options must be a JSON object")
+
+            request.config = tuple(sorted({**self.defaults, **self._validate_options(options)}.items()))
+            # Creates (and caches) the instance, which validates the values of the options
+            _converter(request.config)
+        except (TypeError, ValueError) as error:
+            request.error = str(error)
+
+        return request
+
+    @staticmethod
+    def _validate_options(options: Dict[str, Any]) -> Dict[str, Any]:
+        unknown = set(options) - OPTIONS
+        if unknown:
+            raise ValueError(f"Unknown options: {', '.join(sorted(unknown))} (available: {', '.join(sorted(OPTIONS))})")
+
+        return options
+
+    @staticmethod
+    def _response(request: _Request) -> bytes:
+        response: Dict[str, Any] = {"id": request.id}
+        if request.error is not None:
+            response["error"] = request.error
+        elif request.single:
+            response["text"] = request.texts[0]
+        else:
+            response["texts"] = request.texts
+
+        return json.dumps(response).encode("utf-8")
+
+
+@lru_cache(maxsize=INSTANCE_CACHE_SIZE)
+def _converter(config: Tuple[Tuple[str, Any], ...]) -> Text2Digits:
+    return Text2Digits(**dict(config))